@@ -0,0 +1,137 @@
+"""
+Benchmark Event Loop Lag - SQLite direto no loop vs executor dedicado.
+
+Simula carga concorrente sobre um cache.db temporário:
+- N leitores fazendo cache.get de odds (L1 desligado → sempre SQLite)
+- 1 tarefa de limpeza regravando e apagando fixtures:* (delete_by_prefix)
+
+e mede o lag do event loop com o EventLoopMonitor (mesma sonda de
+GET /metrics/event-loop) em dois modos:
+
+- sync: chamadas sqlite3 direto nas coroutines (comportamento anterior)
+- executor: métodos aget/adelete_by_prefix + run_in_db_executor
+
+Uso:
+    python scripts/benchmarks/bench_event_loop_lag.py
+    python scripts/benchmarks/bench_event_loop_lag.py --duration 10 --readers 50 --rows 20000
+    python scripts/benchmarks/bench_event_loop_lag.py --per-operation-connections
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from infrastructure.cache.sqlite_cache_manager import SQLiteCacheManager
+from infrastructure.database.executor import run_in_db_executor, shutdown_db_executor
+from infrastructure.monitoring.event_loop_monitor import EventLoopMonitor
+
+ODDS_KEYS = 500
+
+
+def refill_fixtures(cache: SQLiteCacheManager, rows: int, payload: str) -> None:
+    """Grava `rows` entradas fixtures:* (simula um preload)."""
+    expires_at = datetime.now() + timedelta(hours=1)
+    with cache.connection() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            ((f"fixtures:{i}", payload, expires_at) for i in range(rows))
+        )
+        conn.commit()
+
+
+async def run_mode(cache: SQLiteCacheManager, mode: str, args) -> dict:
+    """Executa a carga em um modo e retorna as métricas de lag + throughput."""
+    payload = json.dumps({"teams": ["Casa", "Fora"], "odds": [round(1.5 + i / 100, 2) for i in range(200)]})
+    monitor = EventLoopMonitor(interval_seconds=0.01, stall_threshold_ms=args.stall_ms)
+    rng = random.Random(42)
+    reads = 0
+    purges = 0
+    stop_at = time.perf_counter() + args.duration
+
+    async def reader():
+        nonlocal reads
+        while time.perf_counter() < stop_at:
+            key = f"odds:{rng.randrange(ODDS_KEYS)}"
+            if mode == "sync":
+                cache.get(key)
+            else:
+                await cache.aget(key)
+            reads += 1
+            await asyncio.sleep(0)
+
+    async def purger():
+        nonlocal purges
+        while time.perf_counter() < stop_at:
+            if mode == "sync":
+                refill_fixtures(cache, args.rows, payload)
+                cache.delete_by_prefix("fixtures:")
+            else:
+                await run_in_db_executor(refill_fixtures, cache, args.rows, payload)
+                await cache.adelete_by_prefix("fixtures:")
+            purges += 1
+            await asyncio.sleep(0.05)
+
+    monitor.start()
+    await asyncio.gather(purger(), *(reader() for _ in range(args.readers)))
+    await monitor.stop()
+
+    stats = monitor.get_stats()
+    return {
+        "p50_ms": stats["p50_ms"],
+        "p99_ms": stats["p99_ms"],
+        "max_ms": stats["max_ms"],
+        "stalls": stats["stalls"],
+        "reads_s": reads / args.duration,
+        "purges": purges,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de lag do event loop (SQLite sync vs executor)")
+    parser.add_argument("--duration", type=float, default=5.0, help="Segundos de carga por modo")
+    parser.add_argument("--readers", type=int, default=20, help="Leitores concorrentes")
+    parser.add_argument("--rows", type=int, default=10_000, help="Entradas fixtures:* regravadas/apagadas por ciclo")
+    parser.add_argument("--stall-ms", type=float, default=50, help="Lag considerado travamento (ms)")
+    parser.add_argument("--per-operation-connections", action="store_true",
+                        help="Usa conexão por operação (sem WAL) em vez do modo pooled")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    print(f"{args.readers} leitores, {args.rows:,} fixtures por ciclo de limpeza, {args.duration:.0f}s por modo "
+          f"({'conexão por operação' if args.per_operation_connections else 'pooled/WAL'})")
+    print(f"{'modo':<9} | {'p50 (ms)':>8} | {'p99 (ms)':>8} | {'máx (ms)':>8} | {'travamentos':>11} | {'leituras/s':>10} | {'limpezas':>8}")
+    print("-" * 83)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("sync", "executor"):
+            cache = SQLiteCacheManager(
+                db_path=str(Path(tmp) / f"cache_{mode}.db"),
+                pooled=not args.per_operation_connections,
+                l1_max_entries=0
+            )
+            cache.init_tables()
+            for i in range(ODDS_KEYS):
+                cache.set(f"odds:{i}", {"bet365": {"home": 2.1}}, ttl_seconds=3600)
+
+            result = asyncio.run(run_mode(cache, mode, args))
+            cache.close()
+
+            print(f"{mode:<9} | {result['p50_ms']:>8.2f} | {result['p99_ms']:>8.2f} | {result['max_ms']:>8.2f} | "
+                  f"{result['stalls']:>11} | {result['reads_s']:>10,.0f} | {result['purges']:>8}")
+
+    shutdown_db_executor()
+
+
+if __name__ == "__main__":
+    main()
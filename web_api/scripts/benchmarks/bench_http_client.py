@@ -0,0 +1,153 @@
+"""
+Benchmark HTTP Client - Compara AsyncClient por chamada vs AsyncClient compartilhado.
+
+- Legado: 1 httpx.AsyncClient novo por request (TCP/TLS handshake a cada chamada)
+- Compartilhado: 1 AsyncClient com pool keep-alive (get_http_client)
+
+Executa N chamadas sequenciais de get_fixture_result contra um servidor
+stub local (sem consumir quota da API-Football) e mede latência média e p95.
+
+Uso:
+    python scripts/benchmarks/bench_http_client.py
+    python scripts/benchmarks/bench_http_client.py --calls 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+# Chave fictícia: o stub não valida autenticação
+os.environ.setdefault("API_FOOTBALL_KEY", "benchmark")
+# Mede só o transporte: sem espera do token bucket
+os.environ.setdefault("API_FOOTBALL_RATE_LIMIT_ENABLED", "False")
+
+import httpx
+
+from infrastructure.cache.sqlite_cache_manager import SQLiteCacheManager
+from infrastructure.external.api_football.client import (
+    APIFootballClient,
+    close_http_client,
+    open_http_client,
+)
+from infrastructure.external.api_football.service import APIFootballService
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Responde GET /fixtures?id=X como a API-Football (HTTP/1.1 keep-alive)."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        fixture_id = int(query.get("id", ["0"])[0])
+        body = json.dumps({
+            "response": [{
+                "fixture": {"id": fixture_id, "status": {"short": "FT"}},
+                "goals": {"home": 2, "away": 1},
+            }],
+            "paging": {"current": 1, "total": 1},
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LegacyAPIFootballClient(APIFootballClient):
+    """Comportamento anterior: abre e fecha um AsyncClient a cada request."""
+
+    async def get(self, endpoint, params=None):
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{self.base_url}{endpoint}",
+                headers={"x-apisports-key": self.api_key},
+                params=params or {},
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return response.json()
+
+
+async def run_case(client: APIFootballClient, cache: SQLiteCacheManager, calls: int) -> list:
+    """Executa `calls` chamadas sequenciais e retorna as latências (ms)."""
+    service = APIFootballService(client=client, cache=cache)
+    latencies = []
+
+    for i in range(calls):
+        start = time.perf_counter()
+        await service.get_fixture_result(str(i))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+async def run(calls: int, base_url: str, cache: SQLiteCacheManager) -> dict:
+    results = {}
+
+    results["legado"] = await run_case(
+        LegacyAPIFootballClient(api_key="benchmark", base_url=base_url), cache, calls
+    )
+
+    await open_http_client()
+    try:
+        results["pool"] = await run_case(
+            APIFootballClient(api_key="benchmark", base_url=base_url), cache, calls
+        )
+    finally:
+        await close_http_client()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do cliente HTTP (por chamada vs compartilhado)")
+    parser.add_argument("--calls", type=int, default=200, help="Chamadas sequenciais por modo")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Silencia os logs do service durante a medição
+    import logging
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteCacheManager(db_path=str(Path(tmp) / "bench_http.db"))
+        cache.init_tables()
+        try:
+            results = asyncio.run(run(args.calls, base_url, cache))
+        finally:
+            cache.close()
+            server.shutdown()
+
+    print(f"{'modo':>7} | {'total (s)':>10} | {'média (ms)':>10} | {'p95 (ms)':>9}")
+    print("-" * 46)
+    for mode, latencies in results.items():
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(f"{mode:>7} | {sum(latencies) / 1000:>10.2f} | {statistics.mean(latencies):>10.2f} | {p95:>9.2f}")
+
+    speedup = statistics.mean(results["legado"]) / statistics.mean(results["pool"])
+    print(f"{'ganho':>7} | {speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
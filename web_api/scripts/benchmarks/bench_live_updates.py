@@ -0,0 +1,159 @@
+"""
+Benchmark Live Updates - Processa um poll de jogos ao vivo no cache de fixtures.
+
+Filtro (quais jogos ao vivo estão carregados):
+- Legado: decodifica todos os dias cacheados (get_day) e monta o set de IDs
+- Atual: filter_loaded (IN indexado pela chave primária, O(jogos ao vivo))
+
+Gravação:
+- 1 a 1: apply_live_updates com 1 fixture por chamada (comportamento anterior:
+  1 leitura + 1 gravação por jogo; no modo blob, 1 regravação do dia por jogo)
+- Lote: apply_live_updates com o poll inteiro (1 transação / 1 regravação por dia)
+
+Cada dia cacheado tem --fixtures-per-day fixtures e --live jogos ao vivo
+espalhados em --days dias. Mede o tempo médio de aplicar 1 poll (todos os
+jogos com placar novo) em cada modo de armazenamento.
+
+Uso:
+    python scripts/benchmarks/bench_live_updates.py
+    python scripts/benchmarks/bench_live_updates.py --live 80 --fixtures-per-day 600 --polls 20
+    python scripts/benchmarks/bench_live_updates.py --days 15
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from infrastructure.cache.fixture_store import FixtureStore, STORAGE_BLOB, STORAGE_NORMALIZED
+from infrastructure.cache.sqlite_cache_manager import SQLiteCacheManager
+
+
+def make_day(day: date, count: int, first_id: int) -> list:
+    """Gera os fixtures de um dia (formato parseado do FixtureStore)."""
+    kickoff = datetime.combine(day, datetime.min.time()).astimezone()
+    return [
+        {
+            "id": str(first_id + i),
+            "date": (kickoff + timedelta(minutes=15 * (i % 48))).isoformat(),
+            "league": {"id": 39 + i % 20, "name": "Liga", "season": day.year},
+            "home_team": {"id": 1, "name": "Casa"},
+            "away_team": {"id": 2, "name": "Fora"},
+            "status": "Not Started",
+            "status_short": "NS",
+            "elapsed": None,
+            "goals": {"home": None, "away": None},
+        }
+        for i in range(count)
+    ]
+
+
+def make_poll(live_ids: list, minute: int) -> dict:
+    """Gera um poll em que todos os jogos ao vivo mudaram de minuto."""
+    return {
+        fixture_id: {
+            "id": fixture_id,
+            "status": "Second Half",
+            "status_short": "2H",
+            "elapsed": minute,
+            "goals": {"home": minute % 3, "away": minute % 2},
+        }
+        for fixture_id in live_ids
+    }
+
+
+def run(storage: str, batched: bool, args, work_dir: Path) -> float:
+    """Retorna o tempo médio (s) para aplicar 1 poll."""
+    cache = SQLiteCacheManager(db_path=str(work_dir / f"{storage}_{batched}.db"), l1_max_entries=0)
+    cache.init_tables()
+    store = FixtureStore(cache, storage=storage)
+
+    rng = random.Random(42)
+    all_ids = []
+    for offset in range(args.days):
+        fixtures = make_day(date.today() + timedelta(days=offset), args.fixtures_per_day, offset * 100_000)
+        store.save_day((date.today() + timedelta(days=offset)).isoformat(), fixtures)
+        all_ids.extend(f["id"] for f in fixtures)
+    live_ids = rng.sample(all_ids, args.live)
+
+    start = time.perf_counter()
+    for minute in range(1, args.polls + 1):
+        poll = make_poll(live_ids, minute)
+        if batched:
+            store.apply_live_updates(poll)
+        else:
+            for fixture_id, live_data in poll.items():
+                store.apply_live_updates({fixture_id: live_data})
+    elapsed = (time.perf_counter() - start) / args.polls
+
+    cache.close()
+    return elapsed
+
+
+def run_filter(storage: str, args, work_dir: Path) -> tuple:
+    """Retorna o tempo médio (s) do filtro legado e do filter_loaded."""
+    cache = SQLiteCacheManager(db_path=str(work_dir / f"{storage}_filter.db"), l1_max_entries=0)
+    cache.init_tables()
+    store = FixtureStore(cache, storage=storage)
+
+    dates = [(date.today() + timedelta(days=offset)).isoformat() for offset in range(args.days)]
+    for offset, date_str in enumerate(dates):
+        store.save_day(date_str, make_day(date.fromisoformat(date_str), args.fixtures_per_day, offset * 100_000))
+    # Metade dos jogos ao vivo da API não está carregada
+    live_ids = [str(offset * 100_000 + i) for offset in range(args.days) for i in range(args.live // (2 * args.days))]
+    live_ids += [str(9_000_000 + i) for i in range(args.live - len(live_ids))]
+
+    def legacy():
+        loaded = set()
+        for date_str in dates:
+            loaded.update(str(f.get("id")) for f in store.get_day(date_str) or [])
+        return {fixture_id for fixture_id in live_ids if fixture_id in loaded}
+
+    timings = []
+    for fn in (legacy, lambda: store.filter_loaded(live_ids)):
+        start = time.perf_counter()
+        for _ in range(args.polls):
+            found = fn()
+        timings.append((time.perf_counter() - start) / args.polls)
+        assert len(found) == args.live // (2 * args.days) * args.days
+
+    cache.close()
+    return tuple(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de updates ao vivo no cache (filtro e gravação)")
+    parser.add_argument("--live", type=int, default=80, help="Jogos ao vivo por poll")
+    parser.add_argument("--days", type=int, default=3, help="Dias cacheados com jogos ao vivo")
+    parser.add_argument("--fixtures-per-day", type=int, default=400, help="Fixtures por dia")
+    parser.add_argument("--polls", type=int, default=10, help="Polls por cenário")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{args.live} jogos ao vivo em {args.days} dias × {args.fixtures_per_day} fixtures")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"\nFiltro\n{'modo':<11} | {'legado (ms/poll)':>16} | {'filter_loaded (ms/poll)':>23} | {'ganho':>6}")
+        print("-" * 66)
+        for storage in (STORAGE_NORMALIZED, STORAGE_BLOB):
+            legacy, indexed = run_filter(storage, args, Path(tmp))
+            print(f"{storage:<11} | {legacy * 1000:>16.2f} | {indexed * 1000:>23.2f} | {legacy / indexed:>5.1f}x")
+
+        print(f"\nGravação\n{'modo':<11} | {'1 a 1 (ms/poll)':>15} | {'lote (ms/poll)':>14} | {'ganho':>6}")
+        print("-" * 56)
+        for storage in (STORAGE_NORMALIZED, STORAGE_BLOB):
+            single = run(storage, False, args, Path(tmp))
+            batched = run(storage, True, args, Path(tmp))
+            print(f"{storage:<11} | {single * 1000:>15.1f} | {batched * 1000:>14.1f} | {single / batched:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
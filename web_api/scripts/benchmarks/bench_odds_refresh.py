@@ -0,0 +1,108 @@
+"""
+Benchmark Odds Refresh - Gravação de um refresh de odds bulk no cache.
+
+- Legado: cache.set da chave bulk + cache.set de odds:{fixture_id} para cada
+  fixture (1 commit por chave, todas regravadas)
+- Delta: OddsStore.save_bulk (compara com o cache e regrava só os fixtures
+  alterados, 1 transação)
+
+O cache já tem o download anterior; o refresh muda --changed % dos fixtures.
+Mede o tempo médio de gravar 1 refresh e quantos fixtures foram regravados.
+
+Uso:
+    python scripts/benchmarks/bench_odds_refresh.py
+    python scripts/benchmarks/bench_odds_refresh.py --fixtures 2000 --changed 5 --repeat 20
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from infrastructure.cache.odds_store import OddsStore
+from infrastructure.cache.sqlite_cache_manager import SQLiteCacheManager
+
+BULK_KEY = "odds_date:2026-02-27"
+TTL_SECONDS = 1800
+
+
+def make_odds(fixture_id: int, shift: float) -> dict:
+    """Gera as odds de um fixture (2 casas, 1X2 + gols)."""
+    base = 1.5 + (fixture_id % 50) / 25 + shift
+    return {
+        bookmaker: {
+            "home": round(base, 2), "draw": round(base + 1.2, 2), "away": round(base + 2.1, 2),
+            "over_2_5": round(base - 0.2, 2), "under_2_5": round(base + 0.3, 2),
+            "btts_yes": round(base - 0.1, 2), "btts_no": round(base + 0.4, 2),
+        }
+        for bookmaker in ("bet365", "betano")
+    }
+
+
+def legacy_save(cache: SQLiteCacheManager, odds_by_fixture: dict) -> int:
+    """Comportamento anterior (_cache_odds): regrava tudo, 1 commit por chave."""
+    cache.set(BULK_KEY, odds_by_fixture, ttl_seconds=TTL_SECONDS)
+    for fixture_id, odds in odds_by_fixture.items():
+        cache.set(f"odds:{fixture_id}", odds, ttl_seconds=TTL_SECONDS)
+    return len(odds_by_fixture)
+
+
+def run(mode: str, args, work_dir: Path) -> tuple:
+    """Retorna (tempo médio em s por refresh, fixtures regravados por refresh)."""
+    cache = SQLiteCacheManager(db_path=str(work_dir / f"{mode}.db"), l1_max_entries=0)
+    cache.init_tables()
+    store = OddsStore(cache)
+    rng = random.Random(42)
+
+    current = {str(i): make_odds(i, 0.0) for i in range(args.fixtures)}
+    store.save_bulk(BULK_KEY, current, ttl_seconds=TTL_SECONDS)
+
+    elapsed = 0.0
+    written = 0
+    for round_no in range(1, args.repeat + 1):
+        for fixture_id in rng.sample(list(current), args.fixtures * args.changed // 100):
+            current[fixture_id] = make_odds(int(fixture_id), round_no / 100)
+        refresh = {fixture_id: dict(odds) for fixture_id, odds in current.items()}
+
+        start = time.perf_counter()
+        if mode == "legado":
+            written += legacy_save(cache, refresh)
+        else:
+            written += store.save_bulk(BULK_KEY, refresh, ttl_seconds=TTL_SECONDS)
+        elapsed += time.perf_counter() - start
+
+    cache.close()
+    return elapsed / args.repeat, written / args.repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do refresh de odds (regravar tudo vs delta)")
+    parser.add_argument("--fixtures", type=int, default=1000, help="Fixtures com odds no bulk")
+    parser.add_argument("--changed", type=int, default=10, help="%% de fixtures com odds alteradas por refresh")
+    parser.add_argument("--repeat", type=int, default=10, help="Refreshes por modo")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    print(f"{args.fixtures:,} fixtures, {args.changed}% alterados por refresh")
+    print(f"{'modo':<7} | {'tempo (ms)':>10} | {'regravados':>10}")
+    print("-" * 34)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("legado", "delta"):
+            elapsed, written = run(mode, args, Path(tmp))
+            results[mode] = elapsed
+            print(f"{mode:<7} | {elapsed * 1000:>10.1f} | {written:>10,.0f}")
+
+    print(f"\nGanho: {results['legado'] / results['delta']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
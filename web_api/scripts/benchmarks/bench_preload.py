@@ -0,0 +1,196 @@
+"""
+Benchmark Preload - Carregamento de fixtures: datas em série vs em paralelo.
+
+- Legado: 1 GET /fixtures?date=D por vez, depois o coverage da season atual
+  e da anterior (também em série). A tela só renderizava no fim.
+- Paralelo: PreloadService.preload_fixtures (todas as datas + coverage ao
+  mesmo tempo, progresso por dia via on_progress)
+
+Executa contra um servidor stub local com latência artificial (sem consumir
+quota da API-Football), com cache vazio a cada modo. Mede o tempo total e o
+tempo até o primeiro dia estar disponível para a tela.
+
+Uso:
+    python scripts/benchmarks/bench_preload.py
+    python scripts/benchmarks/bench_preload.py --days 3 --latency 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+# Chave fictícia: o stub não valida autenticação
+os.environ.setdefault("API_FOOTBALL_KEY", "benchmark")
+# Mede só a ordem das chamadas: sem espera do token bucket
+os.environ.setdefault("API_FOOTBALL_RATE_LIMIT_ENABLED", "False")
+
+from application.services.preload_service import PreloadService
+from config.settings import settings
+from infrastructure.cache import sqlite_cache_manager
+from infrastructure.cache.sqlite_cache_manager import SQLiteCacheManager
+from infrastructure.external.api_football.client import (
+    APIFootballClient,
+    close_http_client,
+    open_http_client,
+)
+from infrastructure.external.api_football.service import APIFootballService
+
+LEAGUES = 40
+
+
+def make_handler(latency: float, fixtures_per_day: int):
+    """Cria o handler do stub: GET /fixtures?date=D e GET /leagues?season=Y."""
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+
+            if url.path.endswith("/leagues"):
+                season = int(query["season"][0])
+                response = [
+                    {
+                        "league": {"id": 100 + i, "name": f"Liga {i}", "type": "League"},
+                        "seasons": [{"year": season, "coverage": {"fixtures": {"statistics_fixtures": True}}}],
+                    }
+                    for i in range(LEAGUES)
+                ]
+            else:
+                day = datetime.fromisoformat(query["date"][0]).replace(hour=23, tzinfo=settings.tz)
+                base_id = int(day.strftime("%Y%m%d")) * 1000
+                response = [
+                    {
+                        "fixture": {
+                            "id": base_id + i,
+                            "timestamp": int(day.timestamp()),
+                            "status": {"long": "Not Started", "short": "NS", "elapsed": None},
+                        },
+                        "league": {"id": 100 + i % LEAGUES, "name": f"Liga {i % LEAGUES}", "country": "BR",
+                                   "season": day.year},
+                        "teams": {"home": {"id": 1, "name": "Casa"}, "away": {"id": 2, "name": "Fora"}},
+                        "goals": {"home": None, "away": None},
+                    }
+                    for i in range(fixtures_per_day)
+                ]
+
+            body = json.dumps({"response": response, "paging": {"current": 1, "total": 1}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return StubHandler
+
+
+class StubServer(ThreadingHTTPServer):
+    """Backlog maior: as datas chegam todas ao mesmo tempo (o padrão 5 descarta conexões)."""
+
+    request_queue_size = 64
+
+
+def make_service(base_url: str, db_path: str) -> PreloadService:
+    """Cria um PreloadService com cache vazio apontando para o stub."""
+    cache = SQLiteCacheManager(db_path=db_path)
+    cache.init_tables()
+    sqlite_cache_manager._cache_instance = cache
+
+    service = PreloadService()
+    service.api_service = APIFootballService(
+        client=APIFootballClient(api_key="benchmark", base_url=base_url), cache=cache
+    )
+    return service
+
+
+async def legacy_preload(service: PreloadService, days: int) -> float:
+    """Comportamento anterior: datas e coverage em série. Retorna o tempo do 1º dia (= total)."""
+    start = time.perf_counter()
+    for fetch_date in service._get_dates(days):
+        await service.api_service.get_all_fixtures_by_date(fetch_date)
+    season = settings.today().year
+    await service.api_service.get_leagues_coverage(season)
+    await service.api_service.get_leagues_coverage(season - 1)
+    # O POST /preload/fetch só respondia no fim
+    return time.perf_counter() - start
+
+
+async def parallel_preload(service: PreloadService, days: int) -> float:
+    """PreloadService.preload_fixtures. Retorna o tempo até o 1º dia com ligas."""
+    start = time.perf_counter()
+    first_day = []
+
+    def on_progress(event):
+        if not first_day and event["count"] and event.get("leagues"):
+            first_day.append(time.perf_counter() - start)
+
+    await service.preload_fixtures(days=days, on_progress=on_progress)
+    return first_day[0] if first_day else time.perf_counter() - start
+
+
+async def run(args, base_url: str, tmp: Path) -> dict:
+    results = {}
+    await open_http_client()
+    try:
+        for mode, fn in (("legado", legacy_preload), ("paralelo", parallel_preload)):
+            service = make_service(base_url, str(tmp / f"cache_{mode}.db"))
+            start = time.perf_counter()
+            first_day = await fn(service, args.days)
+            results[mode] = (first_day, time.perf_counter() - start)
+            service.cache.close()
+    finally:
+        await close_http_client()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do preload de fixtures (série vs paralelo)")
+    parser.add_argument("--days", type=int, default=7, choices=[1, 3, 7], help="Dias a carregar")
+    parser.add_argument("--latency", type=float, default=300, help="Latência do stub por request (ms)")
+    parser.add_argument("--fixtures-per-day", type=int, default=300, help="Fixtures por dia")
+    args = parser.parse_args()
+
+    server = StubServer(("127.0.0.1", 0), make_handler(args.latency / 1000, args.fixtures_per_day))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # Silencia os logs do service durante a medição
+    import logging
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            results = asyncio.run(run(args, base_url, Path(tmp)))
+        finally:
+            server.shutdown()
+
+    print(f"{args.days} dias + 2 seasons de coverage, latência {args.latency:.0f}ms por request")
+    print(f"{'modo':>8} | {'1º dia (s)':>10} | {'total (s)':>9}")
+    print("-" * 34)
+    for mode, (first_day, total) in results.items():
+        print(f"{mode:>8} | {first_day:>10.2f} | {total:>9.2f}")
+
+    print(f"{'ganho':>8} | {results['legado'][0] / results['paralelo'][0]:>9.1f}x | "
+          f"{results['legado'][1] / results['paralelo'][1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark Ticket Bulk - Compara criação 1 a 1 vs criação em lote.
+
+- Legado: TicketRepository.create por ticket (1 transação + 1 INSERT por bet)
+- Atual: TicketRepository.create_many (executemany + 1 transação, POST /tickets/bulk)
+
+Cada rodada cria --tickets tickets (padrão 1k, o máximo por chamada do endpoint)
+em um tickets.db temporário e mede o throughput (tickets/s).
+
+Uso:
+    python scripts/benchmarks/bench_ticket_bulk.py
+    python scripts/benchmarks/bench_ticket_bulk.py --tickets 1000 --bets-per-ticket 5 --repeat 5
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from domain.models.bet_model import Bet
+from domain.models.ticket_model import Ticket
+from domain.enums.market_type_enum import MarketType
+from domain.enums.ticket_status_enum import TicketStatus
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.ticket_repository import TicketRepository
+
+MARKETS = [(MarketType.MATCH_WINNER, "HOME"), (MarketType.OVER_UNDER, "OVER"), (MarketType.BOTH_TEAMS_SCORE, "YES")]
+
+
+def make_tickets(count: int, bets_per_ticket: int, rng: random.Random) -> list:
+    """Gera tickets sintéticos (como os pré-bilhetes de create_pre_ticket)."""
+    tickets = []
+    for i in range(count):
+        bets = []
+        for _ in range(bets_per_ticket):
+            market, outcome = rng.choice(MARKETS)
+            bets.append(Bet(
+                match_id=str(100000 + rng.randrange(5000)), home_team="Casa", away_team="Fora",
+                league="Liga", market=market, predicted_outcome=outcome,
+                odds=round(rng.uniform(1.2, 3.5), 2), confidence=0.6
+            ))
+        tickets.append(Ticket(
+            id=str(uuid.uuid4()), name=f"Pré-bilhete {i}", bets=bets, stake=10.0,
+            bookmaker_id="bet365", status=TicketStatus.PENDING
+        ))
+    return tickets
+
+
+def run(tmp: str, name: str, fn, tickets: list) -> float:
+    """Cria os tickets em um banco novo e retorna o tempo (s)."""
+    db = DatabaseConnection(db_path=str(Path(tmp) / f"{name}_{uuid.uuid4().hex}.db"))
+    db.init_tables()
+    repo = TicketRepository(db=db)
+
+    start = time.perf_counter()
+    fn(repo, tickets)
+    elapsed = time.perf_counter() - start
+
+    assert repo.get_stats()["total_tickets"] == len(tickets)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de criação de tickets (1 a 1 vs lote)")
+    parser.add_argument("--tickets", type=int, default=1000, help="Tickets por chamada")
+    parser.add_argument("--bets-per-ticket", type=int, default=3, help="Apostas por ticket")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetições por cenário")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(42)
+
+    cases = {
+        "create (1 a 1)": lambda repo, tickets: [repo.create(t) for t in tickets],
+        "create_many (lote)": lambda repo, tickets: repo.create_many(tickets),
+    }
+
+    print(f"{args.tickets:,} tickets × {args.bets_per_ticket} apostas por chamada")
+    print(f"{'cenário':<20} | {'tempo (ms)':>10} | {'tickets/s':>10}")
+    print("-" * 47)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for name, fn in cases.items():
+            times = [
+                run(tmp, name.split()[0], fn, make_tickets(args.tickets, args.bets_per_ticket, rng))
+                for _ in range(args.repeat)
+            ]
+            results[name] = sum(times) / len(times)
+            print(f"{name:<20} | {results[name] * 1000:>10.1f} | {args.tickets / results[name]:>10,.0f}")
+
+    legacy, bulk = results.values()
+    print(f"\nGanho: {legacy / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark Ticket Repository - Compara leitura N+1 vs bets em lote.
+
+- Legado: 1 SELECT de bets por ticket (N+1 queries)
+- Atual: tickets + 1 SELECT ... WHERE ticket_id IN (...) (TicketRepository)
+
+Popula um tickets.db temporário com 10k tickets / 50k bets (padrão) e mede
+find_all (páginas de 100), find_pending e find_by_id: nº de queries e tempo médio.
+
+Uso:
+    python scripts/benchmarks/bench_ticket_repository.py
+    python scripts/benchmarks/bench_ticket_repository.py --tickets 20000 --bets-per-ticket 5
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from domain.models.bet_model import Bet
+from domain.models.ticket_model import Ticket
+from domain.enums.ticket_status_enum import TicketStatus
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.ticket_repository import TicketRepository, _parse_market
+
+MARKETS = [("MATCH_WINNER", "HOME"), ("OVER_UNDER", "OVER"), ("BTTS", "YES")]
+STATUSES = ["PENDING", "WON", "LOST"]
+
+
+def populate(db: DatabaseConnection, tickets: int, bets_per_ticket: int) -> None:
+    """Insere tickets e bets sintéticos direto no SQLite."""
+    rng = random.Random(42)
+    base = datetime(2025, 1, 1)
+
+    ticket_rows = []
+    bet_rows = []
+    for i in range(tickets):
+        ticket_id = f"T{i:08d}"
+        created_at = (base + timedelta(minutes=i)).isoformat()
+        ticket_rows.append((ticket_id, f"Bilhete {i}", 10.0, "bet365", rng.choice(STATUSES), created_at))
+        for j in range(bets_per_ticket):
+            market, outcome = rng.choice(MARKETS)
+            bet_rows.append((
+                ticket_id, str(100000 + rng.randrange(5000)), "Casa", "Fora", "Liga",
+                market, outcome, round(rng.uniform(1.2, 3.5), 2), 0.6, None, None
+            ))
+
+    conn = db.get_connection()
+    conn.executemany("""
+        INSERT INTO tickets (id, name, stake, bookmaker_id, status, created_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, ticket_rows)
+    conn.executemany("""
+        INSERT INTO bets (ticket_id, match_id, home_team, away_team, league,
+                          market, predicted_outcome, odds, confidence, result, final_score)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, bet_rows)
+    conn.commit()
+    conn.close()
+
+
+def legacy_find(db: DatabaseConnection, where: str = "", params: tuple = (), suffix: str = "") -> list:
+    """Reproduz a leitura anterior: 1 query de bets por ticket."""
+    conn = db.get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT id, name, stake, bookmaker_id, status, created_at
+            FROM tickets {f"WHERE {where}" if where else ""}
+            ORDER BY created_at DESC {suffix}
+        """, params)
+
+        tickets = []
+        for row in cursor.fetchall():
+            cursor.execute("""
+                SELECT match_id, home_team, away_team, league, market, predicted_outcome,
+                       odds, confidence, result, final_score, status, status_short,
+                       elapsed, goals_home, goals_away
+                FROM bets
+                WHERE ticket_id = ?
+            """, (row['id'],))
+
+            bets = [
+                Bet(
+                    match_id=b['match_id'], home_team=b['home_team'], away_team=b['away_team'],
+                    league=b['league'], market=_parse_market(b['market']),
+                    predicted_outcome=b['predicted_outcome'], odds=b['odds'],
+                    confidence=b['confidence'], result=b['result'], final_score=b['final_score'],
+                    status=b['status'], status_short=b['status_short'], elapsed=b['elapsed'],
+                    goals_home=b['goals_home'], goals_away=b['goals_away'],
+                )
+                for b in cursor.fetchall()
+            ]
+            tickets.append(Ticket(
+                id=row['id'], name=row['name'], stake=row['stake'],
+                bookmaker_id=row['bookmaker_id'], status=TicketStatus(row['status']),
+                bets=bets, created_at=datetime.fromisoformat(row['created_at'])
+            ))
+        return tickets
+    finally:
+        conn.close()
+
+
+def count_queries(db: DatabaseConnection, fn) -> int:
+    """Conta os SELECTs executados por fn() (via trace callback)."""
+    statements = []
+    original = db.get_connection
+
+    def traced_connection():
+        conn = original()
+        conn.set_trace_callback(lambda sql: statements.append(sql) if sql.lstrip().upper().startswith("SELECT") else None)
+        return conn
+
+    db.get_connection = traced_connection
+    try:
+        fn()
+    finally:
+        db.get_connection = original
+    return len(statements)
+
+
+def timed(fn, repeat: int) -> float:
+    """Tempo médio (ms) de `repeat` execuções."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do TicketRepository (N+1 vs lote)")
+    parser.add_argument("--tickets", type=int, default=10_000, help="Quantidade de tickets")
+    parser.add_argument("--bets-per-ticket", type=int, default=5, help="Apostas por ticket")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por cenário")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseConnection(db_path=str(Path(tmp) / "bench_tickets.db"))
+        db.init_tables()
+        populate(db, args.tickets, args.bets_per_ticket)
+        repo = TicketRepository(db=db)
+
+        pending = TicketStatus.PENDING.value
+        cases = {
+            "find_all (100, página 1)": (
+                lambda: legacy_find(db, suffix="LIMIT 100 OFFSET 0"),
+                lambda: repo.find_all(limit=100, offset=0),
+            ),
+            "find_all (100, página 50)": (
+                lambda: legacy_find(db, suffix="LIMIT 100 OFFSET 4900"),
+                lambda: repo.find_all(limit=100, offset=4900),
+            ),
+            "find_pending": (
+                lambda: legacy_find(db, "status = ?", (pending,)),
+                lambda: repo.find_pending(),
+            ),
+            "find_by_id": (
+                lambda: legacy_find(db, "id = ?", ("T00005000",)),
+                lambda: repo.find_by_id("T00005000"),
+            ),
+        }
+
+        # Sanidade: mesmas bets nas duas implementações
+        assert [t.bets for t in legacy_find(db, "status = ?", (pending,))] == [t.bets for t in repo.find_pending()]
+
+        print(f"{args.tickets:,} tickets / {args.tickets * args.bets_per_ticket:,} bets")
+        print(f"{'cenário':<26} | {'queries':>13} | {'legado (ms)':>11} | {'lote (ms)':>9} | {'ganho':>6}")
+        print("-" * 78)
+        for name, (legacy, batched) in cases.items():
+            queries = f"{count_queries(db, legacy)} → {count_queries(db, batched)}"
+            legacy_ms = timed(legacy, args.repeat)
+            batched_ms = timed(batched, args.repeat)
+            print(f"{name:<26} | {queries:>13} | {legacy_ms:>11.2f} | {batched_ms:>9.2f} | {legacy_ms / batched_ms:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark Ticket Settlement - Carga da liquidação: todos os pendentes vs agenda por kickoff.
+
+Cria --tickets tickets pendentes em um tickets.db temporário, com apostas em
+--matches partidas futuras, das quais --live já começaram. Mede o trabalho de
+banco de 1 liquidação (sem a API):
+
+- Legado: find_pending (todos os pendentes + bets) e as partidas distintas deles
+- Atual: find_due_match_ids + find_pending_by_match_ids (só partidas iniciadas)
+
+Antes de medir, confere que apostas com result 'PENDING' (gravado pela
+simulação) mantêm a partida na agenda, inclusive após a limpeza da agenda.
+
+Uso:
+    python scripts/benchmarks/bench_ticket_settlement.py
+    python scripts/benchmarks/bench_ticket_settlement.py --tickets 20000 --matches 2000 --live 10
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Adiciona src/ ao path para imports funcionarem
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from domain.models.bet_model import Bet
+from domain.models.ticket_model import Ticket
+from domain.enums.market_type_enum import MarketType
+from domain.enums.ticket_status_enum import TicketStatus
+from infrastructure.database.connection import DatabaseConnection
+from infrastructure.database.repositories.ticket_repository import TicketRepository
+
+
+def make_tickets(count: int, match_ids: list, bets_per_ticket: int, rng: random.Random) -> list:
+    """Gera tickets pendentes com apostas em partidas aleatórias."""
+    return [
+        Ticket(
+            id=str(uuid.uuid4()), name=f"Bilhete {i}", stake=10.0, bookmaker_id="bet365",
+            status=TicketStatus.PENDING,
+            bets=[
+                Bet(
+                    match_id=match_id, home_team="Casa", away_team="Fora", league="Liga",
+                    market=MarketType.MATCH_WINNER, predicted_outcome="HOME", odds=1.9, confidence=0.6
+                )
+                for match_id in rng.sample(match_ids, bets_per_ticket)
+            ]
+        )
+        for i in range(count)
+    ]
+
+
+def check_pending_results(db: DatabaseConnection, repo: TicketRepository, live_ids: list, now_ts: int) -> None:
+    """Garante que result 'PENDING' conta como pendente na agenda (como em Bet.is_pending)."""
+    conn = db.get_connection()
+    marked = {m for m in live_ids if conn.execute("UPDATE bets SET result = 'PENDING' WHERE match_id = ?", (m,)).rowcount}
+    conn.commit()
+    conn.close()
+
+    # Limpeza sem partidas finalizadas nem horários novos (como numa verificação sem resultados)
+    repo.update_fixture_schedule({}, [], now_ts)
+    due = set(repo.find_due_match_ids(now_ts))
+    missing = marked - due
+    assert not missing, f"partidas com apostas 'PENDING' fora da agenda: {sorted(missing)[:5]}"
+
+
+def timed(fn, repeat: int) -> tuple:
+    """Executa fn `repeat` vezes e retorna (tempo médio em s, último retorno)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da liquidação de tickets (pendentes vs agenda)")
+    parser.add_argument("--tickets", type=int, default=5000, help="Tickets pendentes")
+    parser.add_argument("--matches", type=int, default=500, help="Partidas distintas")
+    parser.add_argument("--live", type=int, default=5, help="Partidas já iniciadas")
+    parser.add_argument("--bets-per-ticket", type=int, default=3, help="Apostas por ticket")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por cenário")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(42)
+    now_ts = int(time.time())
+
+    match_ids = [str(100000 + i) for i in range(args.matches)]
+    # As --live primeiras já começaram; as demais começam em até 3 dias
+    kickoffs = {
+        match_id: now_ts - 1800 if i < args.live else now_ts + rng.randrange(3600, 3 * 86400)
+        for i, match_id in enumerate(match_ids)
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseConnection(db_path=str(Path(tmp) / "tickets.db"))
+        db.init_tables()
+        repo = TicketRepository(db=db)
+        repo.create_many(make_tickets(args.tickets, match_ids, args.bets_per_ticket, rng), kickoffs)
+        check_pending_results(db, repo, match_ids[:args.live], now_ts)
+
+        def legacy():
+            tickets = repo.find_pending()
+            return tickets, {bet.match_id for ticket in tickets for bet in ticket.bets}
+
+        def scheduled():
+            due = repo.find_due_match_ids(now_ts)
+            return repo.find_pending_by_match_ids(due), set(due)
+
+        print(f"{args.tickets:,} tickets pendentes, {args.matches:,} partidas ({args.live} iniciadas)")
+        print(f"{'cenário':<22} | {'tempo (ms)':>10} | {'tickets':>8} | {'partidas consultadas':>20}")
+        print("-" * 70)
+
+        results = {}
+        for name, fn in (("find_pending (legado)", legacy), ("agenda por kickoff", scheduled)):
+            elapsed, (tickets, matches) = timed(fn, args.repeat)
+            results[name] = elapsed
+            print(f"{name:<22} | {elapsed * 1000:>10.1f} | {len(tickets):>8,} | {len(matches):>20,}")
+
+    legacy_time, scheduled_time = results.values()
+    print(f"\nGanho: {legacy_time / scheduled_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,7 @@ def init_cache():
 
     - Cria pasta data/ se não existir
     - Cria arquivo cache.db se não existir
-    - Cria tabelas (cache) se não existirem
+    - Cria tabelas (cache, fixture_index, fixtures) se não existirem
     - Cria índices para performance
 
     É IDEMPOTENTE: pode ser executado múltiplas vezes sem problemas.
@@ -0,0 +1,223 @@
+"""
+Live Score Poller - Polling único de jogos ao vivo compartilhado por todos os clientes.
+
+Uma única task em background chama GET /fixtures?live=all a cada
+LIVE_POLL_INTERVAL_SECONDS, compara com o snapshot anterior e envia
+apenas os fixtures alterados para os assinantes (SSE).
+
+- GET /matches/live lê o snapshot em memória
+- GET /matches/live/stream recebe os diffs em tempo real
+- Chamadas à API-Football ficam constantes, independente do número de abas
+- Sob demanda: a task para após LIVE_POLL_IDLE_TIMEOUT_SECONDS sem leitores
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from application.services.match_application_service import MatchService
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Máximo de eventos pendentes por assinante (cliente lento perde os mais antigos)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class LiveScorePoller:
+    """
+    Poller de jogos ao vivo com fan-out para assinantes.
+
+    Responsável por:
+    - Manter o snapshot atual (fixture_id → update)
+    - Calcular o diff entre polls (changed / removed)
+    - Distribuir os diffs para as filas dos assinantes
+    """
+
+    def __init__(
+        self,
+        match_service: MatchService = None,
+        interval_seconds: int = None,
+        idle_timeout_seconds: int = None
+    ):
+        self.match_service = match_service or MatchService()
+        self.interval_seconds = interval_seconds or settings.LIVE_POLL_INTERVAL_SECONDS
+        self.idle_timeout_seconds = idle_timeout_seconds or settings.LIVE_POLL_IDLE_TIMEOUT_SECONDS
+
+        self._snapshot: Dict[str, Dict[str, Any]] = {}
+        self._polled_at: Optional[datetime] = None
+        # Última tentativa de poll (inclusive com erro): limita as chamadas à API
+        self._polled_mono: Optional[float] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._last_demand = 0.0
+        self._polls = 0
+        self._errors = 0
+        self._poll_lock: Optional[asyncio.Lock] = None
+
+    # ========================================
+    # Leitura
+    # ========================================
+
+    async def get_snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Retorna o snapshot atual dos jogos ao vivo.
+
+        Garante que o poller está rodando; se o snapshot estiver vazio ou
+        desatualizado (poller estava parado), faz um poll imediato.
+
+        Returns:
+            Lista de dicts com {id, status, status_short, elapsed, goals}
+        """
+        self._touch()
+        if not self._is_fresh():
+            await self._poll(skip_if_fresh=True)
+        return list(self._snapshot.values())
+
+    @property
+    def polled_at(self) -> Optional[datetime]:
+        """Horário do último poll bem-sucedido."""
+        return self._polled_at
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Registra um assinante de diffs.
+
+        Returns:
+            Fila que recebe eventos {"changed": [...], "removed": [...]}
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        self._touch()
+        logger.info(f"📡 Assinante ao vivo conectado ({len(self._subscribers)} ativos)")
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove um assinante."""
+        self._subscribers.discard(queue)
+        logger.info(f"📡 Assinante ao vivo desconectado ({len(self._subscribers)} ativos)")
+
+    # ========================================
+    # Polling
+    # ========================================
+
+    def _touch(self) -> None:
+        """Registra demanda e inicia a task de polling se necessário."""
+        self._last_demand = time.monotonic()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🔴 Poller ao vivo iniciado (intervalo {self.interval_seconds}s)")
+
+    def _is_fresh(self) -> bool:
+        return self._polled_mono is not None and time.monotonic() - self._polled_mono < self.interval_seconds
+
+    def _idle(self) -> bool:
+        return not self._subscribers and time.monotonic() - self._last_demand > self.idle_timeout_seconds
+
+    async def _run(self) -> None:
+        while not self._idle():
+            await self._poll(skip_if_fresh=True)
+            await asyncio.sleep(self.interval_seconds)
+
+        logger.info("⏸️ Poller ao vivo parado (sem clientes)")
+
+    async def _poll(self, skip_if_fresh: bool = False) -> None:
+        """
+        Busca os jogos ao vivo, calcula o diff e notifica os assinantes.
+
+        Args:
+            skip_if_fresh: Não refaz o poll se o snapshot foi atualizado há menos de 1 intervalo
+        """
+        if self._poll_lock is None:
+            self._poll_lock = asyncio.Lock()
+
+        async with self._poll_lock:
+            if skip_if_fresh and self._is_fresh():
+                return
+
+            try:
+                updates = await self.match_service.get_live_updates()
+            except Exception as e:
+                # Conta como tentativa: com a API falhando, leitores não disparam
+                # um novo request cada (mantém o snapshot anterior até o próximo intervalo)
+                self._polled_mono = time.monotonic()
+                self._errors += 1
+                logger.error(f"❌ Erro no poll ao vivo: {e}")
+                return
+
+            current = {u["id"]: u for u in updates}
+            changed = [u for fid, u in current.items() if self._snapshot.get(fid) != u]
+            removed = [fid for fid in self._snapshot if fid not in current]
+
+            self._snapshot = current
+            self._polled_at = settings.now()
+            self._polled_mono = time.monotonic()
+            self._polls += 1
+
+            if changed or removed:
+                logger.info(f"🔴 Ao vivo: {len(changed)} alterados, {len(removed)} encerrados")
+                self._publish({"changed": changed, "removed": removed})
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def stop(self) -> None:
+        """Para a task de polling (shutdown)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado do poller.
+
+        Returns:
+            Dicionário com assinantes, polls e tamanho do snapshot
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_seconds": self.interval_seconds,
+            "subscribers": len(self._subscribers),
+            "polls": self._polls,
+            "errors": self._errors,
+            "live_fixtures": len(self._snapshot),
+            "polled_at": self._polled_at.isoformat() if self._polled_at else None,
+        }
+
+
+# Instância global (singleton)
+_live_poller: Optional[LiveScorePoller] = None
+
+
+def get_live_score_poller() -> LiveScorePoller:
+    """
+    Retorna o poller global de jogos ao vivo (singleton).
+
+    Returns:
+        LiveScorePoller instance
+    """
+    global _live_poller
+
+    if _live_poller is None:
+        _live_poller = LiveScorePoller()
+
+    return _live_poller
+
+
+async def stop_live_score_poller() -> None:
+    """
+    Para o poller global, se existir.
+
+    Chamado no shutdown da API.
+    """
+    if _live_poller is not None:
+        await _live_poller.stop()
@@ -1,19 +1,23 @@
 """
 Match Service - Lógica de negócio para matches.
 
-Lê fixtures do cache (key: fixtures:{date}).
+Lê fixtures do cache via FixtureStore (tabela normalizada ou blob fixtures:{date}).
+Busca por ID e filtros por liga/status são consultas indexadas.
 Odds são pré-carregadas em bulk e embutidas nos matches.
+Mudanças de odds são consultáveis por instante (OddsStore.changed_since).
 Ligas são extraídas dinamicamente dos dados carregados.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime
 from typing import List, Optional, Dict, Any
 import logging
 
 from infrastructure.cache.cache_manager import get_cache
+from infrastructure.cache.fixture_store import FixtureStore
+from infrastructure.cache.odds_store import OddsStore
 from infrastructure.external.api_football.service import APIFootballService
+from infrastructure.external.api_football.rate_limiter import RequestPriority, with_request_priority
 from config.settings import settings
-from domain.constants.constants import ACTIVE_STATUSES
 
 logger = logging.getLogger(__name__)
 
@@ -29,58 +33,49 @@ class MatchService:
 
     def __init__(self):
         self.cache = get_cache()
+        self.fixture_store = FixtureStore(self.cache)
+        self.odds_store = OddsStore(self.cache)
         self.api_service = APIFootballService()
 
-    def _filter_active(self, fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filtra apenas partidas ativas (não encerradas)."""
-        return [f for f in fixtures if f.get("status_short", "NS") in ACTIVE_STATUSES]
-
-    def _get_odds_for_fixture(self, fixture_id: str, fixture_date_str: str) -> Dict[str, Any]:
+    def _build_matches(self, fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Busca odds de um fixture do cache.
+        Constrói os matches a partir dos fixtures, embutindo odds do cache.
 
-        Primeiro tenta cache individual (odds:{fixture_id}).
-        Se miss, tenta extrair do cache bulk (odds_date:{date}).
+        Odds de cada fixture: cache individual (odds:{fixture_id}) e, se miss,
+        o cache bulk da data (odds_date:{date}). Todas as chaves são lidas
+        de uma vez (get_many), em vez de 1-2 leituras por fixture, sem promover
+        para o L1 (a lista inteira de odds não cabe no LRU).
 
         Args:
-            fixture_id: ID do fixture
-            fixture_date_str: Data no formato YYYY-MM-DD (para lookup no bulk cache)
+            fixtures: Fixtures parseados
 
         Returns:
-            Odds por bookmaker (filtrado por suportadas)
+            Matches com odds embutidas (filtrado por bookmakers suportadas)
         """
-        # 1. Cache individual
-        individual_odds = self.cache.get(f"odds:{fixture_id}")
-        if individual_odds:
-            return {k: v for k, v in individual_odds.items() if k in settings.supported_bookmakers_set}
-
-        # 2. Cache bulk por data
-        bulk_odds = self.cache.get(f"odds_date:{fixture_date_str}")
-        if bulk_odds and fixture_id in bulk_odds:
-            odds = bulk_odds[fixture_id]
-            return {k: v for k, v in odds.items() if k in settings.supported_bookmakers_set}
+        keyed = []
+        for fixture in fixtures:
+            fixture_id = str(fixture.get("id", ""))
+            # Extrai data YYYY-MM-DD do fixture
+            fixture_date_str = fixture.get("timestamp", "") or fixture.get("date", "")[:10]
+            keyed.append((fixture, fixture_id, f"odds:{fixture_id}", f"odds_date:{fixture_date_str}"))
+
+        cached = self.cache.get_many((key for _, _, *keys in keyed for key in keys), promote=False)
+
+        matches = []
+        for fixture, fixture_id, odds_key, bulk_key in keyed:
+            # 1. Cache individual → 2. Cache bulk por data
+            odds = cached.get(odds_key) or (cached.get(bulk_key) or {}).get(fixture_id) or {}
+            matches.append({
+                **fixture,
+                "odds": {k: v for k, v in odds.items() if k in settings.supported_bookmakers_set},
+            })
 
-        return {}
-
-    def _build_match(self, fixture: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Constrói um match a partir de um fixture, embutindo odds do cache.
-        """
-        fixture_id = str(fixture.get("id", ""))
-        # Extrai data YYYY-MM-DD do fixture
-        fixture_date_str = fixture.get("timestamp", "") or fixture.get("date", "")[:10]
-
-        odds = self._get_odds_for_fixture(fixture_id, fixture_date_str)
-
-        return {
-            **fixture,
-            "odds": odds,
-        }
+        return matches
 
     def get_all_matches_by_date(self, match_date: date) -> List[Dict[str, Any]]:
         """
-        Busca todos os matches de uma data (todas as ligas).
-        Lê do cache bulk: fixtures:{date}.
+        Busca todos os matches ativos (não encerrados) de uma data (todas as ligas).
+        Filtro de status feito pelo FixtureStore (SQL indexado no modo normalizado).
         Embute odds do cache.
 
         Args:
@@ -89,20 +84,16 @@ class MatchService:
         Returns:
             Lista de todos os matches com odds embutidas
         """
-        cache_key = f"fixtures:{match_date.isoformat()}"
-        fixtures = self.cache.get(cache_key)
+        active_fixtures = self.fixture_store.get_active(match_date.isoformat())
 
-        if not fixtures:
-            logger.warning(f"Nenhum fixture encontrado para {cache_key}")
+        if not active_fixtures:
+            logger.warning(f"Nenhum fixture ativo encontrado para {match_date.isoformat()}")
             return []
 
-        # Filtra partidas encerradas
-        active_fixtures = self._filter_active(fixtures)
-
         # Monta matches com odds embutidas
-        matches = [self._build_match(f) for f in active_fixtures]
+        matches = self._build_matches(active_fixtures)
 
-        logger.info(f"✅ Total: {len(matches)} matches ativos em {match_date} (de {len(fixtures)} total)")
+        logger.info(f"✅ Total: {len(matches)} matches ativos em {match_date}")
         return matches
 
     def get_matches_by_league_and_date(
@@ -111,8 +102,8 @@ class MatchService:
         match_date: date
     ) -> List[Dict[str, Any]]:
         """
-        Busca matches de uma liga específica em uma data.
-        Filtra do cache bulk fixtures:{date} por league.id.
+        Busca matches ativos de uma liga específica em uma data.
+        Filtro por liga/status feito pelo FixtureStore (SQL indexado no modo normalizado).
 
         Args:
             league_id: ID da liga
@@ -121,8 +112,8 @@ class MatchService:
         Returns:
             Lista de matches da liga com odds embutidas
         """
-        all_matches = self.get_all_matches_by_date(match_date)
-        league_matches = [m for m in all_matches if str(m.get("league", {}).get("id", "")) == str(league_id)]
+        league_fixtures = self.fixture_store.get_active(match_date.isoformat(), league_id=str(league_id))
+        league_matches = self._build_matches(league_fixtures)
 
         logger.info(f"✅ {len(league_matches)} matches para liga {league_id} em {match_date}")
         return league_matches
@@ -130,35 +121,30 @@ class MatchService:
     def get_match_by_id(self, fixture_id: str) -> Optional[Dict[str, Any]]:
         """
         Busca um match específico por ID.
-        Procura em todas as datas cacheadas (até 15 dias à frente).
+        Consulta indexada no FixtureStore (PK no modo normalizado, fixture_index no blob).
         """
-        today = settings.today()
-
-        for day_offset in range(15):
-            search_date = today + timedelta(days=day_offset)
-            cache_key = f"fixtures:{search_date.isoformat()}"
-            fixtures = self.cache.get(cache_key)
-            if fixtures:
-                for f in fixtures:
-                    if str(f.get("id")) == str(fixture_id):
-                        return self._build_match(f)
+        fixture = self.fixture_store.find_by_id(fixture_id)
+        if fixture:
+            return self._build_matches([fixture])[0]
 
         logger.warning(f"Fixture {fixture_id} não encontrado no cache")
         return None
 
-    async def get_odds_for_match(self, fixture_id: int) -> Dict[str, Any]:
+    async def get_odds_for_match(self, fixture_id: int, refresh: bool = False) -> Dict[str, Any]:
         """
         Busca odds de uma partida (cache ou API).
         Filtra apenas bookmakers suportadas.
         """
-        raw_odds = await self.api_service.get_odds(fixture_id)
+        raw_odds = await self.api_service.get_odds(fixture_id, refresh=refresh)
         odds = {k: v for k, v in (raw_odds or {}).items() if k in settings.supported_bookmakers_set}
         logger.info(f"📊 Odds carregadas para fixture {fixture_id}: {list(odds.keys())}")
         return odds
 
     async def refresh_odds_for_match(self, fixture_id: int) -> Dict[str, Any]:
         """
-        Força refresh das odds de uma partida (deleta cache e busca da API).
+        Força refresh das odds de uma partida (ignora o cache e busca da API).
+
+        O cache só é regravado (e a mudança registrada) se as odds mudaram.
 
         Args:
             fixture_id: ID do fixture
@@ -166,14 +152,30 @@ class MatchService:
         Returns:
             Dict com odds atualizadas por bookmaker
         """
-        # Deleta cache existente
-        cache_key = f"odds:{fixture_id}"
-        self.cache.delete(cache_key)
-        logger.info(f"🔄 Cache de odds deletado para fixture {fixture_id}")
+        logger.info(f"🔄 Refresh de odds para fixture {fixture_id}")
+        return await self.get_odds_for_match(fixture_id, refresh=True)
 
-        # Busca novas odds da API
-        return await self.get_odds_for_match(fixture_id)
+    async def get_odds_changes(self, since: datetime) -> List[Dict[str, Any]]:
+        """
+        Lista as odds que mudaram depois de `since` (apenas bookmakers suportadas).
+
+        Args:
+            since: Instante de referência (com timezone)
 
+        Returns:
+            Lista de {fixture_id, changed_at (ISO), odds}, da mudança mais antiga para a mais recente
+        """
+        changes = await self.odds_store.achanged_since(since.timestamp())
+        return [
+            {
+                "fixture_id": change["fixture_id"],
+                "changed_at": datetime.fromtimestamp(change["changed_at"], tz=settings.tz).isoformat(),
+                "odds": {k: v for k, v in change["odds"].items() if k in settings.supported_bookmakers_set},
+            }
+            for change in changes
+        ]
+
+    @with_request_priority(RequestPriority.LIVE)
     async def get_fixture_live_status(self, fixture_id: int) -> Dict[str, Any]:
         """
         Busca o status atualizado de uma partida direto da API (sem cache).
@@ -249,12 +251,14 @@ class MatchService:
                 })
         return result
 
+    @with_request_priority(RequestPriority.LIVE)
     async def get_live_updates(self) -> List[Dict[str, Any]]:
         """
         Busca fixtures ao vivo da API e retorna updates de placar/status/minuto.
 
         Filtra apenas fixtures que estão no nosso cache (carregados pelo preload).
-        Atualiza o cache de fixtures com dados atualizados.
+        Atualiza o cache de fixtures com os dados do poll inteiro de uma vez
+        (só os fixtures alterados são regravados).
 
         Returns:
             Lista de dicts com {id, status, status_short, elapsed, goals}
@@ -264,19 +268,12 @@ class MatchService:
         if not live_fixtures:
             return []
 
-        # Coleta IDs de fixtures carregados no cache
-        loaded_ids = set()
-        today = settings.today()
-        for day_offset in range(15):
-            search_date = today + timedelta(days=day_offset)
-            cache_key = f"fixtures:{search_date.isoformat()}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                for f in cached:
-                    loaded_ids.add(str(f.get("id")))
-
-        # Filtra apenas fixtures que estão carregados E atualiza o cache
+        # IDs ao vivo que estão carregados no cache (consulta indexada, O(jogos ao vivo))
+        loaded_ids = await self.fixture_store.afilter_loaded(str(live.get("id")) for live in live_fixtures)
+
+        # Filtra apenas fixtures que estão carregados
         updates = []
+        live_by_id = {}
         for live in live_fixtures:
             fid = str(live.get("id"))
             if fid in loaded_ids:
@@ -287,27 +284,10 @@ class MatchService:
                     "elapsed": live.get("elapsed"),
                     "goals": live.get("goals", {"home": None, "away": None}),
                 })
+                live_by_id[fid] = live
 
-                # Atualiza fixture no cache
-                self._update_fixture_in_cache(fid, live)
+        # Atualiza o cache em lote (1 transação / 1 regravação por dia)
+        changed = await self.fixture_store.aapply_live_updates(live_by_id)
 
-        logger.info(f"🔴 {len(updates)} updates de jogos ao vivo (de {len(live_fixtures)} total da API)")
+        logger.info(f"🔴 {len(updates)} updates de jogos ao vivo (de {len(live_fixtures)} total da API, {changed} alterados no cache)")
         return updates
-
-    def _update_fixture_in_cache(self, fixture_id: str, live_data: Dict[str, Any]):
-        """Atualiza um fixture no cache com dados ao vivo."""
-        today = settings.today()
-        for day_offset in range(15):
-            search_date = today + timedelta(days=day_offset)
-            cache_key = f"fixtures:{search_date.isoformat()}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                for i, f in enumerate(cached):
-                    if str(f.get("id")) == fixture_id:
-                        cached[i]["status"] = live_data.get("status", f.get("status"))
-                        cached[i]["status_short"] = live_data.get("status_short", f.get("status_short"))
-                        cached[i]["elapsed"] = live_data.get("elapsed")
-                        cached[i]["goals"] = live_data.get("goals", f.get("goals", {}))
-                        self.cache.set(cache_key, cached, ttl_seconds=settings.CACHE_TTL_FIXTURES)
-                        return
-
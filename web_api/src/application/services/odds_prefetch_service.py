@@ -0,0 +1,286 @@
+"""
+Odds Prefetch Service - Aquecimento de odds por liga após o preload de fixtures.
+
+Quando preload_fixtures termina, uma task em background carrega as odds
+(odds_league:{id}:{data}) das ligas mais relevantes antes de o usuário
+selecioná-las no carrossel:
+
+- Ranking: nº de fixtures da liga no período + popularidade (quantas vezes
+  a liga foi pedida em POST /preload/odds/league)
+- Até ODDS_PREFETCH_MAX_LEAGUES ligas, ODDS_PREFETCH_CONCURRENCY em paralelo
+- Prioridade BACKGROUND no rate limiter; para quando o orçamento diário
+  restante cai abaixo de ODDS_PREFETCH_MIN_DAILY_REMAINING
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from application.services.preload_service import PreloadService
+from config.settings import settings
+from infrastructure.external.api_football.rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Pedidos de odds por liga (popularidade), acumulados por 30 dias
+POPULARITY_CACHE_KEY = "odds_prefetch:popularity"
+POPULARITY_TTL_SECONDS = 30 * 86400
+
+
+class OddsPrefetchService:
+    """
+    Pipeline de pré-carregamento de odds por liga.
+
+    Responsável por:
+    - Registrar a popularidade das ligas (pedidos do usuário)
+    - Ordenar as ligas do período por fixtures + popularidade
+    - Aquecer odds_league:* das primeiras, em paralelo e dentro da quota
+    """
+
+    def __init__(
+        self,
+        preload_service: PreloadService = None,
+        max_leagues: int = None,
+        concurrency: int = None,
+        min_daily_remaining: int = None
+    ):
+        self.preload_service = preload_service or PreloadService()
+        self.cache = self.preload_service.cache
+        self.max_leagues = max_leagues or settings.ODDS_PREFETCH_MAX_LEAGUES
+        self.concurrency = max(concurrency or settings.ODDS_PREFETCH_CONCURRENCY, 1)
+        self.min_daily_remaining = (
+            settings.ODDS_PREFETCH_MIN_DAILY_REMAINING if min_daily_remaining is None else min_daily_remaining
+        )
+
+        self._task: Optional[asyncio.Task] = None
+        self._dates: List[str] = []
+
+        # Serializa o read-modify-write da popularidade (aget → aset)
+        self._popularity_lock: Optional[asyncio.Lock] = None
+
+        self._runs = 0
+        self._leagues_warmed = 0
+        self._leagues_from_cache = 0
+        self._skipped_quota = 0
+        self._errors = 0
+        self._last_run_at: Optional[datetime] = None
+        self._last_ranking: List[Dict[str, Any]] = []
+
+    # ========================================
+    # Popularidade
+    # ========================================
+
+    async def record_league_request(self, league_id: str) -> None:
+        """
+        Conta 1 pedido de odds da liga (usuário selecionou no carrossel).
+
+        Pedidos simultâneos são serializados para não perder incrementos.
+
+        Args:
+            league_id: ID da liga
+        """
+        if self._popularity_lock is None:
+            self._popularity_lock = asyncio.Lock()
+
+        try:
+            async with self._popularity_lock:
+                # Cópia: o valor do L1 é compartilhado com outros leitores
+                popularity = dict(await self.cache.aget(POPULARITY_CACHE_KEY) or {})
+                popularity[str(league_id)] = popularity.get(str(league_id), 0) + 1
+                await self.cache.aset(POPULARITY_CACHE_KEY, popularity, ttl_seconds=POPULARITY_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"⚠️ Erro ao registrar popularidade da liga {league_id}: {e}")
+
+    # ========================================
+    # Ranking
+    # ========================================
+
+    def rank_leagues(
+        self,
+        leagues: List[Dict[str, Any]],
+        popularity: Dict[str, int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Ordena as ligas por relevância (fixtures no período + popularidade).
+
+        Os dois sinais são normalizados pelo máximo (0..1) e somados.
+
+        Args:
+            leagues: Ligas do preload (com fixture_count)
+            popularity: Dict[league_id, nº de pedidos]
+
+        Returns:
+            Lista de {id, name, fixture_count, requests, score}, da mais relevante para a menos
+        """
+        max_fixtures = max((league.get("fixture_count", 0) for league in leagues), default=0) or 1
+        max_requests = max((popularity.get(league["id"], 0) for league in leagues), default=0) or 1
+
+        ranked = []
+        for league in leagues:
+            fixture_count = league.get("fixture_count", 0)
+            requests = popularity.get(league["id"], 0)
+            ranked.append({
+                "id": league["id"],
+                "name": league.get("name", ""),
+                "fixture_count": fixture_count,
+                "requests": requests,
+                "score": round(fixture_count / max_fixtures + requests / max_requests, 3),
+            })
+
+        ranked.sort(key=lambda item: (-item["score"], -item["fixture_count"], item["id"]))
+        return ranked
+
+    # ========================================
+    # Execução
+    # ========================================
+
+    def schedule(self, leagues: List[Dict[str, Any]], dates: List[str]) -> None:
+        """
+        Inicia o aquecimento em background (após preload_fixtures).
+
+        Se já houver um aquecimento para as mesmas datas em andamento, mantém;
+        se as datas mudaram (outro período), reinicia.
+
+        Args:
+            leagues: Ligas retornadas por preload_fixtures
+            dates: Datas do período (YYYY-MM-DD)
+        """
+        if not settings.ODDS_PREFETCH_ENABLED or not leagues or not dates:
+            return
+
+        if self._task and not self._task.done():
+            if dates == self._dates:
+                return
+            self._task.cancel()
+
+        self._dates = list(dates)
+        self._task = asyncio.create_task(self.prefetch(leagues, dates))
+        self._task.add_done_callback(self._on_prefetch_done)
+
+    def _on_prefetch_done(self, task: asyncio.Task) -> None:
+        """Registra erro do prefetch fora de warm() (ex.: cache.aget), em vez de perdê-lo na task."""
+        if task.cancelled():
+            return
+
+        error = task.exception()
+        if error is not None:
+            self._errors += 1
+            self._last_run_at = settings.now()
+            logger.error(f"❌ Prefetch de odds interrompido: {error!r}")
+
+    async def prefetch(self, leagues: List[Dict[str, Any]], dates: List[str]) -> Dict[str, Any]:
+        """
+        Aquece as odds das ligas mais relevantes.
+
+        Args:
+            leagues: Ligas do período (com fixture_count)
+            dates: Datas do período (YYYY-MM-DD)
+
+        Returns:
+            Dict com warmed, from_cache, skipped_quota e errors
+        """
+        popularity = await self.cache.aget(POPULARITY_CACHE_KEY) or {}
+        ranked = self.rank_leagues(leagues, popularity)[:self.max_leagues]
+        self._last_ranking = ranked
+
+        logger.info(
+            f"🔥 Prefetch de odds: {len(ranked)} ligas ({self.concurrency} em paralelo) — "
+            f"{', '.join(item['name'] or item['id'] for item in ranked)}"
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stats = {"warmed": 0, "from_cache": 0, "skipped_quota": 0, "errors": 0}
+
+        async def warm(item: Dict[str, Any]) -> None:
+            async with semaphore:
+                remaining = get_rate_limiter().daily_remaining
+                if remaining < self.min_daily_remaining:
+                    stats["skipped_quota"] += 1
+                    logger.debug(f"⏭️ Prefetch liga {item['id']}: quota baixa ({remaining} restantes)")
+                    return
+
+                try:
+                    result = await self.preload_service.preload_odds_for_league(item["id"], dates)
+                except Exception as e:
+                    stats["errors"] += 1
+                    logger.error(f"❌ Prefetch liga {item['id']}: {e}")
+                    return
+
+                stats["from_cache" if result.get("from_cache") else "warmed"] += 1
+
+        await asyncio.gather(*(warm(item) for item in ranked))
+
+        self._runs += 1
+        self._last_run_at = settings.now()
+        self._leagues_warmed += stats["warmed"]
+        self._leagues_from_cache += stats["from_cache"]
+        self._skipped_quota += stats["skipped_quota"]
+        self._errors += stats["errors"]
+
+        logger.info(
+            f"✅ Prefetch de odds concluído: {stats['warmed']} ligas aquecidas, "
+            f"{stats['from_cache']} já em cache, {stats['skipped_quota']} puladas (quota)"
+        )
+        return stats
+
+    async def stop(self) -> None:
+        """Cancela o aquecimento em andamento (shutdown)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado do prefetch.
+
+        Returns:
+            Dicionário com execuções, ligas aquecidas e o último ranking
+        """
+        return {
+            "enabled": settings.ODDS_PREFETCH_ENABLED,
+            "running": self._task is not None and not self._task.done(),
+            "max_leagues": self.max_leagues,
+            "concurrency": self.concurrency,
+            "min_daily_remaining": self.min_daily_remaining,
+            "runs": self._runs,
+            "leagues_warmed": self._leagues_warmed,
+            "leagues_from_cache": self._leagues_from_cache,
+            "skipped_quota": self._skipped_quota,
+            "errors": self._errors,
+            "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+            "last_ranking": self._last_ranking,
+        }
+
+
+# Instância global (singleton)
+_prefetch_service: Optional[OddsPrefetchService] = None
+
+
+def get_odds_prefetch_service() -> OddsPrefetchService:
+    """
+    Retorna o serviço global de prefetch de odds (singleton).
+
+    Returns:
+        OddsPrefetchService instance
+    """
+    global _prefetch_service
+
+    if _prefetch_service is None:
+        _prefetch_service = OddsPrefetchService()
+
+    return _prefetch_service
+
+
+async def stop_odds_prefetch_service() -> None:
+    """
+    Para o prefetch global, se existir.
+
+    Chamado no shutdown da API.
+    """
+    if _prefetch_service is not None:
+        await _prefetch_service.stop()
@@ -10,6 +10,7 @@ from domain.models.prediction_model import Prediction
 from domain.models.odds_model import Odds, BookmakerOdds
 from domain.enums.betting_strategy_enum import BettingStrategy
 from application.services.match_application_service import MatchService
+from infrastructure.database.executor import run_in_db_executor
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +41,8 @@ class PredictionApplicationService:
         predictions = []
 
         for match_id in match_ids:
-            # Busca dados do match no cache (já vem com odds embutidas do _build_match)
-            match_data = self.match_service.get_match_by_id(match_id)
+            # Busca dados do match no cache (já vem com odds embutidas do _build_matches)
+            match_data = await run_in_db_executor(self.match_service.get_match_by_id, match_id)
 
             if not match_data:
                 logger.warning(f"⚠️ Match {match_id} não encontrado no cache, pulando...")
@@ -2,23 +2,30 @@
 Preload Service - Pré-carregamento de fixtures e odds por data.
 
 Dois fluxos separados:
-1. preload_fixtures(days) — rápido, 1 request/dia, carrega fixtures
+1. preload_fixtures(days) — rápido, 1 request/dia (todos os dias em paralelo), carrega fixtures
 2. preload_odds_for_date(date) — lento (paginado), 1 data por vez, carrega odds
 
 Cache incremental: 3 dias → 7 dias → 14 dias.
 Ligas extraídas dinamicamente dos fixtures.
+Season de cada liga (para GET /odds) persistida em leagues:seasons.
 """
 
 from datetime import date, timedelta
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
 import logging
 
 from infrastructure.cache.cache_manager import get_cache
+from infrastructure.cache.fixture_store import FixtureStore
 from infrastructure.external.api_football.service import APIFootballService
+from infrastructure.external.api_football.rate_limiter import RequestPriority, with_request_priority
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Mapa league_id → season (montado no preload a partir do coverage + fixtures)
+LEAGUE_SEASONS_CACHE_KEY = "leagues:seasons"
+
 
 class PreloadService:
     """
@@ -31,7 +38,10 @@ class PreloadService:
 
     def __init__(self):
         self.cache = get_cache()
+        self.fixture_store = FixtureStore(self.cache)
         self.api_service = APIFootballService()
+        # Um carregamento de fixtures por vez (o primeiro limpa o cache)
+        self._fixtures_lock = asyncio.Lock()
 
     def _get_dates(self, days: int = 7) -> List[date]:
         """Retorna lista de datas desde hoje até 'days' dias à frente."""
@@ -39,102 +49,195 @@ class PreloadService:
         logger.info(f"📅 Hoje (timezone {settings.TIMEZONE}): {today.isoformat()}")
         return [today + timedelta(days=i) for i in range(days)]
 
-    def _get_cached_period(self) -> int:
-        cached_date = self.cache.get("preload:last_date")
-        cached_days = self.cache.get("preload:last_days")
+    async def _get_cached_period(self) -> int:
+        cached = await self.cache.aget_many(["preload:last_date", "preload:last_days"])
+        cached_date = cached.get("preload:last_date")
+        cached_days = cached.get("preload:last_days")
         today_str = settings.today().isoformat()
         if cached_date == today_str and cached_days:
             return int(cached_days)
         return 0
 
     async def has_todays_cache(self) -> bool:
-        return self._get_cached_period() > 0
+        return await self._get_cached_period() > 0
 
     def _extract_leagues(self, all_fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Extrai ligas únicas dos fixtures carregados."""
-        seen = set()
+        """Extrai ligas únicas dos fixtures carregados (com o nº de fixtures de cada uma)."""
+        seen: Dict[str, Dict[str, Any]] = {}
         leagues = []
         for fixture in all_fixtures:
             league_data = fixture.get("league", {})
             league_id = str(league_data.get("id", ""))
-            if league_id and league_id not in seen:
-                seen.add(league_id)
-                leagues.append({
+            if league_id in seen:
+                seen[league_id]["fixture_count"] += 1
+            elif league_id:
+                seen[league_id] = {
                     "id": league_id,
                     "name": league_data.get("name", ""),
                     "country": league_data.get("country", ""),
                     "logo": league_data.get("logo", ""),
                     "type": league_data.get("type", "league"),
                     "has_statistics_fixtures": False,  # Default, será enriquecido depois
-                })
+                    "fixture_count": 1,
+                }
+                leagues.append(seen[league_id])
         leagues.sort(key=lambda l: (l["country"], l["name"]))
         logger.info(f"🏆 {len(leagues)} ligas distintas extraídas dos fixtures")
         return leagues
 
-    async def _enrich_leagues_with_coverage(self, leagues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _get_coverage_map(self) -> Optional[Dict[str, Dict[str, Any]]]:
         """
-        Filtra ligas mantendo APENAS as que possuem statistics_fixtures: true.
+        Busca o coverage das ligas (GET /leagues?season={year}) — cacheado por 7 dias.
 
-        Busca GET /leagues?season={year} — cacheia por 7 dias.
-        Busca SEMPRE season atual E anterior para cobrir todas as ligas:
+        Busca SEMPRE season atual E anterior (em paralelo) para cobrir todas as ligas:
         - Ligas brasileiras: season = ano corrente (ex: 2026)
         - Ligas europeias: season = ano anterior (ex: 2025 para 2025/2026)
 
-        Ligas sem statistics_fixtures são REMOVIDAS (não entram no cache).
+        Cada liga recebe "season": a marcada como current pela API; sem essa
+        marcação, a mais recente em que a liga aparece.
+
+        Returns:
+            Dict[league_id, coverage] (prioridade para a season atual) ou None em caso de erro
         """
         try:
             season = settings.today().year
+            coverage_current, coverage_previous = await asyncio.gather(
+                self.api_service.get_leagues_coverage(season),
+                self.api_service.get_leagues_coverage(season - 1),
+            )
+
+            # Merge: prioridade para season atual, exceto se só a anterior é a current da liga
+            coverage_map: Dict[str, Dict[str, Any]] = {}
+            for year, coverage in ((season - 1, coverage_previous), (season, coverage_current)):
+                for league_id, cov in coverage.items():
+                    known = coverage_map.get(league_id)
+                    if known is None or cov.get("current") or not known.get("current"):
+                        coverage_map[league_id] = {**cov, "season": year}
+            return coverage_map
+        except Exception as e:
+            logger.error(f"⚠️ Erro ao buscar coverage: {e}")
+            return None
+
+    def _enrich_leagues_with_coverage(
+        self,
+        leagues: List[Dict[str, Any]],
+        coverage_map: Optional[Dict[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Filtra ligas mantendo APENAS as que possuem statistics_fixtures: true.
+
+        Ligas sem statistics_fixtures são REMOVIDAS (não entram no cache).
+        Sem coverage (erro na API), retorna todas as ligas.
+        """
+        if coverage_map is None:
+            logger.warning("⚠️ Coverage indisponível — retornando todas as ligas")
+            return leagues
+
+        filtered_leagues = []
+        removed = 0
+
+        for league in leagues:
+            lid = league["id"]
+            cov = coverage_map.get(lid)
+
+            if cov and cov.get("statistics_fixtures", False):
+                league["has_statistics_fixtures"] = True
+                # Atualiza type da API (mais preciso que o fallback do fixture)
+                if cov.get("type"):
+                    league["type"] = cov["type"]
+                filtered_leagues.append(league)
+            else:
+                removed += 1
+
+        logger.info(
+            f"📊 Coverage filtrado: {len(filtered_leagues)} ligas com statistics_fixtures "
+            f"(removidas: {removed}, mapa total: {len(coverage_map)})"
+        )
+        return filtered_leagues
+
+    async def _save_league_seasons(
+        self,
+        fixtures: List[Dict[str, Any]],
+        coverage_map: Optional[Dict[str, Dict[str, Any]]]
+    ) -> Dict[str, int]:
+        """
+        Atualiza o mapa league_id → season (leagues:seasons).
 
-            # Busca ambas as seasons para máxima cobertura
-            coverage_current = await self.api_service.get_leagues_coverage(season)
-            coverage_previous = await self.api_service.get_leagues_coverage(season - 1)
+        Fontes, da menor para a maior prioridade: mapa já salvo, coverage
+        (/leagues) e league.season dos fixtures carregados.
 
-            # Merge: prioridade para season atual, fallback para anterior
-            coverage_map = {**coverage_previous, **coverage_current}
+        Returns:
+            Mapa atualizado
+        """
+        # Cópia: o valor do L1 é compartilhado com outros leitores
+        seasons: Dict[str, int] = dict(await self.cache.aget(LEAGUE_SEASONS_CACHE_KEY) or {})
 
-            filtered_leagues = []
-            removed = 0
+        for league_id, cov in (coverage_map or {}).items():
+            if cov.get("season"):
+                seasons[league_id] = cov["season"]
 
-            for league in leagues:
-                lid = league["id"]
-                cov = coverage_map.get(lid)
+        for fixture in fixtures:
+            league_data = fixture.get("league", {})
+            try:
+                season = int(league_data.get("season") or 0)
+            except (TypeError, ValueError):
+                continue
+            if season and league_data.get("id"):
+                seasons[str(league_data["id"])] = season
 
-                if cov and cov.get("statistics_fixtures", False):
-                    league["has_statistics_fixtures"] = True
-                    # Atualiza type da API (mais preciso que o fallback do fixture)
-                    if cov.get("type"):
-                        league["type"] = cov["type"]
-                    filtered_leagues.append(league)
-                else:
-                    removed += 1
+        await self.cache.aset(LEAGUE_SEASONS_CACHE_KEY, seasons, ttl_seconds=settings.CACHE_TTL_LEAGUES)
+        logger.info(f"🗓️ Seasons mapeadas: {len(seasons)} ligas")
+        return seasons
 
-            logger.info(
-                f"📊 Coverage filtrado: {len(filtered_leagues)} ligas com statistics_fixtures "
-                f"(removidas: {removed}, mapa total: {len(coverage_map)})"
-            )
-            return filtered_leagues
+    async def _fetch_day(self, fetch_date: date) -> Tuple[date, List[Dict[str, Any]]]:
+        """Busca os fixtures de uma data (erros viram lista vazia)."""
+        try:
+            return fetch_date, await self.api_service.get_all_fixtures_by_date(fetch_date) or []
         except Exception as e:
-            logger.error(f"⚠️ Erro ao filtrar coverage: {e} — retornando todas as ligas")
-            return leagues
+            logger.error(f"  ❌ Erro fixtures {fetch_date}: {e}")
+            return fetch_date, []
 
     # ========================================
     # FASE 1: Fixtures (rápido)
     # ========================================
 
-    async def preload_fixtures(self, days: int = 7) -> Dict[str, Any]:
+    @with_request_priority(RequestPriority.BACKGROUND)
+    async def preload_fixtures(
+        self,
+        days: int = 7,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
         """
         Pré-carrega APENAS fixtures por data (sem odds).
         Rápido: 1 request por dia, sem paginação.
 
+        Todas as datas e o coverage (season atual e anterior) são buscados em
+        paralelo, sob o rate limit compartilhado da API-Football. Cada dia é
+        reportado em on_progress assim que chega (já gravado no cache).
+
+        Args:
+            days: Número de dias a partir de hoje
+            on_progress: Callback chamado a cada dia carregado com
+                {date, count, loaded_days, total_days, total_fixtures} e, quando
+                o coverage já chegou, leagues (ligas carregadas até o momento)
+
         Returns:
             Dict com total_fixtures, leagues, dates (lista de datas carregadas)
         """
-        cached_days = self._get_cached_period()
+        async with self._fixtures_lock:
+            return await self._preload_fixtures(days, on_progress)
+
+    async def _preload_fixtures(
+        self,
+        days: int,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Dict[str, Any]:
+        cached_days = await self._get_cached_period()
 
         # Se já tem cache suficiente, retorna do cache
         if cached_days >= days:
             logger.info(f"✅ Cache de {cached_days} dias já existe para fixtures")
-            cached_leagues = self.cache.get("leagues:dynamic") or []
+            cached_leagues = await self.cache.aget("leagues:dynamic") or []
             all_dates = self._get_dates(days)
             return {
                 "total_fixtures": 0,
@@ -149,42 +252,65 @@ class PreloadService:
             dates_to_fetch = all_dates[cached_days:]
             logger.info(f"📦 Cache incremental fixtures: já tem {cached_days} dias, carregando mais {len(dates_to_fetch)}")
         else:
-            self.cache.delete_by_prefix("fixtures:")
-            self.cache.delete_by_prefix("odds_league:")
+            await self.fixture_store.aclear()
+            await self.cache.adelete_by_prefix("odds_league:")
             dates_to_fetch = all_dates
             logger.info(f"🗑️ Cache limpo (fixtures + odds_league), carregando {len(dates_to_fetch)} dias de fixtures")
 
-        logger.info(f"🚀 Carregando fixtures: {len(dates_to_fetch)} dias...")
+        logger.info(f"🚀 Carregando fixtures: {len(dates_to_fetch)} dias em paralelo...")
 
-        total_fixtures = 0
-        all_loaded_fixtures = []
-
-        for fetch_date in dates_to_fetch:
-            try:
-                fixtures = await self.api_service.get_all_fixtures_by_date(fetch_date)
-                count = len(fixtures) if fixtures else 0
-                total_fixtures += count
-                if fixtures:
-                    all_loaded_fixtures.extend(fixtures)
-                logger.info(f"  📅 {fetch_date.isoformat()}: {count} fixtures")
-            except Exception as e:
-                logger.error(f"  ❌ Erro fixtures {fetch_date}: {e}")
+        # Coverage em paralelo com as datas
+        coverage_task = asyncio.create_task(self._get_coverage_map())
 
         # Inclui fixtures já cacheados para extrair ligas completas
-        if cached_days > 0:
-            for i in range(cached_days):
-                cached_fixtures = self.cache.get(f"fixtures:{all_dates[i].isoformat()}")
-                if cached_fixtures:
-                    all_loaded_fixtures.extend(cached_fixtures)
+        all_loaded_fixtures = []
+        for cached_fixtures in await asyncio.gather(
+            *(self.fixture_store.aget_day(all_dates[i].isoformat()) for i in range(cached_days))
+        ):
+            if cached_fixtures:
+                all_loaded_fixtures.extend(cached_fixtures)
+
+        total_fixtures = 0
+        loaded_days = cached_days
 
-        # Extrai ligas e enriquece com coverage
+        try:
+            for next_day in asyncio.as_completed([self._fetch_day(d) for d in dates_to_fetch]):
+                fetch_date, fixtures = await next_day
+                total_fixtures += len(fixtures)
+                all_loaded_fixtures.extend(fixtures)
+                loaded_days += 1
+                logger.info(f"  📅 {fetch_date.isoformat()}: {len(fixtures)} fixtures ({loaded_days}/{days})")
+
+                if on_progress:
+                    event = {
+                        "date": fetch_date.isoformat(),
+                        "count": len(fixtures),
+                        "loaded_days": loaded_days,
+                        "total_days": days,
+                        "total_fixtures": total_fixtures,
+                    }
+                    if coverage_task.done():
+                        event["leagues"] = self._enrich_leagues_with_coverage(
+                            self._extract_leagues(all_loaded_fixtures), coverage_task.result()
+                        )
+                    on_progress(event)
+
+            coverage_map = await coverage_task
+        finally:
+            if not coverage_task.done():
+                coverage_task.cancel()
+
+        # Extrai ligas e filtra pelo coverage
         dynamic_leagues = self._extract_leagues(all_loaded_fixtures)
-        dynamic_leagues = await self._enrich_leagues_with_coverage(dynamic_leagues)
-        self.cache.set("leagues:dynamic", dynamic_leagues, ttl_seconds=86400)
+        dynamic_leagues = self._enrich_leagues_with_coverage(dynamic_leagues, coverage_map)
+        await self._save_league_seasons(all_loaded_fixtures, coverage_map)
 
-        # Marca período cacheado
-        self.cache.set("preload:last_date", settings.today().isoformat(), ttl_seconds=86400)
-        self.cache.set("preload:last_days", days, ttl_seconds=86400)
+        # Ligas + marca do período cacheado (1 transação)
+        await self.cache.aset_many({
+            "leagues:dynamic": dynamic_leagues,
+            "preload:last_date": settings.today().isoformat(),
+            "preload:last_days": days,
+        }, ttl_seconds=86400)
 
         logger.info(f"✅ Fixtures concluído! {total_fixtures} fixtures, {len(dynamic_leagues)} ligas")
 
@@ -199,6 +325,7 @@ class PreloadService:
     # FASE 2: Odds de uma data (lento, paginado) — LEGACY
     # ========================================
 
+    @with_request_priority(RequestPriority.BACKGROUND)
     async def preload_odds_for_date(self, odds_date_str: str) -> Dict[str, Any]:
         """
         Carrega odds de UMA data específica (com paginação).
@@ -214,7 +341,7 @@ class PreloadService:
         cache_key = f"odds_date:{odds_date_str}"
 
         # Já tem cache?
-        cached = self.cache.get(cache_key)
+        cached = await self.cache.aget(cache_key)
         if cached:
             logger.info(f"✅ Odds já cacheadas para {odds_date_str}: {len(cached)} fixtures")
             return {
@@ -243,16 +370,24 @@ class PreloadService:
     # FASE 2b: Odds por liga (sob demanda, equilibrado)
     # ========================================
 
-    async def preload_odds_for_league(self, league_id: str, dates: List[str]) -> Dict[str, Any]:
+    @with_request_priority(RequestPriority.BACKGROUND)
+    async def preload_odds_for_league(
+        self,
+        league_id: str,
+        dates: List[str],
+        refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Carrega odds de uma LIGA específica para múltiplas datas.
         Usa GET /odds?league={id}&season={year}&date={date}.
 
-        Extrai o season dos fixtures cacheados (necessário para a API-Football).
+        A season vem do mapa leagues:seasons (necessária para a API-Football):
+        1 request por data, sem nova tentativa com outra season.
 
         Args:
             league_id: ID da liga (string)
             dates: Lista de datas no formato YYYY-MM-DD
+            refresh: Baixa de novo mesmo com cache (só as odds alteradas são regravadas)
 
         Returns:
             Dict com total_odds e detalhes por data
@@ -264,16 +399,20 @@ class PreloadService:
         dates_loaded = []
         all_from_cache = True
 
-        # Extrai season dos fixtures cacheados para esta liga
-        season = self._get_league_season(league_id, dates)
+        # Season da liga (mapa do preload → fixtures cacheados → ano da data)
+        season = await self._get_league_season(league_id, dates)
         if season:
             logger.info(f"🏆 Liga {league_id}: season={season}")
         else:
             logger.warning(f"⚠️ Liga {league_id}: season não encontrada nos fixtures")
 
+        # Odds já cacheadas de todas as datas (1 leitura)
+        cached_by_key = {} if refresh else await self.cache.aget_many(
+            f"odds_league:{league_id}:{date_str}" for date_str in dates
+        )
+
         for date_str in dates:
-            cache_key = f"odds_league:{league_id}:{date_str}"
-            cached = self.cache.get(cache_key)
+            cached = cached_by_key.get(f"odds_league:{league_id}:{date_str}")
 
             if cached:
                 count = len(cached)
@@ -283,7 +422,7 @@ class PreloadService:
                 continue
 
             # Verifica se esta liga tem fixtures nesta data (evita requests desnecessários)
-            has_fixtures = self._league_has_fixtures_on_date(league_id, date_str)
+            has_fixtures = await self._league_has_fixtures_on_date(league_id, date_str)
             if not has_fixtures:
                 dates_loaded.append({"date": date_str, "count": 0, "from_cache": False})
                 logger.debug(f"⏭️ Liga {league_id} sem fixtures em {date_str}, pulando odds")
@@ -295,22 +434,10 @@ class PreloadService:
                 parts = date_str.split("-")
                 odds_date = date_cls(int(parts[0]), int(parts[1]), int(parts[2]))
 
-                # Tenta com season principal
                 league_odds = await self.api_service.get_odds_by_league_and_date(
-                    league_id_int, odds_date, season=season
+                    league_id_int, odds_date, season=season, refresh=refresh
                 )
 
-                # Se não encontrou odds e season é do ano corrente, tenta ano anterior
-                # (ligas europeias usam season do ano anterior, ex: 2025/2026)
-                if not league_odds and season:
-                    alt_season = season - 1
-                    logger.info(f"🔄 Liga {league_id}: tentando season alternativa {alt_season}...")
-                    league_odds = await self.api_service.get_odds_by_league_and_date(
-                        league_id_int, odds_date, season=alt_season
-                    )
-                    if league_odds:
-                        logger.info(f"✅ Liga {league_id}: season correta é {alt_season}")
-
                 count = len(league_odds) if league_odds else 0
                 total_odds += count
                 dates_loaded.append({"date": date_str, "count": count, "from_cache": False})
@@ -328,22 +455,17 @@ class PreloadService:
             "from_cache": all_from_cache,
         }
 
-    def _league_has_fixtures_on_date(self, league_id: str, date_str: str) -> bool:
+    async def _league_has_fixtures_on_date(self, league_id: str, date_str: str) -> bool:
         """Verifica se uma liga tem fixtures em uma data específica."""
-        cached_fixtures = self.cache.get(f"fixtures:{date_str}")
-        if not cached_fixtures:
-            return False
-        return any(
-            str(f.get("league", {}).get("id", "")) == str(league_id)
-            for f in cached_fixtures
-        )
+        return await self.fixture_store.aleague_has_fixtures_on_date(league_id, date_str)
 
-    def _get_league_season(self, league_id: str, dates: List[str]) -> int:
+    async def _get_league_season(self, league_id: str, dates: List[str]) -> int:
         """
-        Extrai o season (ano) de uma liga a partir dos fixtures cacheados.
+        Resolve o season (ano) de uma liga.
 
-        Percorre as datas e busca o primeiro fixture da liga para extrair o season.
-        Fallback: usa o ano da primeira data como season.
+        1. Mapa leagues:seasons (coverage + fixtures, montado no preload)
+        2. Primeiro fixture da liga nas datas (SQL indexado no modo normalizado)
+        3. Fallback: ano da primeira data
 
         Args:
             league_id: ID da liga
@@ -352,16 +474,13 @@ class PreloadService:
         Returns:
             Ano da season (ex: 2026) ou None
         """
-        for date_str in dates:
-            cached_fixtures = self.cache.get(f"fixtures:{date_str}")
-            if not cached_fixtures:
-                continue
-            for fixture in cached_fixtures:
-                fixture_league = fixture.get("league", {})
-                if str(fixture_league.get("id", "")) == str(league_id):
-                    season = fixture_league.get("season")
-                    if season:
-                        return int(season)
+        seasons = await self.cache.aget(LEAGUE_SEASONS_CACHE_KEY) or {}
+        if seasons.get(str(league_id)):
+            return seasons[str(league_id)]
+
+        season = await self.fixture_store.aget_league_season(league_id, dates)
+        if season:
+            return season
 
         # Fallback: extrai ano da primeira data
         if dates:
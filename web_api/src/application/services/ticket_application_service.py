@@ -4,7 +4,7 @@ Ticket Application Service - Lógica de aplicação para tickets.
 Orquestra operações de criação, busca e gestão de tickets.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import uuid
 import logging
 
@@ -12,6 +12,7 @@ from domain.models.ticket_model import Ticket
 from domain.models.bet_model import Bet
 from domain.enums.ticket_status_enum import TicketStatus
 from domain.enums.market_type_enum import MarketType
+from infrastructure.database.executor import run_in_db_executor
 from infrastructure.database.repositories.ticket_repository import TicketRepository
 from infrastructure.external.api_football.service import APIFootballService
 from domain.services.bet_result_service import BetResultService
@@ -54,8 +55,66 @@ class TicketApplicationService:
         Returns:
             Ticket criado
         """
-        # Cria ID único
-        ticket_id = str(uuid.uuid4())
+        ticket = self._build_ticket(name, bets_data, stake, bookmaker_id)
+
+        # Salva no banco (com o horário das partidas para a agenda de liquidação)
+        self.repository.create(ticket, self._get_kickoffs([ticket]))
+
+        logger.info(f"🎫 Ticket criado: {ticket.name} ({len(ticket.bets)} apostas, R$ {stake})")
+
+        return ticket
+
+    def create_tickets(self, tickets_data: List[dict]) -> List[Ticket]:
+        """
+        Cria vários tickets de uma vez (ex.: pré-bilhetes gerados em lote).
+
+        Todos os tickets são validados antes de gravar; a gravação é feita
+        em uma única transação (tudo ou nada).
+
+        Args:
+            tickets_data: Lista de dicts com name, bets, stake e bookmaker_id
+
+        Returns:
+            Tickets criados (na ordem recebida)
+
+        Raises:
+            ValueError: Se algum ticket for inválido (mensagem indica o índice)
+        """
+        tickets = []
+        for index, data in enumerate(tickets_data):
+            try:
+                tickets.append(self._build_ticket(
+                    name=data['name'],
+                    bets_data=data['bets'],
+                    stake=data['stake'],
+                    bookmaker_id=data['bookmaker_id']
+                ))
+            except ValueError as e:
+                raise ValueError(f"Ticket {index}: {e}")
+
+        self.repository.create_many(tickets, self._get_kickoffs(tickets))
+
+        logger.info(f"🎫 {len(tickets)} tickets criados em lote")
+
+        return tickets
+
+    def _build_ticket(
+        self,
+        name: str,
+        bets_data: List[dict],
+        stake: float,
+        bookmaker_id: str
+    ) -> Ticket:
+        """
+        Monta (e valida) um ticket PENDING com ID novo, sem gravar.
+
+        Raises:
+            ValueError: Se não houver apostas, a stake for inválida ou o mercado for desconhecido
+        """
+        if not bets_data:
+            raise ValueError("Bilhete precisa ter apostas")
+        if stake <= 0:
+            raise ValueError("Stake deve ser maior que zero")
 
         # Converte bets_data para objetos Bet
         bets = []
@@ -72,9 +131,8 @@ class TicketApplicationService:
             )
             bets.append(bet)
 
-        # Cria ticket
-        ticket = Ticket(
-            id=ticket_id,
+        return Ticket(
+            id=str(uuid.uuid4()),
             name=name,
             bets=bets,
             stake=stake,
@@ -82,12 +140,20 @@ class TicketApplicationService:
             status=TicketStatus.PENDING
         )
 
-        # Salva no banco
-        self.repository.create(ticket)
-
-        logger.info(f"🎫 Ticket criado: {ticket.name} ({len(bets)} apostas, R$ {stake})")
+    def _get_kickoffs(self, tickets: List[Ticket]) -> Dict[str, int]:
+        """
+        Horário de início das partidas dos tickets, a partir dos fixtures cacheados.
 
-        return ticket
+        Falha no cache não impede a criação: sem horário, a partida é
+        verificada já na próxima liquidação.
+        """
+        try:
+            return self.api_service.fixture_store.get_kickoffs(
+                [bet.match_id for ticket in tickets for bet in ticket.bets]
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Horário das partidas indisponível no cache: {e}")
+            return {}
 
     def get_ticket(self, ticket_id: str) -> Optional[Ticket]:
         """
@@ -114,6 +180,20 @@ class TicketApplicationService:
         """
         return self.repository.find_all(limit=limit, offset=offset)
 
+    def list_tickets_page(self, limit: int = 10, cursor: str = None, offset: int = 0) -> Tuple[List[Ticket], Optional[str]]:
+        """
+        Lista tickets com paginação por cursor.
+
+        Args:
+            limit: Número máximo de tickets
+            cursor: Cursor da página anterior (None = primeira página)
+            offset: Offset (compatibilidade, ignorado se houver cursor)
+
+        Returns:
+            Tupla (tickets, next_cursor)
+        """
+        return self.repository.find_page(limit=limit, cursor=cursor, offset=offset)
+
     def update_ticket_status(self, ticket_id: str, status: TicketStatus) -> bool:
         """
         Atualiza status de um ticket.
@@ -181,59 +261,69 @@ class TicketApplicationService:
 
         return ticket
 
-    def simulate_ticket_with_api(self, ticket_id: str) -> Ticket:
+    async def simulate_ticket_with_api(self, ticket_id: str) -> Tuple[Ticket, List[str]]:
         """
         Simula resultado de um ticket consultando a API Football.
 
-        Consulta resultados das partidas via APIFootballService
-        e determina automaticamente se cada aposta ganhou ou perdeu baseado no placar.
+        Busca os resultados de todas as partidas do ticket de uma vez
+        (APIFootballService.get_fixture_results_with_failures, lotes em paralelo)
+        e determina se cada aposta ganhou ou perdeu baseado no placar.
+
+        Apostas de partidas cujo lote falhou na API mantêm o resultado anterior
+        (não viram PENDING) e são devolvidas em unavailable_match_ids.
+
+        Leitura e gravação no SQLite rodam no executor dedicado
+        (run_in_db_executor), sem bloquear o event loop.
 
         Args:
             ticket_id: ID do ticket
 
         Returns:
-            Ticket atualizado com resultados
+            Tupla (ticket atualizado, IDs das partidas sem resposta da API)
+
+        Raises:
+            ValueError: Se o ticket não existir
         """
-        ticket = self.repository.find_by_id(ticket_id)
+        ticket = await run_in_db_executor(self.repository.find_by_id, ticket_id)
         if not ticket:
             raise ValueError(f"Ticket {ticket_id} não encontrado")
 
-        # Para cada aposta, consulta resultado da partida via API Football Service
-        import asyncio
+        results, failed_ids = await self.api_service.get_fixture_results_with_failures(
+            [bet.match_id for bet in ticket.bets]
+        )
+        failed = set(failed_ids)
 
-        async def process_bets():
-            for bet in ticket.bets:
-                # Consulta resultado da partida via API Football Service
-                fixture_result = await self.api_service.get_fixture_result(bet.match_id)
+        for bet in ticket.bets:
+            if str(bet.match_id) in failed:
+                # Falha na API ≠ partida não encerrada: mantém o resultado anterior
+                continue
 
-                if not fixture_result:
-                    logger.warning(f"⚠️ Não foi possível obter resultado da partida {bet.match_id}")
-                    bet.result = "PENDING"
-                    continue
+            fixture_result = results.get(str(bet.match_id))
 
-                # Determina se a aposta ganhou/perdeu baseado no placar
-                bet.result = BetResultService.determine_bet_result(
-                    fixture_result,
-                    bet.market.value,
-                    bet.predicted_outcome
-                )
+            if not fixture_result:
+                logger.warning(f"⚠️ Não foi possível obter resultado da partida {bet.match_id}")
+                bet.result = "PENDING"
+                continue
 
-                # Se partida terminou, salva o placar
-                if fixture_result.get("fixture", {}).get("status", {}).get("short") == "FT":
-                    home_goals = fixture_result.get("goals", {}).get("home")
-                    away_goals = fixture_result.get("goals", {}).get("away")
-                    if home_goals is not None and away_goals is not None:
-                        bet.final_score = BetResultService.format_score(home_goals, away_goals)
+            # Determina se a aposta ganhou/perdeu baseado no placar
+            bet.result = BetResultService.determine_bet_result(
+                fixture_result,
+                bet.market.value,
+                bet.predicted_outcome
+            )
 
-        # Executa de forma assíncrona
-        asyncio.run(process_bets())
+            # Se partida terminou, salva o placar
+            if fixture_result.get("fixture", {}).get("status", {}).get("short") == "FT":
+                home_goals = fixture_result.get("goals", {}).get("home")
+                away_goals = fixture_result.get("goals", {}).get("away")
+                if home_goals is not None and away_goals is not None:
+                    bet.final_score = BetResultService.format_score(home_goals, away_goals)
 
         # Atualiza status do ticket baseado nos resultados das bets
         ticket.update_status()
 
-        # Salva no banco
-        self.repository.update_status(ticket_id, ticket.status)
-        self.repository.update_bet_results(ticket_id, ticket.bets)
+        # Salva no banco (fora do event loop)
+        await run_in_db_executor(self._save_results, ticket)
 
         won_bets = sum(1 for bet in ticket.bets if bet.result == "WON")
         total_bets = len(ticket.bets)
@@ -242,6 +332,16 @@ class TicketApplicationService:
             f"⚽ Ticket {ticket_id} simulado via API Football: "
             f"{ticket.status.value} ({won_bets}/{total_bets} certas)"
         )
+        if failed_ids:
+            logger.warning(
+                f"⚠️ Ticket {ticket_id}: {len(failed_ids)} partidas sem resposta da API "
+                f"(resultado anterior mantido): {failed_ids}"
+            )
 
-        return ticket
+        return ticket, failed_ids
+
+    def _save_results(self, ticket: Ticket) -> None:
+        """Grava status e resultados das bets de um ticket (chamada síncrona)."""
+        self.repository.update_status(ticket.id, ticket.status)
+        self.repository.update_bet_results(ticket.id, ticket.bets)
 
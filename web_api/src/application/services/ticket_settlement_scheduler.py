@@ -0,0 +1,248 @@
+"""
+Ticket Settlement Scheduler - Liquidação de bilhetes pendentes no servidor.
+
+Uma task em background (iniciada no startup) roda
+TicketUpdaterService.update_pending_tickets com intervalo adaptativo:
+
+- Partida em andamento (1H/2H/HT/...) → TICKET_SETTLEMENT_LIVE_INTERVAL_SECONDS
+- Só partidas futuras → dorme até o próximo início (no máximo TICKET_SETTLEMENT_IDLE_INTERVAL_SECONDS)
+- Partida iniciada sem resultado final fora dos status ao vivo (adiada, sem dados), erro → TICKET_SETTLEMENT_DEFAULT_INTERVAL_SECONDS
+- Nenhum bilhete pendente, ou pendentes sem nenhuma partida na agenda → para até ser
+  acordado (wake) por um novo bilhete ou por POST /tickets/update-results
+
+Os clientes apenas leem os resultados persistidos (GET /tickets).
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from application.services.ticket_updater_service import TicketUpdaterService
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TicketSettlementScheduler:
+    """
+    Agendador da atualização de bilhetes pendentes.
+
+    Responsável por:
+    - Executar a liquidação em background (1 execução por vez)
+    - Escolher o próximo intervalo pelo estado das partidas
+    - Acordar imediatamente quando um bilhete é criado
+    """
+
+    def __init__(
+        self,
+        updater_service: TicketUpdaterService = None,
+        live_interval_seconds: int = None,
+        default_interval_seconds: int = None,
+        idle_interval_seconds: int = None
+    ):
+        self.updater_service = updater_service or TicketUpdaterService()
+        self.live_interval_seconds = live_interval_seconds or settings.TICKET_SETTLEMENT_LIVE_INTERVAL_SECONDS
+        self.default_interval_seconds = default_interval_seconds or settings.TICKET_SETTLEMENT_DEFAULT_INTERVAL_SECONDS
+        self.idle_interval_seconds = idle_interval_seconds or settings.TICKET_SETTLEMENT_IDLE_INTERVAL_SECONDS
+
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._run_lock: Optional[asyncio.Lock] = None
+
+        self._runs = 0
+        self._errors = 0
+        self._last_run_at: Optional[datetime] = None
+        self._last_stats: Optional[Dict[str, Any]] = None
+        self._next_delay: Optional[float] = None
+        self._next_run_mono: Optional[float] = None
+
+        # Intervalo já calculado por run_now: a task só reagenda (sem liquidar de novo)
+        self._reschedule_pending = False
+        self._rescheduled_delay: Optional[float] = None
+
+    # ========================================
+    # Controle
+    # ========================================
+
+    def start(self) -> None:
+        """Inicia a task de liquidação (idempotente)."""
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._run_lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+            logger.info("🧾 Agendador de liquidação de bilhetes iniciado")
+
+    def wake(self) -> None:
+        """Antecipa a próxima execução (ex.: bilhete criado)."""
+        self._reschedule_pending = False
+        if self._wake is not None:
+            self._wake.set()
+
+    def _reschedule(self, delay: Optional[float]) -> None:
+        """Troca o intervalo de espera da task sem disparar outra liquidação."""
+        self._rescheduled_delay = delay
+        self._reschedule_pending = True
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        """Para a task de liquidação (shutdown)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    # ========================================
+    # Execução
+    # ========================================
+
+    async def run_now(self) -> Dict[str, Any]:
+        """
+        Executa a liquidação imediatamente (aguardando a execução em andamento, se houver).
+
+        Returns:
+            Estatísticas de update_pending_tickets
+        """
+        if self._run_lock is None:
+            self._run_lock = asyncio.Lock()
+
+        async with self._run_lock:
+            try:
+                stats = await self.updater_service.update_pending_tickets()
+            except Exception:
+                self._errors += 1
+                raise
+
+            self._runs += 1
+            self._last_run_at = settings.now()
+            self._last_stats = stats
+
+        # Reagenda a task com base no novo estado (a liquidação já foi feita aqui)
+        self._reschedule(self.next_delay(stats))
+        return stats
+
+    async def _run(self) -> None:
+        delay = await self._settle()
+        while True:
+            self._next_delay = delay
+            self._next_run_mono = time.monotonic() + delay if delay is not None else None
+
+            if delay is None:
+                logger.info("🧾 Nada a liquidar — liquidação pausada até um novo bilhete")
+            else:
+                logger.info(f"🧾 Próxima liquidação em {delay:.0f}s")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            if self._reschedule_pending:
+                self._reschedule_pending = False
+                delay = self._rescheduled_delay
+                continue
+
+            delay = await self._settle()
+
+    async def _settle(self) -> Optional[float]:
+        """Executa 1 liquidação e retorna o próximo intervalo (None = aguardar wake)."""
+        async with self._run_lock:
+            try:
+                stats = await self.updater_service.update_pending_tickets()
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"❌ Erro na liquidação de bilhetes: {e}")
+                return float(self.default_interval_seconds)
+
+            self._runs += 1
+            self._last_run_at = settings.now()
+            self._last_stats = stats
+
+        return self.next_delay(stats)
+
+    def next_delay(self, stats: Dict[str, Any]) -> Optional[float]:
+        """
+        Calcula o intervalo até a próxima liquidação.
+
+        Args:
+            stats: Retorno de update_pending_tickets (still_pending, live_matches, due_matches, next_kickoff)
+
+        Returns:
+            Segundos até a próxima execução, ou None se não houver o que liquidar
+        """
+        if not stats.get("still_pending"):
+            return None
+
+        if stats.get("live_matches"):
+            return float(self.live_interval_seconds)
+
+        if stats.get("due_matches"):
+            return float(self.default_interval_seconds)
+
+        next_kickoff = stats.get("next_kickoff")
+        if next_kickoff:
+            until_kickoff = next_kickoff - time.time()
+            return float(min(max(until_kickoff, self.live_interval_seconds), self.idle_interval_seconds))
+
+        # Pendentes sem partida na agenda: repetir a execução não liquidaria nada
+        logger.warning(
+            f"⚠️ {stats['still_pending']} bilhete(s) pendente(s) sem partidas na agenda — "
+            f"liquidação pausada até um novo bilhete"
+        )
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado do agendador.
+
+        Returns:
+            Dicionário com execuções, último resultado e próxima execução
+        """
+        next_run_in = None
+        if self._next_run_mono is not None:
+            next_run_in = round(max(self._next_run_mono - time.monotonic(), 0.0), 1)
+
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "runs": self._runs,
+            "errors": self._errors,
+            "last_run_at": self._last_run_at.isoformat() if self._last_run_at else None,
+            "last_stats": self._last_stats,
+            "next_delay_seconds": self._next_delay,
+            "next_run_in_seconds": next_run_in,
+        }
+
+
+# Instância global (singleton)
+_settlement_scheduler: Optional[TicketSettlementScheduler] = None
+
+
+def get_ticket_settlement_scheduler() -> TicketSettlementScheduler:
+    """
+    Retorna o agendador global de liquidação de bilhetes (singleton).
+
+    Returns:
+        TicketSettlementScheduler instance
+    """
+    global _settlement_scheduler
+
+    if _settlement_scheduler is None:
+        _settlement_scheduler = TicketSettlementScheduler()
+
+    return _settlement_scheduler
+
+
+async def stop_ticket_settlement_scheduler() -> None:
+    """
+    Para o agendador global, se existir.
+
+    Chamado no shutdown da API.
+    """
+    if _settlement_scheduler is not None:
+        await _settlement_scheduler.stop()
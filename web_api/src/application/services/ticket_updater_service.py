@@ -2,24 +2,34 @@
 Ticket Updater Service - Atualiza bilhetes com resultados das partidas.
 
 Responsável por:
-- Buscar bilhetes pendentes
-- Consultar resultados das partidas
-- Atualizar status de cada aposta
+- Selecionar as partidas já iniciadas (agenda bet_fixture_schedule, por kickoff)
+- Consultar resultados dessas partidas (em lote, 1 vez por partida distinta)
+- Atualizar status de cada aposta dos bilhetes pendentes envolvidos
 - Calcular status final do bilhete
+
+O custo de cada liquidação depende das partidas ao vivo/encerradas, não do
+total de bilhetes pendentes: partidas futuras não são consultadas.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 import logging
+import time
 
 from domain.models.ticket_model import Ticket
 from domain.models.bet_model import Bet
 from domain.enums.ticket_status_enum import TicketStatus
 from domain.enums.market_type_enum import MarketType
+from domain.constants.constants import LIVE_STATUSES
+from infrastructure.database.executor import run_in_db_executor
 from infrastructure.database.repositories.ticket_repository import TicketRepository
 from infrastructure.external.api_football.service import APIFootballService
+from infrastructure.external.api_football.rate_limiter import RequestPriority, with_request_priority
 
 logger = logging.getLogger(__name__)
 
+# Status em que a partida tem resultado final (liquida as apostas)
+SETTLED_STATUSES = ("FT", "AET", "PEN")  # Full Time, After Extra Time, Penalties
+
 
 class TicketUpdaterService:
     """
@@ -33,19 +43,33 @@ class TicketUpdaterService:
         self.api_service = APIFootballService()
         logger.info("🔄 TicketUpdaterService inicializado")
 
+    @with_request_priority(RequestPriority.BACKGROUND)
     async def update_pending_tickets(self) -> Dict[str, Any]:
         """
-        Atualiza todos os bilhetes pendentes.
+        Atualiza os bilhetes pendentes com partidas já iniciadas.
+
+        Só as partidas da agenda com início <= agora (ou sem horário) são
+        consultadas, e só os bilhetes com aposta nelas são carregados.
 
         Returns:
-            Estatísticas da atualização
+            Estatísticas da atualização (inclui live_matches, due_matches e
+            next_kickoff, usados pelo TicketSettlementScheduler)
         """
-        logger.info("🔍 Buscando bilhetes pendentes...")
+        now_ts = int(time.time())
 
-        # Busca apenas tickets pendentes
-        pending_tickets = self.repository.find_pending()
+        # Partidas iniciadas com apostas pendentes
+        due_match_ids = await run_in_db_executor(self.repository.find_due_match_ids, now_ts)
+        logger.info(f"🔍 {len(due_match_ids)} partidas iniciadas com apostas pendentes")
 
-        logger.info(f"📋 {len(pending_tickets)} bilhetes pendentes encontrados")
+        pending_tickets: List[Ticket] = []
+        results: Dict[str, Dict[str, Any]] = {}
+
+        if due_match_ids:
+            # Resultados em lotes (GET /fixtures?ids=)
+            results = await self.api_service.get_fixture_results(due_match_ids)
+            pending_tickets = await run_in_db_executor(self.repository.find_pending_by_match_ids, due_match_ids)
+
+        logger.info(f"📋 {len(pending_tickets)} bilhetes pendentes a verificar")
 
         updated_count = 0
         won_count = 0
@@ -53,7 +77,7 @@ class TicketUpdaterService:
 
         for ticket in pending_tickets:
             try:
-                if await self._update_ticket_result(ticket):
+                if await self._update_ticket_result(ticket, results):
                     updated_count += 1
                     if ticket.status == TicketStatus.WON:
                         won_count += 1
@@ -64,13 +88,22 @@ class TicketUpdaterService:
 
         logger.info(f"✅ Atualização concluída: {updated_count} bilhetes atualizados ({won_count} ganhos, {lost_count} perdidos)")
 
+        await self._update_schedule(results, now_ts)
+        summary = await run_in_db_executor(self.repository.get_settlement_summary, now_ts)
+
         return {
             "total_pending": len(pending_tickets),
             "updated": updated_count,
             "won": won_count,
-            "lost": lost_count
+            "lost": lost_count,
+            "checked_matches": len(due_match_ids),
+            "still_pending": summary["pending_tickets"],
+            "live_matches": sum(1 for result in results.values() if self._status_short(result) in LIVE_STATUSES),
+            "due_matches": summary["due_matches"],
+            "next_kickoff": summary["next_kickoff"]
         }
 
+    @with_request_priority(RequestPriority.BACKGROUND)
     async def update_ticket(self, ticket_id: str) -> bool:
         """
         Atualiza um bilhete específico.
@@ -81,7 +114,7 @@ class TicketUpdaterService:
         Returns:
             True se atualizado com sucesso
         """
-        ticket = self.repository.find_by_id(ticket_id)
+        ticket = await run_in_db_executor(self.repository.find_by_id, ticket_id)
         if not ticket:
             logger.warning(f"⚠️ Ticket {ticket_id} não encontrado")
             return False
@@ -90,14 +123,32 @@ class TicketUpdaterService:
             logger.warning(f"⚠️ Ticket {ticket_id} não está pendente (status: {ticket.status.value})")
             return False
 
-        return await self._update_ticket_result(ticket)
+        results = await self._fetch_results([ticket])
+        updated = await self._update_ticket_result(ticket, results)
+        await self._update_schedule(results, int(time.time()))
+        return updated
 
-    async def _update_ticket_result(self, ticket: Ticket) -> bool:
+    async def _fetch_results(self, tickets: List[Ticket]) -> Dict[str, Dict[str, Any]]:
+        """
+        Busca os resultados das partidas distintas de todos os bilhetes.
+
+        Args:
+            tickets: Bilhetes a atualizar
+
+        Returns:
+            Dict[match_id, resultado da API]
+        """
+        match_ids = {str(bet.match_id) for ticket in tickets for bet in ticket.bets if bet.match_id}
+        logger.info(f"🔍 {len(match_ids)} partidas distintas em {len(tickets)} bilhetes")
+        return await self.api_service.get_fixture_results(sorted(match_ids))
+
+    async def _update_ticket_result(self, ticket: Ticket, results: Dict[str, Dict[str, Any]]) -> bool:
         """
         Atualiza resultado de um ticket baseado nos resultados das partidas.
 
         Args:
             ticket: Ticket a ser atualizado
+            results: Resultados já buscados (match_id → resultado da API)
 
         Returns:
             True se atualizado com sucesso
@@ -114,16 +165,23 @@ class TicketUpdaterService:
                 logger.info(f"   📍 Processando aposta: {bet.match_id} ({bet.home_team} vs {bet.away_team})")
                 logger.info(f"      Market: {bet.market.value}, Predicted: {bet.predicted_outcome}, Odds: {bet.odds}")
 
-                # Busca resultado da partida
-                logger.info(f"   🔍 Chamando get_fixture_result({bet.match_id})...")
-                match_result = await self.api_service.get_fixture_result(bet.match_id)
+                # Resultado da partida (buscado em lote)
+                match_result = results.get(str(bet.match_id))
 
-                logger.info(f"   📥 Resultado recebido: {match_result is not None}")
+                logger.info(f"   📥 Resultado disponível: {match_result is not None}")
                 if match_result:
-                    logger.info(f"   📄 Conteúdo: {match_result}")
+                    logger.debug(f"   📄 Conteúdo: {match_result}")
 
                 if not match_result:
-                    logger.warning(f"   ⏳ Partida {bet.match_id} ainda sem resultado (retornou None)")
+                    # Partida já liquidada em execução anterior (fora das consultadas agora);
+                    # "PENDING" (gravado na simulação) conta como sem resultado
+                    if not bet.is_pending():
+                        if bet.result == "LOST":
+                            any_lost = True
+                            all_won = False
+                        continue
+
+                    logger.debug(f"   ⏳ Partida {bet.match_id} sem resultado nesta verificação")
                     all_finished = False
                     continue
 
@@ -150,7 +208,7 @@ class TicketUpdaterService:
                     bet.goals_away = g_away
 
                 # Só processa resultado se a partida finalizou
-                if status not in ["FT", "AET", "PEN"]:  # Full Time, After Extra Time, Penalties
+                if status not in SETTLED_STATUSES:
                     logger.debug(f"   ⏳ Partida {bet.match_id} ainda não finalizou (status: {status})")
                     all_finished = False
                     continue
@@ -178,7 +236,7 @@ class TicketUpdaterService:
                 all_finished = False
 
         # Sempre persiste dados das bets (placar ao vivo, minuto, status)
-        self.repository.update_bet_results(ticket.id, ticket.bets)
+        await run_in_db_executor(self.repository.update_bet_results, ticket.id, ticket.bets)
 
         # Se nem todas as partidas finalizaram, não atualiza status do ticket
         if not all_finished:
@@ -194,10 +252,37 @@ class TicketUpdaterService:
             logger.info(f"💔 Ticket {ticket.id} PERDEU")
 
         # Atualiza status final no banco
-        self.repository.update_status(ticket.id, ticket.status)
+        await run_in_db_executor(self.repository.update_status, ticket.id, ticket.status)
 
         return True
 
+    async def _update_schedule(self, results: Dict[str, Dict[str, Any]], now_ts: int) -> None:
+        """
+        Atualiza a agenda de liquidação com os resultados consultados.
+
+        Remove as partidas encerradas (só as que não ficaram com aposta pendente,
+        ex.: falha ao gravar o resultado) e grava o novo horário das que ainda
+        não começaram (adiadas ou criadas sem horário conhecido).
+        """
+        finished = []
+        kickoffs = {}
+
+        for match_id, result in results.items():
+            status = self._status_short(result)
+            timestamp = (result.get("fixture") or {}).get("timestamp")
+
+            if status in SETTLED_STATUSES:
+                finished.append(match_id)
+            elif status in ("NS", "TBD") and timestamp:
+                kickoffs[match_id] = int(timestamp)
+
+        await run_in_db_executor(self.repository.update_fixture_schedule, kickoffs, finished, now_ts)
+
+    @staticmethod
+    def _status_short(result: Dict[str, Any]) -> str:
+        """Status curto da partida (ex.: NS, 1H, FT) no resultado da API."""
+        return ((result.get("fixture") or {}).get("status") or {}).get("short", "NS")
+
     def _check_bet_result(self, bet: Bet, home_score: int, away_score: int, match_result: Dict[str, Any]) -> bool:
         """
         Verifica se uma aposta foi ganha baseado no resultado da partida.
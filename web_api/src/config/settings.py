@@ -31,6 +31,61 @@ class Settings(BaseSettings):
     API_FOOTBALL_BASE_URL: str = "https://v3.football.api-sports.io"
     """URL base da API-Football"""
 
+    # Pool HTTP da API-Football (httpx.AsyncClient compartilhado)
+    API_FOOTBALL_TIMEOUT: float = 30.0
+    """Timeout (segundos) das requisições à API-Football"""
+
+    API_FOOTBALL_MAX_CONNECTIONS: int = 20
+    """Máximo de conexões simultâneas no pool HTTP"""
+
+    API_FOOTBALL_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    """Máximo de conexões ociosas mantidas abertas (keep-alive)"""
+
+    API_FOOTBALL_KEEPALIVE_EXPIRY: float = 60.0
+    """Tempo (segundos) que uma conexão ociosa fica aberta"""
+
+    API_FOOTBALL_HTTP2: bool = False
+    """Usa HTTP/2 (requer o pacote h2: pip install httpx[http2])"""
+
+    # Paginação (/odds)
+    API_FOOTBALL_PAGE_CONCURRENCY: int = 5
+    """Máximo de páginas buscadas em paralelo em get_all_pages"""
+
+    API_FOOTBALL_PAGE_RETRIES: int = 2
+    """Tentativas extras por página em caso de erro"""
+
+    API_FOOTBALL_PAGE_RETRY_BACKOFF: float = 1.0
+    """Espera base (segundos) entre tentativas — dobra a cada retry"""
+
+    API_FOOTBALL_IDS_BATCH_SIZE: int = 20
+    """Máximo de IDs por request em GET /fixtures?ids= (limite da API-Football)"""
+
+    # Rate limit / quota da API-Football
+    API_FOOTBALL_RATE_LIMIT_ENABLED: bool = True
+    """Ativa o token bucket por minuto (o orçamento diário é sempre contabilizado)"""
+
+    API_FOOTBALL_REQUESTS_PER_MINUTE: int = 300
+    """Requests por minuto (recalibrado pelo header X-RateLimit-Limit)"""
+
+    API_FOOTBALL_RATE_BURST: int = 10
+    """Máximo de requests liberados de uma vez (capacidade do bucket)"""
+
+    API_FOOTBALL_DAILY_BUDGET: int = 7500
+    """Requests por dia (recalibrado pelo header x-ratelimit-requests-limit)"""
+
+    API_FOOTBALL_DAILY_RESERVE: int = 200
+    """Requests diários reservados para chamadas interativas/ao vivo (preload não usa)"""
+
+    # Jogos ao vivo (poller compartilhado)
+    LIVE_POLL_INTERVAL_SECONDS: int = 10
+    """Intervalo entre polls de GET /fixtures?live=all"""
+
+    LIVE_POLL_IDLE_TIMEOUT_SECONDS: int = 60
+    """Poller para após esse tempo sem leitores/assinantes"""
+
+    LIVE_STREAM_KEEPALIVE_SECONDS: int = 15
+    """Intervalo dos comentários de keep-alive no stream SSE"""
+
     # Cache TTLs (em segundos)
     CACHE_TTL_FIXTURES: int = 21600  # 6 horas
     """TTL para fixtures no cache"""
@@ -48,6 +103,61 @@ class Settings(BaseSettings):
     TICKETS_DATABASE_PATH: str = "data/tickets.db"
     """Caminho do banco SQLite de tickets"""
 
+    TICKETS_BULK_MAX: int = 1000
+    """Máximo de tickets por chamada de POST /tickets/bulk"""
+
+    DB_EXECUTOR_MAX_WORKERS: int = 4
+    """Threads do executor dedicado ao I/O SQLite (cache.db e tickets.db)"""
+
+    # Monitor do event loop
+    EVENT_LOOP_MONITOR_INTERVAL_SECONDS: float = 0.1
+    """Intervalo da sonda de lag do event loop"""
+
+    EVENT_LOOP_STALL_THRESHOLD_MS: int = 100
+    """Lag a partir do qual o loop é considerado travado (contado e logado)"""
+
+    # Liquidação de bilhetes (background)
+    TICKET_SETTLEMENT_ENABLED: bool = True
+    """Liquida bilhetes pendentes em background (clientes só leem os resultados)"""
+
+    TICKET_SETTLEMENT_LIVE_INTERVAL_SECONDS: int = 60
+    """Intervalo enquanto houver partida em andamento"""
+
+    TICKET_SETTLEMENT_DEFAULT_INTERVAL_SECONDS: int = 300
+    """Intervalo com pendentes sem partida ao vivo nem início conhecido (ou após erro)"""
+
+    TICKET_SETTLEMENT_IDLE_INTERVAL_SECONDS: int = 3600
+    """Espera máxima quando o próximo início está distante"""
+
+    # Prefetch de odds por liga (após o preload de fixtures)
+    ODDS_PREFETCH_ENABLED: bool = True
+    """Aquece odds_league:* das ligas mais relevantes ao fim do preload de fixtures"""
+
+    ODDS_PREFETCH_MAX_LEAGUES: int = 10
+    """Ligas aquecidas por preload (as primeiras por fixtures + popularidade)"""
+
+    ODDS_PREFETCH_CONCURRENCY: int = 3
+    """Ligas carregadas em paralelo"""
+
+    ODDS_PREFETCH_MIN_DAILY_REMAINING: int = 1000
+    """Orçamento diário mínimo para continuar o prefetch (preserva quota para o uso interativo)"""
+
+    # Cache SQLite (conexões)
+    CACHE_POOLED_CONNECTIONS: bool = True
+    """Reutiliza 1 conexão persistente por thread (WAL + synchronous=NORMAL)"""
+
+    CACHE_SQLITE_CACHE_SIZE_KB: int = 16384  # 16 MB
+    """Tamanho do page cache de cada conexão do cache (PRAGMA cache_size)"""
+
+    CACHE_SQLITE_MMAP_SIZE: int = 268435456  # 256 MB
+    """Tamanho do memory-mapped I/O do cache (PRAGMA mmap_size)"""
+
+    CACHE_L1_MAX_ENTRIES: int = 256
+    """Máximo de entradas no cache em memória (L1) na frente do SQLite (0 desativa)"""
+
+    CACHE_FIXTURES_STORAGE: str = "normalized"
+    """Armazenamento de fixtures: 'normalized' (1 linha por fixture) ou 'blob' (1 JSON por dia)"""
+
     # Servidor
     HOST: str = "0.0.0.0"
     """Host do servidor"""
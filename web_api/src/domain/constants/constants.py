@@ -8,6 +8,9 @@ Constants - Constantes do sistema
 # Status que indicam partida ativa (não começou ou em andamento)
 ACTIVE_STATUSES = {"NS", "1H", "2H", "HT", "ET", "BT", "P", "SUSP", "INT", "LIVE", "TBD"}
 
+# Status que indicam partida em andamento (bola rolando ou intervalo)
+LIVE_STATUSES = {"1H", "2H", "HT", "ET", "BT", "P", "SUSP", "INT", "LIVE"}
+
 # Status que indicam partida encerrada
 FINISHED_STATUSES = {"FT", "AET", "PEN", "WO", "AWD", "CANC", "ABD", "PST"}
 
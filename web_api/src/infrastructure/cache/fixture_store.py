@@ -0,0 +1,603 @@
+"""
+Fixture Store - Persistência de fixtures no cache.
+
+Dois modos de armazenamento (CACHE_FIXTURES_STORAGE):
+
+- "normalized" (padrão): 1 linha por fixture na tabela fixtures
+  (id, date, league_id, season, status_short, kickoff, payload).
+  Filtros por liga/status/season viram consultas SQL indexadas e
+  só os fixtures necessários são decodificados. As listas decodificadas
+  de get_day/get_active ficam no L1 (fixtures:{date}:rows / :active:*),
+  invalidadas por save_day, apply_live_updates e clear.
+
+- "blob" (legado): todos os fixtures de um dia no blob fixtures:{date}
+  (SQLiteCacheManager), com o índice secundário fixture_index
+  mapeando fixture_id → (data, posição) para busca por ID em O(1).
+
+Os métodos a* (aget_day, afind_by_id, ...) são as versões awaitable,
+executadas no executor dedicado do SQLite (run_in_db_executor).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import json
+import logging
+
+from infrastructure.cache.sqlite_cache_manager import IN_CHUNK_SIZE, SQLiteCacheManager, get_cache
+from infrastructure.database.executor import run_in_db_executor
+from config.settings import settings
+from domain.constants.constants import ACTIVE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_KEY_PREFIX = "fixtures:"
+
+STORAGE_BLOB = "blob"
+STORAGE_NORMALIZED = "normalized"
+
+
+def _kickoff_timestamp(fixture: Dict[str, Any]) -> Optional[int]:
+    """Extrai o horário de início (Unix timestamp) do campo date do fixture."""
+    try:
+        return int(datetime.fromisoformat(fixture.get("date") or "").timestamp())
+    except ValueError:
+        return None
+
+
+def _season(fixture: Dict[str, Any]) -> Optional[int]:
+    """Extrai a season da liga do fixture."""
+    season = (fixture.get("league") or {}).get("season")
+    try:
+        return int(season) if season else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _apply_live_data(fixture: Dict[str, Any], live_data: Dict[str, Any]) -> bool:
+    """
+    Copia status, minuto e placar ao vivo para o fixture cacheado.
+
+    Returns:
+        True se algum dos campos mudou (precisa regravar)
+    """
+    before = (fixture.get("status"), fixture.get("status_short"), fixture.get("elapsed"), fixture.get("goals"))
+
+    fixture["status"] = live_data.get("status", fixture.get("status"))
+    fixture["status_short"] = live_data.get("status_short", fixture.get("status_short"))
+    fixture["elapsed"] = live_data.get("elapsed")
+    fixture["goals"] = live_data.get("goals", fixture.get("goals", {}))
+
+    return (fixture["status"], fixture["status_short"], fixture["elapsed"], fixture["goals"]) != before
+
+
+class FixtureStore:
+    """
+    Acesso aos fixtures cacheados.
+
+    Responsável por:
+    - Gravar/ler fixtures de um dia
+    - Buscar fixture por ID
+    - Consultas por liga, status e season
+    - Aplicar dados ao vivo em fixtures já cacheados
+    """
+
+    def __init__(self, cache: SQLiteCacheManager = None, storage: str = None):
+        self.cache = cache or get_cache()
+        self.storage = storage or settings.CACHE_FIXTURES_STORAGE
+        self.normalized = self.storage == STORAGE_NORMALIZED
+
+    @staticmethod
+    def day_key(date_str: str) -> str:
+        """Chave do blob de fixtures de um dia (modo blob)."""
+        return f"{FIXTURES_KEY_PREFIX}{date_str}"
+
+    # ========================================
+    # Dia inteiro
+    # ========================================
+
+    def save_day(
+        self,
+        date_str: str,
+        fixtures: List[Dict[str, Any]],
+        ttl_seconds: int = None,
+        reindex: bool = True
+    ) -> None:
+        """
+        Grava os fixtures de um dia (substitui o dia inteiro).
+
+        Args:
+            date_str: Data YYYY-MM-DD
+            fixtures: Lista de fixtures parseados
+            ttl_seconds: TTL (padrão: CACHE_TTL_FIXTURES)
+            reindex: Modo blob — False quando só o conteúdo mudou (mesmos IDs nas mesmas posições)
+        """
+        ttl_seconds = ttl_seconds or settings.CACHE_TTL_FIXTURES
+        expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+
+        if self.normalized:
+            self._save_day_rows(date_str, fixtures, expires_at)
+            self._invalidate_day(date_str)
+            return
+
+        self.cache.set(self.day_key(date_str), fixtures, ttl_seconds=ttl_seconds)
+
+        if not reindex:
+            with self.cache.connection() as conn:
+                conn.execute(
+                    "UPDATE fixture_index SET expires_at = ? WHERE date = ?",
+                    (expires_at, date_str)
+                )
+                conn.commit()
+            return
+
+        rows = [
+            (str(f.get("id")), date_str, position, expires_at)
+            for position, f in enumerate(fixtures)
+        ]
+
+        with self.cache.connection() as conn:
+            conn.execute("DELETE FROM fixture_index WHERE date = ?", (date_str,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO fixture_index (fixture_id, date, position, expires_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+        logger.debug(f"🗂️ Índice de fixtures atualizado: {date_str} ({len(rows)} fixtures)")
+
+    def _save_day_rows(self, date_str: str, fixtures: List[Dict[str, Any]], expires_at: datetime) -> None:
+        """Grava os fixtures de um dia na tabela normalizada (1 transação)."""
+        rows = [
+            (
+                str(f.get("id")),
+                date_str,
+                str((f.get("league") or {}).get("id", "")),
+                _season(f),
+                f.get("status_short") or "NS",
+                _kickoff_timestamp(f),
+                position,
+                json.dumps(f),
+                expires_at,
+            )
+            for position, f in enumerate(fixtures)
+        ]
+
+        with self.cache.connection() as conn:
+            conn.execute("DELETE FROM fixtures WHERE date = ?", (date_str,))
+            conn.executemany("""
+                INSERT OR REPLACE INTO fixtures
+                    (id, date, league_id, season, status_short, kickoff, position, payload, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
+        logger.debug(f"🗂️ Fixtures gravados (normalizado): {date_str} ({len(rows)} fixtures)")
+
+    def get_day(self, date_str: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lê todos os fixtures de um dia.
+
+        Returns:
+            Lista de fixtures ou None se não cacheado/expirado
+        """
+        if not self.normalized:
+            return self.cache.get(self.day_key(date_str))
+
+        fixtures = self._query_payloads_l1(
+            f"{self.day_key(date_str)}:rows", "date = ?", (date_str,), order_by="position"
+        )
+        return fixtures or None
+
+    def get_active(self, date_str: str, league_id: str = None) -> List[Dict[str, Any]]:
+        """
+        Lê os fixtures ativos (não encerrados) de um dia, opcionalmente de uma liga.
+
+        Args:
+            date_str: Data YYYY-MM-DD
+            league_id: ID da liga (opcional)
+
+        Returns:
+            Lista de fixtures ativos
+        """
+        if not self.normalized:
+            fixtures = self.cache.get(self.day_key(date_str)) or []
+            return [
+                f for f in fixtures
+                if f.get("status_short", "NS") in ACTIVE_STATUSES
+                and (league_id is None or str(f.get("league", {}).get("id", "")) == str(league_id))
+            ]
+
+        statuses = sorted(ACTIVE_STATUSES)
+        where = f"date = ? AND status_short IN ({','.join('?' * len(statuses))})"
+        params: List[Any] = [date_str, *statuses]
+        if league_id is not None:
+            where += " AND league_id = ?"
+            params.append(str(league_id))
+
+        l1_key = f"{self.day_key(date_str)}:active:{league_id if league_id is not None else '*'}"
+        return self._query_payloads_l1(l1_key, where, tuple(params), order_by="position")
+
+    def clear(self) -> None:
+        """Remove todos os fixtures cacheados (blobs, índice e tabela normalizada)."""
+        self.cache.delete_by_prefix(FIXTURES_KEY_PREFIX)
+
+        with self.cache.connection() as conn:
+            conn.execute("DELETE FROM fixture_index")
+            conn.execute("DELETE FROM fixtures")
+            conn.commit()
+
+    # ========================================
+    # Busca por ID
+    # ========================================
+
+    def find_location(self, fixture_id: str) -> Optional[Tuple[str, int]]:
+        """
+        Consulta a data e a posição de um fixture.
+
+        Returns:
+            Tupla (data YYYY-MM-DD, posição no dia) ou None
+        """
+        table, id_column = ("fixtures", "id") if self.normalized else ("fixture_index", "fixture_id")
+
+        with self.cache.connection() as conn:
+            row = conn.execute(
+                f"SELECT date, position FROM {table} WHERE {id_column} = ? AND expires_at > ?",
+                (str(fixture_id), datetime.now())
+            ).fetchone()
+
+        return (row[0], row[1]) if row else None
+
+    def find_by_id(self, fixture_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Busca um fixture por ID.
+
+        Returns:
+            Fixture ou None se não estiver cacheado
+        """
+        if self.normalized:
+            fixtures = self._query_payloads("id = ?", (str(fixture_id),))
+            return fixtures[0] if fixtures else None
+
+        location = self.find_location(fixture_id)
+        if not location:
+            return None
+
+        date_str, position = location
+        fixtures = self.get_day(date_str)
+        if not fixtures:
+            return None
+
+        fixture_id = str(fixture_id)
+        if position < len(fixtures) and str(fixtures[position].get("id")) == fixture_id:
+            return fixtures[position]
+
+        # Índice desatualizado em relação ao blob: procura no próprio dia
+        return next((f for f in fixtures if str(f.get("id")) == fixture_id), None)
+
+    def filter_loaded(self, fixture_ids: Iterable[str]) -> Set[str]:
+        """
+        Filtra os IDs que estão carregados no cache (não expirados).
+
+        Consulta indexada pela chave primária (fixtures no modo normalized,
+        fixture_index no modo blob), mantida por save_day/clear: o custo
+        depende só da quantidade de IDs, não de quantos dias estão cacheados.
+
+        Args:
+            fixture_ids: IDs a verificar (ex.: jogos ao vivo da API)
+
+        Returns:
+            Subconjunto dos IDs carregados
+        """
+        ids = sorted({str(fixture_id) for fixture_id in fixture_ids})
+        table, id_column = ("fixtures", "id") if self.normalized else ("fixture_index", "fixture_id")
+        now = datetime.now()
+        loaded: Set[str] = set()
+
+        with self.cache.connection() as conn:
+            for i in range(0, len(ids), IN_CHUNK_SIZE):
+                chunk = ids[i:i + IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT {id_column} FROM {table} "
+                    f"WHERE {id_column} IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+                loaded.update(row[0] for row in rows)
+
+        return loaded
+
+    def get_kickoffs(self, fixture_ids: List[str]) -> Dict[str, int]:
+        """
+        Busca o horário de início de vários fixtures.
+
+        Usado na criação de tickets (agenda de liquidação por kickoff).
+        O horário não depende do TTL: linhas expiradas ainda são aproveitadas.
+
+        Args:
+            fixture_ids: IDs dos fixtures
+
+        Returns:
+            Dict[fixture_id, Unix timestamp] (só os fixtures cacheados)
+        """
+        ids = sorted({str(fixture_id) for fixture_id in fixture_ids})
+        if not ids:
+            return {}
+
+        if not self.normalized:
+            kickoffs = {}
+            for fixture_id in ids:
+                fixture = self.find_by_id(fixture_id)
+                kickoff = _kickoff_timestamp(fixture) if fixture else None
+                if kickoff is not None:
+                    kickoffs[fixture_id] = kickoff
+            return kickoffs
+
+        kickoffs = {}
+        with self.cache.connection() as conn:
+            for i in range(0, len(ids), IN_CHUNK_SIZE):
+                chunk = ids[i:i + IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT id, kickoff FROM fixtures WHERE id IN ({','.join('?' * len(chunk))}) "
+                    "AND kickoff IS NOT NULL",
+                    chunk
+                ).fetchall()
+                kickoffs.update({row[0]: int(row[1]) for row in rows})
+
+        return kickoffs
+
+    # ========================================
+    # Consultas por liga
+    # ========================================
+
+    def league_has_fixtures_on_date(self, league_id: str, date_str: str) -> bool:
+        """Verifica se uma liga tem fixtures em uma data."""
+        if not self.normalized:
+            fixtures = self.cache.get(self.day_key(date_str))
+            if not fixtures:
+                return False
+            return any(
+                str(f.get("league", {}).get("id", "")) == str(league_id)
+                for f in fixtures
+            )
+
+        with self.cache.connection() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM fixtures WHERE date = ? AND league_id = ? AND expires_at > ? LIMIT 1",
+                (date_str, str(league_id), datetime.now())
+            ).fetchone()
+
+        return row is not None
+
+    def get_league_season(self, league_id: str, dates: List[str]) -> Optional[int]:
+        """
+        Busca a season de uma liga nos fixtures cacheados das datas informadas.
+
+        Returns:
+            Ano da season ou None se não houver fixture da liga com season
+        """
+        if not self.normalized:
+            for date_str in dates:
+                fixtures = self.cache.get(self.day_key(date_str))
+                if not fixtures:
+                    continue
+                for fixture in fixtures:
+                    if str(fixture.get("league", {}).get("id", "")) == str(league_id):
+                        season = _season(fixture)
+                        if season:
+                            return season
+            return None
+
+        if not dates:
+            return None
+
+        with self.cache.connection() as conn:
+            row = conn.execute(f"""
+                SELECT season FROM fixtures
+                WHERE league_id = ? AND date IN ({','.join('?' * len(dates))})
+                  AND season IS NOT NULL AND expires_at > ?
+                ORDER BY date
+                LIMIT 1
+            """, (str(league_id), *dates, datetime.now())).fetchone()
+
+        return int(row[0]) if row else None
+
+    # ========================================
+    # Ao vivo
+    # ========================================
+
+    def apply_live_updates(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Aplica os dados ao vivo (status, minuto, placar) de um poll inteiro.
+
+        Só os fixtures cujos dados mudaram são regravados:
+        - normalized: 1 SELECT (IN) + 1 executemany UPDATE, em 1 transação
+        - blob: agrupa por dia e regrava cada blob afetado uma única vez
+
+        Args:
+            updates: Dict[fixture_id, dados ao vivo] (fixtures não cacheados são ignorados)
+
+        Returns:
+            Número de fixtures alterados
+        """
+        updates = {str(fixture_id): live_data for fixture_id, live_data in updates.items()}
+        if not updates:
+            return 0
+
+        if self.normalized:
+            return self._apply_live_rows(updates)
+
+        return self._apply_live_blobs(updates)
+
+    def _apply_live_rows(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """apply_live_updates na tabela normalizada (apenas as linhas alteradas)."""
+        ids = list(updates)
+        now = datetime.now()
+        changed = []
+        changed_dates: Set[str] = set()
+
+        with self.cache.connection() as conn:
+            for i in range(0, len(ids), IN_CHUNK_SIZE):
+                chunk = ids[i:i + IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT id, date, payload FROM fixtures WHERE id IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+
+                for fixture_id, date_str, payload in rows:
+                    fixture = json.loads(payload)
+                    if _apply_live_data(fixture, updates[fixture_id]):
+                        changed.append((fixture["status_short"] or "NS", json.dumps(fixture), fixture_id))
+                        changed_dates.add(date_str)
+
+            if changed:
+                conn.executemany("UPDATE fixtures SET status_short = ?, payload = ? WHERE id = ?", changed)
+                conn.commit()
+
+        for date_str in changed_dates:
+            self._invalidate_day(date_str)
+
+        return len(changed)
+
+    def _apply_live_blobs(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """apply_live_updates no modo blob (cada dia afetado é regravado 1 vez)."""
+        ids = list(updates)
+        now = datetime.now()
+        positions_by_date: Dict[str, List[Tuple[str, int]]] = {}
+
+        with self.cache.connection() as conn:
+            for i in range(0, len(ids), IN_CHUNK_SIZE):
+                chunk = ids[i:i + IN_CHUNK_SIZE]
+                rows = conn.execute(
+                    f"SELECT fixture_id, date, position FROM fixture_index "
+                    f"WHERE fixture_id IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now)
+                ).fetchall()
+                for fixture_id, date_str, position in rows:
+                    positions_by_date.setdefault(date_str, []).append((fixture_id, position))
+
+        changed_count = 0
+        for date_str, positions in positions_by_date.items():
+            cached = self.get_day(date_str)
+            if not cached:
+                continue
+
+            # Cópia: a lista do get_day é compartilhada com o L1 (leitores não
+            # podem ver o dia parcialmente atualizado antes do save_day)
+            fixtures = [dict(f) for f in cached]
+
+            changed = 0
+            for fixture_id, position in positions:
+                if position < len(fixtures) and str(fixtures[position].get("id")) == fixture_id:
+                    fixture = fixtures[position]
+                else:
+                    # Índice desatualizado em relação ao blob: procura no próprio dia
+                    fixture = next((f for f in fixtures if str(f.get("id")) == fixture_id), None)
+
+                if fixture is not None and _apply_live_data(fixture, updates[fixture_id]):
+                    changed += 1
+
+            if changed:
+                # Posições não mudam: regrava só o blob, sem reindexar
+                self.save_day(date_str, fixtures, reindex=False)
+                changed_count += changed
+
+        return changed_count
+
+    # ========================================
+    # Async (executor dedicado)
+    # ========================================
+
+    async def asave_day(self, date_str: str, fixtures: List[Dict[str, Any]], ttl_seconds: int = None) -> None:
+        """Versão awaitable de save_day()."""
+        await run_in_db_executor(self.save_day, date_str, fixtures, ttl_seconds)
+
+    async def aget_day(self, date_str: str) -> Optional[List[Dict[str, Any]]]:
+        """Versão awaitable de get_day() (hit no L1 é respondido direto no loop)."""
+        if self.normalized:
+            fixtures = self.cache.get_l1(f"{self.day_key(date_str)}:rows")
+            if fixtures is not None:
+                return fixtures or None
+        return await run_in_db_executor(self.get_day, date_str)
+
+    async def aget_active(self, date_str: str, league_id: str = None) -> List[Dict[str, Any]]:
+        """Versão awaitable de get_active()."""
+        return await run_in_db_executor(self.get_active, date_str, league_id)
+
+    async def afind_by_id(self, fixture_id: str) -> Optional[Dict[str, Any]]:
+        """Versão awaitable de find_by_id()."""
+        return await run_in_db_executor(self.find_by_id, fixture_id)
+
+    async def afilter_loaded(self, fixture_ids: Iterable[str]) -> Set[str]:
+        """Versão awaitable de filter_loaded()."""
+        return await run_in_db_executor(self.filter_loaded, list(fixture_ids))
+
+    async def aget_kickoffs(self, fixture_ids: List[str]) -> Dict[str, int]:
+        """Versão awaitable de get_kickoffs()."""
+        return await run_in_db_executor(self.get_kickoffs, fixture_ids)
+
+    async def aclear(self) -> None:
+        """Versão awaitable de clear()."""
+        await run_in_db_executor(self.clear)
+
+    async def aleague_has_fixtures_on_date(self, league_id: str, date_str: str) -> bool:
+        """Versão awaitable de league_has_fixtures_on_date()."""
+        return await run_in_db_executor(self.league_has_fixtures_on_date, league_id, date_str)
+
+    async def aget_league_season(self, league_id: str, dates: List[str]) -> Optional[int]:
+        """Versão awaitable de get_league_season()."""
+        return await run_in_db_executor(self.get_league_season, league_id, dates)
+
+    async def aapply_live_updates(self, updates: Dict[str, Dict[str, Any]]) -> int:
+        """Versão awaitable de apply_live_updates()."""
+        return await run_in_db_executor(self.apply_live_updates, updates)
+
+    # ========================================
+    # Helpers
+    # ========================================
+
+    def _invalidate_day(self, date_str: str) -> None:
+        """Remove do L1 as listas decodificadas do dia (modo normalizado)."""
+        self.cache.delete_l1_by_prefix(f"{self.day_key(date_str)}:")
+
+    def _query_payloads_l1(
+        self,
+        l1_key: str,
+        where: str,
+        params: tuple,
+        order_by: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        _query_payloads com a lista decodificada guardada no L1.
+
+        O TTL no L1 acompanha o expires_at mais próximo das linhas lidas.
+        Lista vazia não é guardada (dia ainda não carregado).
+        """
+        fixtures = self.cache.get_l1(l1_key)
+        if fixtures is not None:
+            return fixtures
+
+        sql = f"SELECT payload, expires_at FROM fixtures WHERE {where} AND expires_at > ?"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+
+        now = datetime.now()
+        with self.cache.connection() as conn:
+            rows = conn.execute(sql, (*params, now)).fetchall()
+
+        fixtures = [json.loads(row[0]) for row in rows]
+        if rows:
+            expires_at = datetime.fromisoformat(str(min(row[1] for row in rows)))
+            self.cache.set_l1(l1_key, fixtures, (expires_at - now).total_seconds())
+
+        return fixtures
+
+    def _query_payloads(self, where: str, params: tuple, order_by: str = None) -> List[Dict[str, Any]]:
+        """Executa SELECT payload na tabela normalizada (ignorando expirados)."""
+        sql = f"SELECT payload FROM fixtures WHERE {where} AND expires_at > ?"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+
+        with self.cache.connection() as conn:
+            rows = conn.execute(sql, (*params, datetime.now())).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
@@ -0,0 +1,92 @@
+"""
+LRU Cache - Cache em memória (L1) com limite de tamanho e TTL por entrada.
+
+Fica na frente do SQLiteCacheManager (L2): chaves quentes são servidas
+sem tocar no disco nem no json.loads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class LRUCache:
+    """
+    Cache LRU em memória, thread-safe.
+
+    - Limite de entradas (remove a menos usada recentemente)
+    - TTL por entrada (espelha o expires_at do L2)
+    - Valores são compartilhados por referência: quem altera um valor
+      retornado deve gravá-lo de volta com set()
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Busca valor em memória.
+
+        Returns:
+            Valor ou None se não existir/expirado
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """
+        Salva valor em memória.
+
+        Args:
+            key: Chave
+            value: Valor (já decodificado)
+            ttl_seconds: Tempo de vida restante em segundos
+        """
+        if self.max_entries <= 0 or ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl_seconds)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove uma chave da memória"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_by_prefix(self, prefix: str) -> int:
+        """
+        Remove todas as chaves que começam com o prefixo.
+
+        Returns:
+            Número de entradas removidas
+        """
+        with self._lock:
+            keys = [k for k in self._entries if k.startswith(prefix)]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Limpa toda a memória"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,179 @@
+"""
+Odds Store - Gravação incremental (delta) das odds no cache.
+
+Os endpoints bulk da API-Football (GET /odds?date= e GET /odds?league=&date=)
+devolvem todas as odds a cada download, mas poucas mudam entre dois refreshes.
+save_bulk compara o parse novo com o que está no cache (odds:{fixture_id},
+inclusive entradas já expiradas) e, em 1 transação:
+
+- regrava só os fixtures cujas odds mudaram
+- renova o TTL dos demais sem regravar o valor
+- regrava a chave bulk (odds_date:* / odds_league:*) só se o conteúdo mudou
+- registra o instante da última mudança de cada fixture (tabela odds_changes)
+
+changed_since(T) responde "quais odds mudaram desde T".
+
+Os métodos a* são as versões awaitable, executadas no executor dedicado
+do SQLite (run_in_db_executor).
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import time
+
+from config.settings import settings
+from infrastructure.cache.sqlite_cache_manager import IN_CHUNK_SIZE, SQLiteCacheManager, get_cache
+from infrastructure.database.executor import run_in_db_executor
+
+logger = logging.getLogger(__name__)
+
+ODDS_KEY_PREFIX = "odds:"
+
+# Mudanças mais antigas que isso são descartadas de odds_changes
+CHANGES_RETENTION_SECONDS = 86400
+
+
+class OddsStore:
+    """
+    Acesso às odds cacheadas por fixture.
+
+    Responsável por:
+    - Gravar apenas as odds alteradas (delta) em 1 transação
+    - Manter o instante da última mudança por fixture
+    - Listar as odds alteradas desde um instante
+    """
+
+    def __init__(self, cache: SQLiteCacheManager = None):
+        self.cache = cache or get_cache()
+
+    @staticmethod
+    def odds_key(fixture_id: Any) -> str:
+        return f"{ODDS_KEY_PREFIX}{fixture_id}"
+
+    def save_bulk(
+        self,
+        bulk_key: Optional[str],
+        odds_by_fixture: Dict[str, Dict[str, Any]],
+        ttl_seconds: int = None
+    ) -> int:
+        """
+        Grava as odds de um lote, regravando só o que mudou.
+
+        Args:
+            bulk_key: Chave bulk (odds_date:* / odds_league:*) ou None para gravar
+                apenas por fixture (resultado parcial, fixture individual)
+            odds_by_fixture: Dict[fixture_id, odds por bookmaker]
+            ttl_seconds: TTL (padrão: CACHE_TTL_ODDS)
+
+        Returns:
+            Número de fixtures cujas odds mudaram (ou são novas)
+        """
+        ttl_seconds = ttl_seconds or settings.CACHE_TTL_ODDS
+        expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+        changed_at = time.time()
+
+        keys = [self.odds_key(fixture_id) for fixture_id in odds_by_fixture]
+        changed: Dict[str, Dict[str, Any]] = {}
+        bulk_changed = False
+
+        with self.cache.connection() as conn:
+            previous: Dict[str, str] = {}
+            for i in range(0, len(keys), IN_CHUNK_SIZE):
+                chunk = keys[i:i + IN_CHUNK_SIZE]
+                previous.update(conn.execute(
+                    f"SELECT key, value FROM cache WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall())
+
+            unchanged = []
+            for fixture_id, odds in odds_by_fixture.items():
+                key = self.odds_key(fixture_id)
+                old = previous.get(key)
+                if old is not None and json.loads(old) == odds:
+                    unchanged.append((expires_at, key))
+                else:
+                    changed[str(fixture_id)] = odds
+
+            if changed:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    [(self.odds_key(fixture_id), json.dumps(odds), expires_at) for fixture_id, odds in changed.items()]
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO odds_changes (fixture_id, changed_at) VALUES (?, ?)",
+                    [(fixture_id, changed_at) for fixture_id in changed]
+                )
+            if unchanged:
+                conn.executemany("UPDATE cache SET expires_at = ? WHERE key = ?", unchanged)
+
+            if bulk_key:
+                row = conn.execute("SELECT value FROM cache WHERE key = ?", (bulk_key,)).fetchone()
+                bulk_changed = bool(changed) or row is None or json.loads(row[0]) != odds_by_fixture
+                if bulk_changed:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (bulk_key, json.dumps(odds_by_fixture), expires_at)
+                    )
+                else:
+                    conn.execute("UPDATE cache SET expires_at = ? WHERE key = ?", (expires_at, bulk_key))
+
+            conn.execute(
+                "DELETE FROM odds_changes WHERE changed_at < ?",
+                (changed_at - CHANGES_RETENTION_SECONDS,)
+            )
+            conn.commit()
+
+        # Write-through no L1 (só o que foi regravado)
+        for fixture_id, odds in changed.items():
+            self.cache.set_l1(self.odds_key(fixture_id), odds, ttl_seconds)
+        if bulk_changed:
+            self.cache.set_l1(bulk_key, odds_by_fixture, ttl_seconds)
+
+        logger.debug(
+            f"💾 Odds delta{f' ({bulk_key})' if bulk_key else ''}: "
+            f"{len(changed)}/{len(odds_by_fixture)} fixtures alterados"
+        )
+        return len(changed)
+
+    def changed_since(self, since: float) -> List[Dict[str, Any]]:
+        """
+        Lista as odds (ainda válidas no cache) que mudaram depois de `since`.
+
+        Args:
+            since: Unix timestamp
+
+        Returns:
+            Lista de {fixture_id, changed_at (Unix timestamp), odds}, da mudança mais antiga para a mais recente
+        """
+        with self.cache.connection() as conn:
+            rows = conn.execute("""
+                SELECT c.fixture_id, c.changed_at, cache.value
+                FROM odds_changes c
+                JOIN cache ON cache.key = ? || c.fixture_id
+                WHERE c.changed_at > ? AND cache.expires_at > ?
+                ORDER BY c.changed_at
+            """, (ODDS_KEY_PREFIX, since, datetime.now())).fetchall()
+
+        return [
+            {"fixture_id": fixture_id, "changed_at": changed_at, "odds": json.loads(value)}
+            for fixture_id, changed_at, value in rows
+        ]
+
+    # ========================================
+    # Async (executor dedicado)
+    # ========================================
+
+    async def asave_bulk(
+        self,
+        bulk_key: Optional[str],
+        odds_by_fixture: Dict[str, Dict[str, Any]],
+        ttl_seconds: int = None
+    ) -> int:
+        """Versão awaitable de save_bulk()."""
+        return await run_in_db_executor(self.save_bulk, bulk_key, odds_by_fixture, ttl_seconds)
+
+    async def achanged_since(self, since: float) -> List[Dict[str, Any]]:
+        """Versão awaitable de changed_since()."""
+        return await run_in_db_executor(self.changed_since, since)
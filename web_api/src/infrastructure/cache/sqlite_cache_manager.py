@@ -2,17 +2,48 @@
 SQLite Cache Manager - Cache persistente com banco de dados.
 
 Substitui o cache em memória por um cache persistente usando SQLite.
+
+Modo pooled (padrão): cada thread reutiliza uma conexão persistente com
+journal WAL e synchronous=NORMAL, evitando connect/close + fsync por chave.
+
+Dois níveis:
+- L1: LRU em memória (valores já decodificados, TTL espelha expires_at).
+  Os valores são devolvidos por referência: copie antes de alterar e regravar
+- L2: tabela cache no SQLite (JSON)
+
+Leituras/gravações de várias chaves usam get_many/set_many (IN em lotes
+e executemany em 1 transação), em vez de 1 get/set por chave.
+
+Código async deve usar os métodos aget/aset/adelete/adelete_by_prefix:
+o acesso ao SQLite roda no executor dedicado (run_in_db_executor),
+sem bloquear o event loop.
 """
 
 import sqlite3
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
 import logging
 
+from config.settings import settings
+from infrastructure.cache.lru_cache import LRUCache
+from infrastructure.database.executor import run_in_db_executor
+
 logger = logging.getLogger(__name__)
 
+# PRAGMAs padrão das conexões persistentes
+DEFAULT_CACHE_SIZE_KB = 16384       # 16 MB de page cache por conexão
+DEFAULT_MMAP_SIZE = 268435456       # 256 MB de memory-mapped I/O
+
+# Entradas mantidas no L1 (LRU em memória)
+DEFAULT_L1_MAX_ENTRIES = 256
+
+# Máximo de parâmetros por IN (...) — abaixo do limite padrão do SQLite (999)
+IN_CHUNK_SIZE = 500
+
 
 class SQLiteCacheManager:
     """
@@ -21,9 +52,18 @@ class SQLiteCacheManager:
     - Cache sobrevive a reinicializações
     - TTL automático
     - Limpeza de expirados
+    - Conexões persistentes por thread (modo pooled) com WAL
+    - L1 em memória (LRU) na frente do SQLite, com write-through
     """
 
-    def __init__(self, db_path: str = None):
+    def __init__(
+        self,
+        db_path: str = None,
+        pooled: bool = True,
+        cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+        mmap_size: int = DEFAULT_MMAP_SIZE,
+        l1_max_entries: int = DEFAULT_L1_MAX_ENTRIES
+    ):
         # Define caminho padrão: web_api/data/cache.db
         if db_path is None:
             # Obtém caminho da pasta web_api (2 níveis acima de src/)
@@ -32,6 +72,20 @@ class SQLiteCacheManager:
             db_path = str(web_api_root / "data" / "cache.db")
 
         self.db_path = db_path
+        self.pooled = pooled
+        self.cache_size_kb = cache_size_kb
+        self.mmap_size = mmap_size
+
+        # Conexões persistentes (1 por thread) — só usadas no modo pooled
+        self._local = threading.local()
+        self._pool: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+
+        # L1: LRU em memória (0 desativa)
+        self._l1 = LRUCache(max_entries=l1_max_entries)
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
 
         # Cria diretório se não existir
         try:
@@ -42,7 +96,90 @@ class SQLiteCacheManager:
             logger.error(f"❌ Erro ao criar pasta de dados: {e}")
             raise
 
-        logger.info(f"📦 SQLiteCacheManager inicializado: {db_path}")
+        mode = "pooled/WAL" if pooled else "conexão por operação"
+        logger.info(f"📦 SQLiteCacheManager inicializado: {db_path} ({mode})")
+
+    # ========================================
+    # Conexões
+    # ========================================
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """
+        Abre uma nova conexão com o banco de cache.
+
+        No modo pooled aplica os PRAGMAs de performance:
+        - journal_mode=WAL: leitores não bloqueiam o escritor
+        - synchronous=NORMAL: fsync só no checkpoint do WAL
+        - cache_size / mmap_size: mantém páginas quentes em memória
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=not self.pooled)
+
+        if self.pooled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kb)}")
+            conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Fornece uma conexão com o banco de cache.
+
+        - Modo pooled: reutiliza a conexão persistente da thread atual
+        - Modo legado: abre uma conexão nova e fecha ao final
+        - Exceção dentro do bloco: rollback da transação aberta (a conexão
+          pooled não pode levar escrita pela metade para a próxima operação)
+
+        Uso:
+            with cache.connection() as conn:
+                conn.execute(...)
+        """
+        if not self.pooled:
+            conn = self._open_connection()
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+            return
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.conn = conn
+            with self._pool_lock:
+                self._pool.append(conn)
+
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+
+    def close(self) -> None:
+        """
+        Fecha todas as conexões persistentes do pool.
+
+        Chamado no shutdown da aplicação.
+        """
+        with self._pool_lock:
+            connections, self._pool = self._pool, []
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # Conexão de outra thread já finalizada
+
+        self._local = threading.local()
+
+        if connections:
+            logger.info(f"🔌 {len(connections)} conexões do cache fechadas")
 
     def init_tables(self):
         """
@@ -52,33 +189,94 @@ class SQLiteCacheManager:
         É IDEMPOTENTE: pode ser executado múltiplas vezes.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Tabela principal de cache
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS cache (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
-                    expires_at TIMESTAMP NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Índice para otimizar busca por expiração
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_cache_expires 
-                ON cache(expires_at)
-            """)
-
-            conn.commit()
-            conn.close()
+            with self.connection() as conn:
+                self._create_tables(conn)
 
             logger.info("✅ Tabelas de cache criadas/verificadas")
         except Exception as e:
             logger.error(f"❌ Erro ao criar tabelas de cache: {e}")
             raise
 
+    def _create_tables(self, conn: sqlite3.Connection):
+        """Cria as tabelas e índices do banco de cache."""
+        cursor = conn.cursor()
+
+        # Tabela principal de cache
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at TIMESTAMP NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Índice para otimizar busca por expiração
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cache_expires 
+            ON cache(expires_at)
+        """)
+
+        # Índice fixture_id → (data, posição no blob fixtures:{date})
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fixture_index (
+                fixture_id TEXT PRIMARY KEY,
+                date TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                expires_at TIMESTAMP NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fixture_index_date
+            ON fixture_index(date)
+        """)
+
+        # Fixtures normalizados (1 linha por fixture, payload JSON)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fixtures (
+                id TEXT PRIMARY KEY,
+                date TEXT NOT NULL,
+                league_id TEXT NOT NULL,
+                season INTEGER,
+                status_short TEXT NOT NULL,
+                kickoff INTEGER,
+                position INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                expires_at TIMESTAMP NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fixtures_date_status
+            ON fixtures(date, status_short)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fixtures_league_date
+            ON fixtures(league_id, date)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fixtures_kickoff
+            ON fixtures(kickoff)
+        """)
+
+        # Última mudança das odds de cada fixture (OddsStore)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS odds_changes (
+                fixture_id TEXT PRIMARY KEY,
+                changed_at REAL NOT NULL
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_odds_changes_changed_at
+            ON odds_changes(changed_at)
+        """)
+
+        conn.commit()
+
     def get(self, key: str) -> Optional[Any]:
         """
         Busca valor do cache.
@@ -89,24 +287,42 @@ class SQLiteCacheManager:
         Returns:
             Valor cacheado ou None se não existir/expirado
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
-            (key, datetime.now())
-        )
-
-        result = cursor.fetchone()
-        conn.close()
+        # L1: memória
+        value = self._l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+            logger.debug(f"✅ Cache HIT (L1): {key}")
+            return value
+
+        # L2: SQLite
+        now = datetime.now()
+        with self.connection() as conn:
+            result = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
 
         if result:
-            logger.debug(f"✅ Cache HIT: {key}")
-            return json.loads(result[0])
+            self._l2_hits += 1
+            logger.debug(f"✅ Cache HIT (L2): {key}")
+            value = json.loads(result[0])
+            self._l1.set(key, value, self._remaining_ttl(result[1], now))
+            return value
         else:
+            self._misses += 1
             logger.debug(f"❌ Cache MISS: {key}")
             return None
 
+    @staticmethod
+    def _remaining_ttl(expires_at: Any, now: datetime) -> float:
+        """Calcula o TTL restante (segundos) a partir do expires_at do L2."""
+        if not isinstance(expires_at, datetime):
+            try:
+                expires_at = datetime.fromisoformat(str(expires_at))
+            except ValueError:
+                return 0.0
+        return (expires_at - now).total_seconds()
+
     def set(self, key: str, value: Any, ttl_seconds: int = 21600) -> None:
         """
         Salva valor no cache.
@@ -118,19 +334,131 @@ class SQLiteCacheManager:
         """
         expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
-            (key, json.dumps(value), expires_at)
-        )
+        with self.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at)
+            )
+            conn.commit()
 
-        conn.commit()
-        conn.close()
+        # Write-through no L1
+        self._l1.set(key, value, ttl_seconds)
 
         logger.debug(f"💾 Cache SET: {key} (TTL: {ttl_seconds}s)")
 
+    def get_many(self, keys: Iterable[str], promote: bool = True) -> Dict[str, Any]:
+        """
+        Busca várias chaves do cache de uma vez.
+
+        Chaves no L1 são respondidas da memória; as demais em consultas
+        IN (lotes de IN_CHUNK_SIZE) na mesma conexão.
+
+        Args:
+            keys: Chaves do cache
+            promote: Copia os hits do L2 para o L1. Leituras em massa (milhares
+                de chaves) devem passar False para não esvaziar o LRU
+
+        Returns:
+            Dict[chave, valor] só com as chaves existentes e válidas
+        """
+        found: Dict[str, Any] = {}
+        pending: List[str] = []
+
+        # L1: memória
+        for key in dict.fromkeys(keys):
+            value = self._l1.get(key)
+            if value is not None:
+                found[key] = value
+            else:
+                pending.append(key)
+        self._l1_hits += len(found)
+
+        # L2: SQLite
+        l2_hits = 0
+        if pending:
+            now = datetime.now()
+            with self.connection() as conn:
+                for i in range(0, len(pending), IN_CHUNK_SIZE):
+                    chunk = pending[i:i + IN_CHUNK_SIZE]
+                    rows = conn.execute(
+                        f"SELECT key, value, expires_at FROM cache "
+                        f"WHERE key IN ({','.join('?' * len(chunk))}) AND expires_at > ?",
+                        (*chunk, now)
+                    ).fetchall()
+                    for key, raw, expires_at in rows:
+                        value = json.loads(raw)
+                        if promote:
+                            self._l1.set(key, value, self._remaining_ttl(expires_at, now))
+                        found[key] = value
+                    l2_hits += len(rows)
+
+        self._l2_hits += l2_hits
+        self._misses += len(pending) - l2_hits
+
+        logger.debug(f"✅ Cache GET_MANY: {len(found)} hits, {len(pending) - l2_hits} misses")
+        return found
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: int = 21600) -> None:
+        """
+        Salva várias chaves no cache em 1 transação (executemany).
+
+        Args:
+            items: Dict[chave, valor]
+            ttl_seconds: Tempo de vida em segundos, o mesmo para todas (padrão: 6 horas)
+        """
+        if not items:
+            return
+
+        expires_at = datetime.now() + timedelta(seconds=ttl_seconds)
+
+        with self.connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(value), expires_at) for key, value in items.items()]
+            )
+            conn.commit()
+
+        # Write-through no L1
+        for key, value in items.items():
+            self._l1.set(key, value, ttl_seconds)
+
+        logger.debug(f"💾 Cache SET_MANY: {len(items)} chaves (TTL: {ttl_seconds}s)")
+
+    def set_l1(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """
+        Atualiza só o L1 (após gravação direta na tabela cache, ex.: OddsStore).
+
+        Args:
+            key: Chave do cache
+            value: Valor já gravado no L2
+            ttl_seconds: TTL gravado no L2
+        """
+        self._l1.set(key, value, ttl_seconds)
+
+    def get_l1(self, key: str) -> Optional[Any]:
+        """
+        Busca só no L1 (valores derivados que não existem no L2, ex.: FixtureStore).
+
+        Args:
+            key: Chave do L1
+
+        Returns:
+            Valor ou None se não estiver em memória/expirado
+        """
+        value = self._l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+        return value
+
+    def delete_l1_by_prefix(self, prefix: str) -> None:
+        """
+        Invalida só no L1 as chaves com o prefixo (após gravação direta em outra tabela).
+
+        Args:
+            prefix: Prefixo das chaves
+        """
+        self._l1.delete_by_prefix(prefix)
+
     def has(self, key: str) -> bool:
         """
         Verifica se chave existe no cache (e não expirou).
@@ -145,25 +473,21 @@ class SQLiteCacheManager:
 
     def delete(self, key: str) -> None:
         """Remove uma chave do cache"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM cache WHERE key = ?", (key,))
+        with self.connection() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            conn.commit()
 
-        conn.commit()
-        conn.close()
+        self._l1.delete(key)
 
         logger.debug(f"🗑️ Cache DELETE: {key}")
 
     def clear(self) -> None:
         """Limpa todo o cache"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM cache")
+        with self.connection() as conn:
+            conn.execute("DELETE FROM cache")
+            conn.commit()
 
-        conn.commit()
-        conn.close()
+        self._l1.clear()
 
         logger.info("🗑️ Cache limpo completamente")
 
@@ -177,14 +501,12 @@ class SQLiteCacheManager:
         Returns:
             Número de entradas removidas
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM cache WHERE key LIKE ?", (f"{prefix}%",))
+        with self.connection() as conn:
+            cursor = conn.execute("DELETE FROM cache WHERE key LIKE ?", (f"{prefix}%",))
+            deleted = cursor.rowcount
+            conn.commit()
 
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        self._l1.delete_by_prefix(prefix)
 
         if deleted > 0:
             logger.info(f"🗑️ {deleted} entradas removidas com prefixo '{prefix}'")
@@ -198,23 +520,73 @@ class SQLiteCacheManager:
         Returns:
             Número de entradas removidas
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "DELETE FROM cache WHERE expires_at < ?",
-            (datetime.now(),)
-        )
-
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM cache WHERE expires_at < ?",
+                (datetime.now(),)
+            )
+            deleted = cursor.rowcount
+            conn.commit()
 
         if deleted > 0:
             logger.info(f"🗑️ {deleted} entradas expiradas removidas")
 
         return deleted
 
+    # ========================================
+    # Async (executor dedicado)
+    # ========================================
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        Versão awaitable de get().
+
+        Hit no L1 é respondido direto no loop; só o L2 vai para o executor.
+        """
+        value = self._l1.get(key)
+        if value is not None:
+            self._l1_hits += 1
+            return value
+
+        return await run_in_db_executor(self.get, key)
+
+    async def aset(self, key: str, value: Any, ttl_seconds: int = 21600) -> None:
+        """Versão awaitable de set()."""
+        await run_in_db_executor(self.set, key, value, ttl_seconds)
+
+    async def aget_many(self, keys: Iterable[str], promote: bool = True) -> Dict[str, Any]:
+        """
+        Versão awaitable de get_many().
+
+        Se todas as chaves estiverem no L1, responde direto no loop.
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for key in keys:
+            value = self._l1.get(key)
+            if value is None:
+                return await run_in_db_executor(self.get_many, keys, promote)
+            found[key] = value
+
+        self._l1_hits += len(found)
+        return found
+
+    async def aset_many(self, items: Dict[str, Any], ttl_seconds: int = 21600) -> None:
+        """Versão awaitable de set_many()."""
+        await run_in_db_executor(self.set_many, items, ttl_seconds)
+
+    async def adelete(self, key: str) -> None:
+        """Versão awaitable de delete()."""
+        await run_in_db_executor(self.delete, key)
+
+    async def adelete_by_prefix(self, prefix: str) -> int:
+        """Versão awaitable de delete_by_prefix()."""
+        return await run_in_db_executor(self.delete_by_prefix, prefix)
+
+    async def aget_stats(self) -> dict:
+        """Versão awaitable de get_stats()."""
+        return await run_in_db_executor(self.get_stats)
+
     def get_stats(self) -> dict:
         """
         Retorna estatísticas do cache.
@@ -222,26 +594,30 @@ class SQLiteCacheManager:
         Returns:
             Dicionário com estatísticas
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            # Total de chaves
+            total_keys = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
 
-        # Total de chaves
-        cursor.execute("SELECT COUNT(*) FROM cache")
-        total_keys = cursor.fetchone()[0]
+            # Chaves expiradas
+            expired_keys = conn.execute(
+                "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
+                (datetime.now(),)
+            ).fetchone()[0]
 
-        # Chaves expiradas
-        cursor.execute(
-            "SELECT COUNT(*) FROM cache WHERE expires_at < ?",
-            (datetime.now(),)
-        )
-        expired_keys = cursor.fetchone()[0]
-
-        conn.close()
+        lookups = self._l1_hits + self._l2_hits + self._misses
 
         return {
             "total_keys": total_keys,
             "valid_keys": total_keys - expired_keys,
-            "expired_keys": expired_keys
+            "expired_keys": expired_keys,
+            "pooled": self.pooled,
+            "pooled_connections": len(self._pool),
+            "l1_entries": len(self._l1),
+            "l1_hits": self._l1_hits,
+            "l2_hits": self._l2_hits,
+            "misses": self._misses,
+            "l1_hit_ratio": self._l1_hits / lookups if lookups else 0.0,
+            "l2_hit_ratio": self._l2_hits / lookups if lookups else 0.0,
         }
 
 
@@ -259,7 +635,12 @@ def get_cache() -> SQLiteCacheManager:
     global _cache_instance
 
     if _cache_instance is None:
-        _cache_instance = SQLiteCacheManager()
+        _cache_instance = SQLiteCacheManager(
+            pooled=settings.CACHE_POOLED_CONNECTIONS,
+            cache_size_kb=settings.CACHE_SQLITE_CACHE_SIZE_KB,
+            mmap_size=settings.CACHE_SQLITE_MMAP_SIZE,
+            l1_max_entries=settings.CACHE_L1_MAX_ENTRIES
+        )
 
     return _cache_instance
 
@@ -60,6 +60,8 @@ class DatabaseConnection:
         Tabelas:
         - tickets: Bilhetes de apostas
         - bets: Apostas individuais (foreign key para tickets)
+        - ticket_stats: Estatísticas agregadas (dashboard)
+        - bet_fixture_schedule: Partidas com apostas pendentes, por horário de início
         """
         conn = self.get_connection()
         cursor = conn.cursor()
@@ -121,27 +123,140 @@ class DatabaseConnection:
         except sqlite3.OperationalError:
             pass
 
+        # Odd combinada do ticket (usada no lucro das estatísticas) — migração + backfill
+        try:
+            cursor.execute("ALTER TABLE tickets ADD COLUMN combined_odds REAL")
+        except sqlite3.OperationalError:
+            pass
+        self._backfill_combined_odds(cursor)
+
+        # Estatísticas agregadas (1 linha), mantidas pelo TicketRepository
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ticket_stats (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_tickets INTEGER NOT NULL DEFAULT 0,
+                pending_tickets INTEGER NOT NULL DEFAULT 0,
+                won_tickets INTEGER NOT NULL DEFAULT 0,
+                lost_tickets INTEGER NOT NULL DEFAULT 0,
+                partially_won_tickets INTEGER NOT NULL DEFAULT 0,
+                total_staked REAL NOT NULL DEFAULT 0,
+                total_bets INTEGER NOT NULL DEFAULT 0,
+                total_profit REAL NOT NULL DEFAULT 0
+            )
+        """)
+        if cursor.execute("SELECT 1 FROM ticket_stats WHERE id = 1").fetchone() is None:
+            self.rebuild_stats(cursor)
+
         # Índices para performance
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_tickets_status 
             ON tickets(status)
         """)
 
+        # Paginação por cursor (keyset): ORDER BY created_at DESC, id DESC
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_tickets_created_at 
-            ON tickets(created_at DESC)
+            CREATE INDEX IF NOT EXISTS idx_tickets_created_at_id
+            ON tickets(created_at DESC, id DESC)
         """)
 
+        # Substituído por idx_tickets_created_at_id
+        cursor.execute("DROP INDEX IF EXISTS idx_tickets_created_at")
+
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_bets_ticket_id 
             ON bets(ticket_id)
         """)
 
+        # Bilhetes pendentes de uma partida (liquidação por partida)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_bets_match_id
+            ON bets(match_id)
+        """)
+
+        # Agenda de liquidação: 1 linha por partida com aposta pendente,
+        # removida quando a partida termina (kickoff NULL = horário desconhecido)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS bet_fixture_schedule (
+                match_id TEXT PRIMARY KEY,
+                kickoff INTEGER
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_bet_fixture_schedule_kickoff
+            ON bet_fixture_schedule(kickoff)
+        """)
+
+        # Partidas de tickets pendentes criados antes da agenda (sem horário)
+        cursor.execute("""
+            INSERT OR IGNORE INTO bet_fixture_schedule (match_id, kickoff)
+            SELECT DISTINCT b.match_id, NULL
+            FROM bets b
+            JOIN tickets t ON t.id = b.ticket_id
+            WHERE t.status = 'PENDING' AND (b.result IS NULL OR b.result = 'PENDING')
+        """)
+
         conn.commit()
         conn.close()
 
         logger.info("✅ Tabelas de tickets criadas")
 
+    @staticmethod
+    def _backfill_combined_odds(cursor: sqlite3.Cursor) -> None:
+        """Preenche combined_odds (produto das odds das bets) dos tickets antigos."""
+        rows = cursor.execute("""
+            SELECT t.id, b.odds
+            FROM tickets t
+            LEFT JOIN bets b ON b.ticket_id = t.id
+            WHERE t.combined_odds IS NULL
+        """).fetchall()
+
+        if not rows:
+            return
+
+        combined = {}
+        for ticket_id, odds in rows:
+            combined[ticket_id] = combined.get(ticket_id, 1.0) * (odds if odds is not None else 1.0)
+
+        cursor.executemany(
+            "UPDATE tickets SET combined_odds = ? WHERE id = ?",
+            [(value, ticket_id) for ticket_id, value in combined.items()]
+        )
+        logger.info(f"🔧 combined_odds preenchido em {len(combined)} tickets")
+
+    @staticmethod
+    def rebuild_stats(cursor: sqlite3.Cursor) -> None:
+        """
+        Recalcula a linha de ticket_stats a partir de tickets/bets (full scan).
+
+        Usado na criação da tabela; depois disso o TicketRepository mantém
+        os valores incrementalmente. Lucro: WON = stake × (odd - 1),
+        LOST / PARTIALLY_WON = -stake, PENDING = 0.
+        """
+        cursor.execute("DELETE FROM ticket_stats")
+        cursor.execute("""
+            INSERT INTO ticket_stats (
+                id, total_tickets, pending_tickets, won_tickets, lost_tickets,
+                partially_won_tickets, total_staked, total_bets, total_profit
+            )
+            SELECT
+                1,
+                COUNT(*),
+                COALESCE(SUM(status = 'PENDING'), 0),
+                COALESCE(SUM(status = 'WON'), 0),
+                COALESCE(SUM(status = 'LOST'), 0),
+                COALESCE(SUM(status = 'PARTIALLY_WON'), 0),
+                COALESCE(SUM(stake), 0),
+                (SELECT COUNT(*) FROM bets WHERE ticket_id IN (SELECT id FROM tickets)),
+                COALESCE(SUM(CASE status
+                    WHEN 'WON' THEN stake * (COALESCE(combined_odds, 1) - 1)
+                    WHEN 'LOST' THEN -stake
+                    WHEN 'PARTIALLY_WON' THEN -stake
+                    ELSE 0
+                END), 0)
+            FROM tickets
+        """)
+        logger.info("📊 Estatísticas de tickets recalculadas")
+
 
 # Instância global (singleton)
 _db_instance: Optional[DatabaseConnection] = None
@@ -0,0 +1,168 @@
+"""
+DB Executor - Thread pool dedicado para o I/O SQLite (cache.db e tickets.db).
+
+O sqlite3 é bloqueante: executado direto em um handler async, um fsync lento
+(ex.: delete_by_prefix("fixtures:")) congela todas as requests e o poller
+ao vivo. run_in_db_executor() move a chamada para um pool limitado
+(DB_EXECUTOR_MAX_WORKERS) e devolve um awaitable.
+
+- Pool separado do executor padrão do asyncio (não disputa com to_thread/DNS)
+- Poucas threads: o SQLite serializa escritas, e o cache pooled abre
+  1 conexão por thread
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DBExecutor:
+    """
+    ThreadPoolExecutor limitado com métricas de fila.
+
+    Responsável por:
+    - Executar chamadas SQLite síncronas fora do event loop
+    - Medir espera na fila e tempo de execução
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max(max_workers or settings.DB_EXECUTOR_MAX_WORKERS, 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sqlite")
+
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._calls = 0
+        self._errors = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Executa fn(*args, **kwargs) no pool e aguarda o resultado.
+
+        Args:
+            fn: Função síncrona (acessa o SQLite)
+
+        Returns:
+            Retorno de fn
+        """
+        call = functools.partial(self._timed, fn, args, kwargs, time.perf_counter())
+
+        with self._lock:
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(call)
+        except RuntimeError:
+            # Executor já encerrado (shutdown)
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        # Cancelada ainda na fila (task cancelada): _timed não roda para descontar
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._pending -= 1
+
+    def _timed(self, fn: Callable[..., T], args: tuple, kwargs: dict, submitted: float) -> T:
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            finished = time.perf_counter()
+            wait, run = started - submitted, finished - started
+            with self._lock:
+                self._pending -= 1
+                self._calls += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+                self._run_total += run
+                self._run_max = max(self._run_max, run)
+
+    def shutdown(self) -> None:
+        """Aguarda as chamadas em andamento e encerra as threads."""
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas do pool.
+
+        Returns:
+            Dicionário com workers, fila e tempos (ms)
+        """
+        with self._lock:
+            calls = self._calls
+            return {
+                "max_workers": self.max_workers,
+                "pending": self._pending,
+                "calls": calls,
+                "errors": self._errors,
+                "avg_wait_ms": round(self._wait_total / calls * 1000, 3) if calls else 0.0,
+                "max_wait_ms": round(self._wait_max * 1000, 3),
+                "avg_run_ms": round(self._run_total / calls * 1000, 3) if calls else 0.0,
+                "max_run_ms": round(self._run_max * 1000, 3),
+            }
+
+
+# Instância global (singleton)
+_db_executor: Optional[DBExecutor] = None
+
+
+def get_db_executor() -> DBExecutor:
+    """
+    Retorna o executor global do SQLite (singleton).
+
+    Returns:
+        DBExecutor instance
+    """
+    global _db_executor
+
+    if _db_executor is None:
+        _db_executor = DBExecutor()
+        logger.info(f"🧵 DB executor iniciado ({_db_executor.max_workers} threads)")
+
+    return _db_executor
+
+
+async def run_in_db_executor(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Executa uma chamada SQLite síncrona no executor dedicado.
+
+    Example:
+        tickets = await run_in_db_executor(repository.find_pending)
+    """
+    return await get_db_executor().run(fn, *args, **kwargs)
+
+
+def shutdown_db_executor() -> None:
+    """
+    Encerra o executor global, se existir.
+
+    Chamado no shutdown da API, antes de fechar as conexões do cache.
+    """
+    global _db_executor
+
+    if _db_executor is not None:
+        _db_executor.shutdown()
+        _db_executor = None
+        logger.info("🧵 DB executor encerrado")
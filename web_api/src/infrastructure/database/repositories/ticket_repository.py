@@ -4,11 +4,14 @@ Ticket Repository - CRUD de tickets no SQLite.
 Implementa operações de persistência para tickets e bets.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
+import base64
+import json
+import sqlite3
 import logging
 
-from infrastructure.database.connection import get_database
+from infrastructure.database.connection import DatabaseConnection, get_database
 from domain.models.ticket_model import Ticket
 from domain.models.bet_model import Bet
 from domain.enums.ticket_status_enum import TicketStatus
@@ -22,10 +25,159 @@ _MARKET_ALIASES = {
 }
 
 
+# Lookup direto string → MarketType (inclui aliases)
+_MARKETS = {m.value: m for m in MarketType}
+_MARKETS.update({alias: MarketType(value) for alias, value in _MARKET_ALIASES.items()})
+
+# Máximo de parâmetros por IN (...) — abaixo do limite padrão do SQLite (999)
+_IN_CHUNK_SIZE = 500
+
+_TICKET_COLUMNS = "id, name, stake, bookmaker_id, status, created_at"
+
+# Mesma ordem dos campos do dataclass Bet (ver _row_to_bet)
+_BET_COLUMNS = """match_id, home_team, away_team, league, market, predicted_outcome,
+                  odds, confidence, result, final_score, status, status_short,
+                  elapsed, goals_home, goals_away"""
+
+
+# Aposta ainda sem resultado final (mesma regra de Bet.is_pending: NULL ou 'PENDING')
+_BET_IS_PENDING = "(b.result IS NULL OR b.result = 'PENDING')"
+
+# Partida da agenda (alias s) com alguma aposta ainda sem resultado em ticket pendente
+_HAS_PENDING_BET = f"""EXISTS (
+    SELECT 1 FROM bets b
+    JOIN tickets t ON t.id = b.ticket_id
+    WHERE b.match_id = s.match_id AND {_BET_IS_PENDING} AND t.status = 'PENDING'
+)"""
+
+
+# Coluna de ticket_stats com a contagem de cada status
+_STATUS_COLUMNS = {
+    TicketStatus.PENDING: "pending_tickets",
+    TicketStatus.WON: "won_tickets",
+    TicketStatus.LOST: "lost_tickets",
+    TicketStatus.PARTIALLY_WON: "partially_won_tickets",
+}
+
+
+def _settled_profit(status: TicketStatus, stake: float, combined_odds: Optional[float]) -> float:
+    """
+    Lucro realizado de um ticket (mesma regra de DatabaseConnection.rebuild_stats).
+
+    WON = stake × (odd combinada - 1); LOST / PARTIALLY_WON = -stake; PENDING = 0.
+    """
+    if status == TicketStatus.WON:
+        return stake * ((combined_odds or 1.0) - 1)
+    if status in (TicketStatus.LOST, TicketStatus.PARTIALLY_WON):
+        return -stake
+    return 0.0
+
+
+def _apply_stats_delta(cursor: sqlite3.Cursor, **deltas: float) -> None:
+    """Soma os deltas às colunas de ticket_stats (na transação do chamador)."""
+    deltas = {column: value for column, value in deltas.items() if value}
+    if not deltas:
+        return
+
+    assignments = ", ".join(f"{column} = {column} + ?" for column in deltas)
+    cursor.execute(f"UPDATE ticket_stats SET {assignments} WHERE id = 1", tuple(deltas.values()))
+
+
 def _parse_market(value: str) -> MarketType:
     """Parse market string do banco, tratando aliases como BTTS → BOTH_TEAMS_SCORE."""
-    normalized = _MARKET_ALIASES.get(value, value)
-    return MarketType(normalized)
+    market = _MARKETS.get(value)
+    if market is None:
+        market = MarketType(_MARKET_ALIASES.get(value, value))
+    return market
+
+
+def encode_cursor(created_at: str, ticket_id: str) -> str:
+    """Gera o cursor opaco de paginação a partir da chave (created_at, id)."""
+    raw = json.dumps([created_at, ticket_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decodifica o cursor de paginação.
+
+    Raises:
+        ValueError: Se o cursor for inválido
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, ticket_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Cursor de paginação inválido")
+
+    if not isinstance(created_at, str) or not isinstance(ticket_id, str):
+        raise ValueError("Cursor de paginação inválido")
+
+    return created_at, ticket_id
+
+
+def _row_to_bet(row: tuple) -> Bet:
+    """
+    Converte uma linha de _BET_COLUMNS (tupla, na ordem dos campos) em Bet.
+
+    Acesso posicional: evita o lookup por nome do sqlite3.Row.
+    """
+    (match_id, home_team, away_team, league, market, predicted_outcome,
+     odds, confidence, result, final_score, status, status_short,
+     elapsed, goals_home, goals_away) = row
+
+    return Bet(
+        match_id, home_team, away_team, league, _parse_market(market), predicted_outcome,
+        odds, confidence, result, final_score, status, status_short,
+        elapsed, goals_home, goals_away
+    )
+
+
+def _row_to_ticket(row: sqlite3.Row, bets: List[Bet]) -> Ticket:
+    """Converte uma linha de _TICKET_COLUMNS em Ticket."""
+    return Ticket(
+        id=row['id'],
+        name=row['name'],
+        stake=row['stake'],
+        bookmaker_id=row['bookmaker_id'],
+        status=TicketStatus(row['status']),
+        bets=bets,
+        created_at=datetime.fromisoformat(row['created_at'])
+    )
+
+
+def _load_bets(conn: sqlite3.Connection, ticket_ids: Iterable[str]) -> Dict[str, List[Bet]]:
+    """
+    Carrega as bets de vários tickets de uma vez (WHERE ticket_id IN (...)).
+
+    Args:
+        conn: Conexão aberta
+        ticket_ids: IDs dos tickets
+
+    Returns:
+        Dict[ticket_id, bets] (na ordem de inserção)
+
+    ORDER BY ticket_id, id é atendido pelo idx_bets_ticket_id (sem sort temporário).
+    """
+    ids = list(ticket_ids)
+    bets_by_ticket: Dict[str, List[Bet]] = {ticket_id: [] for ticket_id in ids}
+
+    cursor = conn.cursor()
+    cursor.row_factory = None  # tuplas simples para o decoder posicional
+
+    for i in range(0, len(ids), _IN_CHUNK_SIZE):
+        chunk = ids[i:i + _IN_CHUNK_SIZE]
+        cursor.execute(f"""
+            SELECT ticket_id, {_BET_COLUMNS}
+            FROM bets
+            WHERE ticket_id IN ({','.join('?' * len(chunk))})
+            ORDER BY ticket_id, id
+        """, chunk)
+
+        for row in cursor.fetchall():
+            bets_by_ticket[row[0]].append(_row_to_bet(row[1:]))
+
+    return bets_by_ticket
 
 
 class TicketRepository:
@@ -39,43 +191,62 @@ class TicketRepository:
     - Deletar tickets
     """
 
-    def __init__(self):
-        self.db = get_database()
+    def __init__(self, db: DatabaseConnection = None):
+        self.db = db or get_database()
 
-    def create(self, ticket: Ticket) -> str:
+    def create(self, ticket: Ticket, kickoffs: Dict[str, int] = None) -> str:
         """
         Cria um novo ticket no banco.
 
         Args:
             ticket: Ticket a ser salvo
+            kickoffs: Horário de início (Unix) das partidas, para a agenda de liquidação
 
         Returns:
             ID do ticket criado
         """
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
+        self.create_many([ticket], kickoffs)
+        logger.info(f"✅ Ticket {ticket.id} criado com {len(ticket.bets)} apostas")
+        return ticket.id
 
-        try:
-            # Insere ticket
-            cursor.execute("""
-                INSERT INTO tickets (id, name, stake, bookmaker_id, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
+    def create_many(self, tickets: List[Ticket], kickoffs: Dict[str, int] = None) -> List[str]:
+        """
+        Cria vários tickets em uma única transação.
+
+        Tickets e bets são inseridos com executemany e ticket_stats recebe
+        um único delta; se qualquer insert falhar, nada é gravado. As partidas
+        dos tickets pendentes entram em bet_fixture_schedule.
+
+        Args:
+            tickets: Tickets a serem salvos
+            kickoffs: Horário de início (Unix) das partidas; sem horário, a
+                partida é verificada já na próxima liquidação
+
+        Returns:
+            IDs dos tickets criados (na ordem recebida)
+        """
+        if not tickets:
+            return []
+
+        kickoffs = kickoffs or {}
+        ticket_rows = []
+        bet_rows = []
+        scheduled_matches = set()
+        deltas: Dict[str, float] = {"total_tickets": len(tickets), "total_staked": 0.0, "total_bets": 0, "total_profit": 0.0}
+
+        for ticket in tickets:
+            combined_odds = ticket.combined_odds()
+            ticket_rows.append((
                 ticket.id,
                 ticket.name,
                 ticket.stake,
                 ticket.bookmaker_id,
                 ticket.status.value,
-                ticket.created_at
+                ticket.created_at,
+                combined_odds
             ))
-
-            # Insere bets
-            for bet in ticket.bets:
-                cursor.execute("""
-                    INSERT INTO bets (ticket_id, match_id, home_team, away_team, league,
-                                    market, predicted_outcome, odds, confidence, result, final_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            bet_rows.extend(
+                (
                     ticket.id,
                     bet.match_id,
                     bet.home_team,
@@ -87,16 +258,53 @@ class TicketRepository:
                     bet.confidence,
                     bet.result,
                     bet.final_score
-                ))
+                )
+                for bet in ticket.bets
+            )
+
+            if ticket.status == TicketStatus.PENDING:
+                scheduled_matches.update(str(bet.match_id) for bet in ticket.bets)
+
+            status_column = _STATUS_COLUMNS[ticket.status]
+            deltas[status_column] = deltas.get(status_column, 0) + 1
+            deltas["total_staked"] += ticket.stake
+            deltas["total_bets"] += len(ticket.bets)
+            deltas["total_profit"] += _settled_profit(ticket.status, ticket.stake, combined_odds)
+
+        conn = self.db.get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.executemany("""
+                INSERT INTO tickets (id, name, stake, bookmaker_id, status, created_at, combined_odds)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, ticket_rows)
+
+            cursor.executemany("""
+                INSERT INTO bets (ticket_id, match_id, home_team, away_team, league,
+                                market, predicted_outcome, odds, confidence, result, final_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, bet_rows)
+
+            # Agenda de liquidação (mantém o horário já conhecido se não houver um novo)
+            cursor.executemany("""
+                INSERT INTO bet_fixture_schedule (match_id, kickoff)
+                VALUES (?, ?)
+                ON CONFLICT(match_id) DO UPDATE SET kickoff = COALESCE(excluded.kickoff, kickoff)
+            """, [(match_id, kickoffs.get(match_id)) for match_id in scheduled_matches])
+
+            # Estatísticas na mesma transação
+            _apply_stats_delta(cursor, **deltas)
 
             conn.commit()
-            logger.info(f"✅ Ticket {ticket.id} criado com {len(ticket.bets)} apostas")
+            if len(tickets) > 1:
+                logger.info(f"✅ {len(tickets)} tickets criados em lote ({len(bet_rows)} apostas)")
 
-            return ticket.id
+            return [ticket.id for ticket in tickets]
 
         except Exception as e:
             conn.rollback()
-            logger.error(f"❌ Erro ao criar ticket: {e}")
+            logger.error(f"❌ Erro ao criar ticket(s): {e}")
             raise
         finally:
             conn.close()
@@ -112,135 +320,121 @@ class TicketRepository:
             Ticket ou None se não encontrado
         """
         conn = self.db.get_connection()
-        cursor = conn.cursor()
 
         try:
-            # Busca ticket
-            cursor.execute("""
-                SELECT id, name, stake, bookmaker_id, status, created_at
+            row = conn.execute(f"""
+                SELECT {_TICKET_COLUMNS}
                 FROM tickets
                 WHERE id = ?
-            """, (ticket_id,))
+            """, (ticket_id,)).fetchone()
 
-            row = cursor.fetchone()
             if not row:
                 return None
 
-            # Busca bets do ticket
-            cursor.execute("""
-                SELECT match_id, home_team, away_team, league, market, predicted_outcome,
-                       odds, confidence, result, final_score, status, status_short,
-                       elapsed, goals_home, goals_away
-                FROM bets
-                WHERE ticket_id = ?
-            """, (ticket_id,))
-
-            bets = []
-            for bet_row in cursor.fetchall():
-                bets.append(Bet(
-                    match_id=bet_row['match_id'],
-                    home_team=bet_row['home_team'],
-                    away_team=bet_row['away_team'],
-                    league=bet_row['league'],
-                    market=_parse_market(bet_row['market']),
-                    predicted_outcome=bet_row['predicted_outcome'],
-                    odds=bet_row['odds'],
-                    confidence=bet_row['confidence'],
-                    result=bet_row['result'],
-                    final_score=bet_row['final_score'],
-                    status=bet_row['status'],
-                    status_short=bet_row['status_short'],
-                    elapsed=bet_row['elapsed'],
-                    goals_home=bet_row['goals_home'],
-                    goals_away=bet_row['goals_away'],
-                ))
-
-            return Ticket(
-                id=row['id'],
-                name=row['name'],
-                stake=row['stake'],
-                bookmaker_id=row['bookmaker_id'],
-                status=TicketStatus(row['status']),
-                bets=bets,
-                created_at=datetime.fromisoformat(row['created_at'])
-            )
+            bets = _load_bets(conn, [ticket_id])[ticket_id]
+            return _row_to_ticket(row, bets)
 
         finally:
             conn.close()
 
-    def find_all(self, limit: int = 10, offset: int = 0) -> List[Ticket]:
+    def _find_tickets(self, where: str = "", params: tuple = (), suffix: str = "") -> List[Ticket]:
         """
-        Lista todos os tickets (paginado).
+        Busca tickets + bets com 2 queries (tickets e bets em lote).
 
         Args:
-            limit: Número máximo de tickets
-            offset: Offset para paginação
+            where: Cláusula WHERE (sem a palavra-chave)
+            params: Parâmetros da query
+            suffix: LIMIT/OFFSET etc
 
         Returns:
-            Lista de tickets
+            Lista de tickets (ORDER BY created_at DESC, id DESC)
+        """
+        tickets, _ = self._find_tickets_with_keys(where, params, suffix)
+        return tickets
+
+    def _find_tickets_with_keys(
+        self,
+        where: str = "",
+        params: tuple = (),
+        suffix: str = ""
+    ) -> Tuple[List[Ticket], List[Tuple[str, str]]]:
+        """
+        Igual a _find_tickets, retornando também a chave (created_at bruto, id) de cada ticket.
+
+        A chave usa o created_at como gravado no banco, para comparar exatamente no keyset.
         """
         conn = self.db.get_connection()
-        cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT id, name, stake, bookmaker_id, status, created_at
+            rows = conn.execute(f"""
+                SELECT {_TICKET_COLUMNS}
                 FROM tickets
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
-            """, (limit, offset))
-
-            tickets = []
-            for row in cursor.fetchall():
-                ticket_id = row['id']
+                {f"WHERE {where}" if where else ""}
+                ORDER BY created_at DESC, id DESC
+                {suffix}
+            """, params).fetchall()
 
-                # Busca bets
-                cursor.execute("""
-                    SELECT match_id, home_team, away_team, league, market, predicted_outcome,
-                           odds, confidence, result, final_score, status, status_short,
-                           elapsed, goals_home, goals_away
-                    FROM bets
-                    WHERE ticket_id = ?
-                """, (ticket_id,))
-
-                bets = []
-                for bet_row in cursor.fetchall():
-                    bets.append(Bet(
-                        match_id=bet_row['match_id'],
-                        home_team=bet_row['home_team'],
-                        away_team=bet_row['away_team'],
-                        league=bet_row['league'],
-                        market=_parse_market(bet_row['market']),
-                        predicted_outcome=bet_row['predicted_outcome'],
-                        odds=bet_row['odds'],
-                        confidence=bet_row['confidence'],
-                        result=bet_row['result'],
-                        final_score=bet_row['final_score'],
-                        status=bet_row['status'],
-                        status_short=bet_row['status_short'],
-                        elapsed=bet_row['elapsed'],
-                        goals_home=bet_row['goals_home'],
-                        goals_away=bet_row['goals_away'],
-                    ))
-
-                tickets.append(Ticket(
-                    id=row['id'],
-                    name=row['name'],
-                    stake=row['stake'],
-                    bookmaker_id=row['bookmaker_id'],
-                    status=TicketStatus(row['status']),
-                    bets=bets,
-                    created_at=datetime.fromisoformat(row['created_at'])
-                ))
-
-            return tickets
+            bets_by_ticket = _load_bets(conn, (row['id'] for row in rows))
+            tickets = [_row_to_ticket(row, bets_by_ticket[row['id']]) for row in rows]
+            keys = [(row['created_at'], row['id']) for row in rows]
+            return tickets, keys
 
         finally:
             conn.close()
 
+    def find_all(self, limit: int = 10, offset: int = 0) -> List[Ticket]:
+        """
+        Lista todos os tickets (paginado por offset).
+
+        Args:
+            limit: Número máximo de tickets
+            offset: Offset para paginação
+
+        Returns:
+            Lista de tickets
+        """
+        return self._find_tickets(suffix="LIMIT ? OFFSET ?", params=(limit, offset))
+
+    def find_page(self, limit: int = 10, cursor: str = None, offset: int = None) -> Tuple[List[Ticket], Optional[str]]:
+        """
+        Lista tickets com paginação por cursor (keyset).
+
+        Usa WHERE (created_at, id) < (cursor) sobre o índice
+        idx_tickets_created_at_id: custo constante em qualquer página.
+        Sem cursor, começa do início (ou do offset, modo de compatibilidade).
+
+        Args:
+            limit: Número máximo de tickets (>= 1)
+            cursor: Cursor opaco retornado pela página anterior
+            offset: Offset (usado apenas quando não há cursor)
+
+        Returns:
+            Tupla (tickets, next_cursor) — next_cursor é None na última página
+
+        Raises:
+            ValueError: Se o cursor for inválido ou limit < 1
+        """
+        if limit < 1:
+            raise ValueError(f"limit deve ser >= 1 (recebido: {limit})")
+
+        if cursor:
+            created_at, ticket_id = decode_cursor(cursor)
+            tickets, keys = self._find_tickets_with_keys(
+                "(created_at, id) < (?, ?)", (created_at, ticket_id, limit + 1), "LIMIT ?"
+            )
+        else:
+            tickets, keys = self._find_tickets_with_keys(
+                suffix="LIMIT ? OFFSET ?", params=(limit + 1, offset or 0)
+            )
+
+        if len(tickets) <= limit:
+            return tickets, None
+
+        return tickets[:limit], encode_cursor(*keys[limit - 1])
+
     def update_status(self, ticket_id: str, status: TicketStatus) -> bool:
         """
-        Atualiza status de um ticket.
+        Atualiza status de um ticket (e ticket_stats, na mesma transação).
 
         Args:
             ticket_id: ID do ticket
@@ -253,19 +447,42 @@ class TicketRepository:
         cursor = conn.cursor()
 
         try:
+            # Lock de escrita antes de ler o status antigo (delta consistente)
+            cursor.execute("BEGIN IMMEDIATE")
+            row = cursor.execute(
+                "SELECT status, stake, combined_odds FROM tickets WHERE id = ?", (ticket_id,)
+            ).fetchone()
+
+            if row is None:
+                conn.rollback()
+                return False
+
+            old_status = TicketStatus(row['status'])
             cursor.execute("""
                 UPDATE tickets
                 SET status = ?
                 WHERE id = ?
             """, (status.value, ticket_id))
 
-            conn.commit()
+            if old_status != status:
+                deltas = {_STATUS_COLUMNS[old_status]: -1}
+                deltas[_STATUS_COLUMNS[status]] = deltas.get(_STATUS_COLUMNS[status], 0) + 1
+                _apply_stats_delta(
+                    cursor,
+                    total_profit=(
+                        _settled_profit(status, row['stake'], row['combined_odds'])
+                        - _settled_profit(old_status, row['stake'], row['combined_odds'])
+                    ),
+                    **deltas
+                )
 
-            if cursor.rowcount > 0:
-                logger.info(f"✅ Status do ticket {ticket_id} atualizado para {status.value}")
-                return True
+            conn.commit()
+            logger.info(f"✅ Status do ticket {ticket_id} atualizado para {status.value}")
+            return True
 
-            return False
+        except Exception:
+            conn.rollback()
+            raise
 
         finally:
             conn.close()
@@ -309,7 +526,10 @@ class TicketRepository:
 
     def delete(self, ticket_id: str) -> bool:
         """
-        Deleta um ticket (e suas bets em cascata).
+        Deleta um ticket, suas bets e a contribuição em ticket_stats.
+
+        As bets são removidas explicitamente: as foreign keys não estão
+        habilitadas na conexão, então o ON DELETE CASCADE não é aplicado.
 
         Args:
             ticket_id: ID do ticket
@@ -321,14 +541,36 @@ class TicketRepository:
         cursor = conn.cursor()
 
         try:
+            cursor.execute("BEGIN IMMEDIATE")
+            row = cursor.execute(
+                "SELECT status, stake, combined_odds FROM tickets WHERE id = ?", (ticket_id,)
+            ).fetchone()
+
+            if row is None:
+                conn.rollback()
+                return False
+
+            status = TicketStatus(row['status'])
+            cursor.execute("DELETE FROM bets WHERE ticket_id = ?", (ticket_id,))
+            deleted_bets = cursor.rowcount
             cursor.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
-            conn.commit()
 
-            if cursor.rowcount > 0:
-                logger.info(f"🗑️ Ticket {ticket_id} deletado")
-                return True
+            _apply_stats_delta(
+                cursor,
+                total_tickets=-1,
+                total_staked=-row['stake'],
+                total_bets=-deleted_bets,
+                total_profit=-_settled_profit(status, row['stake'], row['combined_odds']),
+                **{_STATUS_COLUMNS[status]: -1}
+            )
 
-            return False
+            conn.commit()
+            logger.info(f"🗑️ Ticket {ticket_id} deletado")
+            return True
+
+        except Exception:
+            conn.rollback()
+            raise
 
         finally:
             conn.close()
@@ -356,100 +598,163 @@ class TicketRepository:
         Returns:
             Lista de tickets pendentes
         """
+        return self._find_tickets("status = ?", (TicketStatus.PENDING.value,))
+
+    def find_pending_by_match_ids(self, match_ids: List[str]) -> List[Ticket]:
+        """
+        Busca os tickets pendentes com aposta em alguma das partidas.
+
+        Args:
+            match_ids: IDs das partidas
+
+        Returns:
+            Lista de tickets pendentes (sem repetição)
+        """
+        ids = sorted({str(match_id) for match_id in match_ids})
+        tickets: Dict[str, Ticket] = {}
+
+        for i in range(0, len(ids), _IN_CHUNK_SIZE):
+            chunk = ids[i:i + _IN_CHUNK_SIZE]
+            found = self._find_tickets(
+                f"status = ? AND id IN (SELECT ticket_id FROM bets WHERE match_id IN ({','.join('?' * len(chunk))}))",
+                (TicketStatus.PENDING.value, *chunk)
+            )
+            tickets.update((ticket.id, ticket) for ticket in found)
+
+        return list(tickets.values())
+
+    # ========================================
+    # Agenda de liquidação (bet_fixture_schedule)
+    # ========================================
+
+    def find_due_match_ids(self, now_ts: int) -> List[str]:
+        """
+        Partidas já iniciadas (ou sem horário) com apostas pendentes.
+
+        Args:
+            now_ts: Unix timestamp atual
+
+        Returns:
+            IDs das partidas a consultar na liquidação
+        """
         conn = self.db.get_connection()
-        cursor = conn.cursor()
 
         try:
-            cursor.execute("""
-                SELECT id, name, stake, bookmaker_id, status, created_at
-                FROM tickets
-                WHERE status = ?
-                ORDER BY created_at DESC
-            """, (TicketStatus.PENDING.value,))
+            rows = conn.execute(f"""
+                SELECT s.match_id
+                FROM bet_fixture_schedule s
+                WHERE (s.kickoff IS NULL OR s.kickoff <= ?) AND {_HAS_PENDING_BET}
+                ORDER BY s.kickoff
+            """, (now_ts,)).fetchall()
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
 
-            tickets = []
-            for row in cursor.fetchall():
-                ticket_id = row['id']
+    def update_fixture_schedule(self, kickoffs: Dict[str, int], finished: Iterable[str], now_ts: int) -> None:
+        """
+        Atualiza a agenda após uma liquidação (1 transação).
 
-                # Busca bets
-                cursor.execute("""
-                    SELECT match_id, home_team, away_team, league, market, predicted_outcome,
-                           odds, confidence, result, final_score, status, status_short,
-                           elapsed, goals_home, goals_away
-                    FROM bets
-                    WHERE ticket_id = ?
-                """, (ticket_id,))
-
-                bets = []
-                for bet_row in cursor.fetchall():
-                    bets.append(Bet(
-                        match_id=bet_row['match_id'],
-                        home_team=bet_row['home_team'],
-                        away_team=bet_row['away_team'],
-                        league=bet_row['league'],
-                        market=_parse_market(bet_row['market']),
-                        predicted_outcome=bet_row['predicted_outcome'],
-                        odds=bet_row['odds'],
-                        confidence=bet_row['confidence'],
-                        result=bet_row['result'],
-                        final_score=bet_row['final_score'],
-                        status=bet_row['status'],
-                        status_short=bet_row['status_short'],
-                        elapsed=bet_row['elapsed'],
-                        goals_home=bet_row['goals_home'],
-                        goals_away=bet_row['goals_away'],
-                    ))
-
-                tickets.append(Ticket(
-                    id=row['id'],
-                    name=row['name'],
-                    stake=row['stake'],
-                    bookmaker_id=row['bookmaker_id'],
-                    status=TicketStatus(row['status']),
-                    bets=bets,
-                    created_at=datetime.fromisoformat(row['created_at'])
-                ))
-
-            return tickets
+        - Partidas adiadas/sem início: grava o novo horário
+        - Partidas encerradas: removidas, se nenhuma aposta delas ficou pendente
+          (falha ao gravar o resultado mantém a partida na agenda para nova tentativa)
+        - Partidas iniciadas sem aposta pendente (tickets deletados/liquidados): removidas
+
+        Args:
+            kickoffs: Novo horário de início (Unix) por partida
+            finished: IDs das partidas encerradas
+            now_ts: Unix timestamp atual
+        """
+        conn = self.db.get_connection()
+
+        try:
+            conn.executemany(
+                "UPDATE bet_fixture_schedule SET kickoff = ? WHERE match_id = ?",
+                [(kickoff, str(match_id)) for match_id, kickoff in kickoffs.items()]
+            )
+            conn.executemany(
+                f"DELETE FROM bet_fixture_schedule AS s WHERE s.match_id = ? AND NOT {_HAS_PENDING_BET}",
+                [(str(match_id),) for match_id in finished]
+            )
+            conn.execute(f"""
+                DELETE FROM bet_fixture_schedule AS s
+                WHERE (s.kickoff IS NULL OR s.kickoff <= ?) AND NOT {_HAS_PENDING_BET}
+            """, (now_ts,))
+            conn.commit()
+
+        except Exception:
+            conn.rollback()
+            raise
 
         finally:
             conn.close()
 
-    def get_stats(self) -> dict:
+    def get_settlement_summary(self, now_ts: int) -> dict:
         """
-        Retorna estatísticas dos tickets.
+        Resume o que falta liquidar (usado para agendar a próxima liquidação).
+
+        Args:
+            now_ts: Unix timestamp atual
 
         Returns:
-            Dicionário com estatísticas
+            pending_tickets: tickets pendentes
+            due_matches: partidas iniciadas (ou sem horário) ainda sem resultado final
+            next_kickoff: Unix timestamp do próximo início agendado ou None
         """
         conn = self.db.get_connection()
-        cursor = conn.cursor()
 
         try:
-            # Total por status
-            cursor.execute("""
-                SELECT status, COUNT(*) as count
-                FROM tickets
-                GROUP BY status
-            """)
+            pending_tickets = conn.execute(
+                "SELECT pending_tickets FROM ticket_stats WHERE id = 1"
+            ).fetchone()
+            due_matches = conn.execute(f"""
+                SELECT COUNT(*) FROM bet_fixture_schedule s
+                WHERE (s.kickoff IS NULL OR s.kickoff <= ?) AND {_HAS_PENDING_BET}
+            """, (now_ts,)).fetchone()[0]
+            next_kickoff = conn.execute(
+                "SELECT MIN(kickoff) FROM bet_fixture_schedule WHERE kickoff > ?", (now_ts,)
+            ).fetchone()[0]
+
+            return {
+                "pending_tickets": pending_tickets[0] if pending_tickets else 0,
+                "due_matches": due_matches,
+                "next_kickoff": next_kickoff
+            }
+
+        finally:
+            conn.close()
 
-            stats_by_status = {row['status']: row['count'] for row in cursor.fetchall()}
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas dos tickets.
 
-            # Total investido
-            cursor.execute("SELECT SUM(stake) FROM tickets")
-            total_invested = cursor.fetchone()[0] or 0.0
+        Lê a linha única de ticket_stats (mantida incrementalmente em
+        create/update_status/delete): custo O(1), sem varrer tickets/bets.
 
-            # Total de apostas
-            cursor.execute("SELECT COUNT(*) FROM bets")
-            total_bets = cursor.fetchone()[0] or 0
+        Returns:
+            Dicionário com estatísticas
+        """
+        conn = self.db.get_connection()
+
+        try:
+            row = conn.execute("SELECT * FROM ticket_stats WHERE id = 1").fetchone()
+            if row is None:
+                self.db.rebuild_stats(conn.cursor())
+                conn.commit()
+                row = conn.execute("SELECT * FROM ticket_stats WHERE id = 1").fetchone()
+
+            by_status = {
+                status.value: row[column]
+                for status, column in _STATUS_COLUMNS.items()
+                if row[column]
+            }
 
             return {
-                "total_tickets": self.count(),
-                "by_status": stats_by_status,
-                "total_invested": total_invested,
-                "total_bets": total_bets
+                "total_tickets": row['total_tickets'],
+                "by_status": by_status,
+                "total_invested": row['total_staked'],
+                "total_bets": row['total_bets'],
+                "total_profit": round(row['total_profit'], 2)
             }
 
         finally:
             conn.close()
-
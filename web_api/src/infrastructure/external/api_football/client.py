@@ -2,15 +2,102 @@
 API-Football HTTP Client
 
 Cliente HTTP para comunicação com a API-Football.
-Suporta paginação automática para endpoints que retornam múltiplas páginas.
+Suporta paginação automática para endpoints que retornam múltiplas páginas
+(páginas 2..N buscadas em paralelo, com retry por página).
+
+Usa um único httpx.AsyncClient compartilhado (pool de conexões keep-alive,
+HTTP/2 opcional), aberto no startup e fechado no shutdown da API.
+Toda chamada passa pelo rate limiter global (rate_limiter.py).
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+import asyncio
 import httpx
 import logging
 
+from config.settings import settings
+from infrastructure.external.api_football.rate_limiter import QuotaExceededError, get_rate_limiter
+
 logger = logging.getLogger(__name__)
 
+# Cliente HTTP compartilhado por toda a aplicação
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Cria o AsyncClient com limites de pool, keep-alive e HTTP/2 configuráveis."""
+    http2 = settings.API_FOOTBALL_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("⚠️ API_FOOTBALL_HTTP2 ativo, mas o pacote 'h2' não está instalado — usando HTTP/1.1")
+            http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.API_FOOTBALL_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.API_FOOTBALL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.API_FOOTBALL_KEEPALIVE_EXPIRY
+    )
+
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        timeout=settings.API_FOOTBALL_TIMEOUT
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Retorna o AsyncClient compartilhado (cria sob demanda se ainda não aberto).
+
+    Returns:
+        httpx.AsyncClient
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+
+    return _http_client
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """
+    Abre o AsyncClient compartilhado.
+
+    Chamado no startup da API.
+    """
+    client = get_http_client()
+    logger.info(
+        f"🌐 Pool HTTP aberto (max={settings.API_FOOTBALL_MAX_CONNECTIONS}, "
+        f"keep-alive={settings.API_FOOTBALL_MAX_KEEPALIVE_CONNECTIONS}, http2={settings.API_FOOTBALL_HTTP2})"
+    )
+    return client
+
+
+async def close_http_client() -> None:
+    """
+    Fecha o AsyncClient compartilhado.
+
+    Chamado no shutdown da API.
+    """
+    global _http_client
+
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("🔌 Pool HTTP fechado")
+
+    _http_client = None
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Lê o header Retry-After (segundos) de uma resposta 429."""
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
 
 class APIFootballClient:
     """
@@ -18,6 +105,7 @@ class APIFootballClient:
 
     Faz chamadas diretas à API-Football via HTTP.
     Suporta paginação automática (endpoint /odds retorna max 10 por página).
+    Todas as instâncias usam o mesmo AsyncClient (pool de conexões).
     """
 
     def __init__(
@@ -32,94 +120,131 @@ class APIFootballClient:
         self.base_url = base_url
         logger.info("🌐 APIFootballClient inicializado")
 
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "x-rapidapi-key": self.api_key,
+            "x-rapidapi-host": "v3.football.api-sports.io"
+        }
+
     async def get(self, endpoint: str, params: dict = None) -> Dict[str, Any]:
         """
         GET request à API-Football (sem paginação — retorna 1ª página).
 
+        Passa pelo rate limiter global (prioridade do contexto atual).
+
         Args:
             endpoint: Endpoint da API (/fixtures, /odds, /leagues, etc)
             params: Query parameters
 
         Returns:
             Response JSON da API
+
+        Raises:
+            QuotaExceededError: Se o orçamento diário estiver esgotado
         """
-        params = params or {}
-        headers = {
-            "x-rapidapi-key": self.api_key,
-            "x-rapidapi-host": "v3.football.api-sports.io"
-        }
+        limiter = get_rate_limiter()
+        await limiter.acquire()
 
-        url = f"{self.base_url}{endpoint}"
+        response = await get_http_client().get(
+            f"{self.base_url}{endpoint}",
+            headers=self._headers(),
+            params=params or {}
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                params=params,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            return response.json()
+        limiter.update_from_headers(response.headers)
+        if response.status_code == 429:
+            limiter.on_throttled(_retry_after(response))
+
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_page(self, endpoint: str, params: dict, page: int) -> Dict[str, Any]:
+        """
+        Busca uma página com retry e backoff exponencial.
+
+        Args:
+            endpoint: Endpoint da API
+            params: Query parameters (sem page)
+            page: Número da página
+
+        Returns:
+            Response JSON da página
+
+        Raises:
+            httpx.HTTPError: Se todas as tentativas falharem
+        """
+        retries = settings.API_FOOTBALL_PAGE_RETRIES
+
+        for attempt in range(retries + 1):
+            try:
+                return await self.get(endpoint, {**params, "page": page})
+            except httpx.HTTPError as e:
+                # Erros do cliente (exceto 429) não melhoram com retry
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code < 500 \
+                        and e.response.status_code != 429:
+                    raise
+                if attempt >= retries:
+                    raise
+                delay = settings.API_FOOTBALL_PAGE_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(f"⚠️ Página {page} falhou ({e}) — nova tentativa em {delay:.1f}s")
+                await asyncio.sleep(delay)
 
     async def get_all_pages(self, endpoint: str, params: dict = None) -> Dict[str, Any]:
         """
         GET request com paginação automática.
 
         A API-Football retorna max ~10 items por página para /odds.
-        Este método itera por todas as páginas e concatena os responses.
+        A página 1 revela paging.total; as demais são buscadas em paralelo
+        (limitado por API_FOOTBALL_PAGE_CONCURRENCY) e concatenadas na ordem das páginas.
+
+        Páginas que falham após os retries (ou por quota esgotada no meio da
+        paginação) não descartam as demais: são listadas em failed_pages
+        (o chamador decide se cacheia o resultado parcial).
 
         Args:
             endpoint: Endpoint da API
             params: Query parameters
 
         Returns:
-            Response JSON com TODOS os items (response[] concatenado)
+            Response JSON com TODOS os items (response[] concatenado) + failed_pages
         """
         params = params or {}
-        headers = {
-            "x-rapidapi-key": self.api_key,
-            "x-rapidapi-host": "v3.football.api-sports.io"
-        }
-
-        url = f"{self.base_url}{endpoint}"
-        all_responses: List[Any] = []
-        current_page = 1
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                page_params = {**params, "page": current_page}
+        first = await self._get_page(endpoint, params, 1)
+        total_pages = max(first.get("paging", {}).get("total", 1) or 1, 1)
 
-                response = await client.get(
-                    url,
-                    headers=headers,
-                    params=page_params,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                data = response.json()
+        pages: Dict[int, List[Any]] = {1: first.get("response", [])}
+        failed_pages: List[int] = []
 
-                # Acumula responses
-                page_items = data.get("response", [])
-                all_responses.extend(page_items)
+        if total_pages > 1:
+            semaphore = asyncio.Semaphore(max(settings.API_FOOTBALL_PAGE_CONCURRENCY, 1))
 
-                # Verifica paginação
-                paging = data.get("paging", {})
-                total_pages = paging.get("total", 1)
-                current = paging.get("current", 1)
+            async def fetch(page: int) -> None:
+                async with semaphore:
+                    try:
+                        data = await self._get_page(endpoint, params, page)
+                    except (httpx.HTTPError, QuotaExceededError) as e:
+                        logger.error(f"❌ Página {page}/{total_pages} falhou definitivamente: {e}")
+                        failed_pages.append(page)
+                        return
+                    pages[page] = data.get("response", [])
+                    logger.debug(f"📄 Página {page}/{total_pages} — {len(pages[page])} items")
 
-                logger.debug(f"📄 Página {current}/{total_pages} — {len(page_items)} items")
+            await asyncio.gather(*(fetch(page) for page in range(2, total_pages + 1)))
 
-                if current >= total_pages:
-                    break
-
-                current_page += 1
+        all_responses: List[Any] = []
+        for page in sorted(pages):
+            all_responses.extend(pages[page])
 
-        logger.info(f"📄 Paginação completa: {current_page} páginas, {len(all_responses)} items total")
+        failed_pages.sort()
+        if failed_pages:
+            logger.warning(f"⚠️ Paginação incompleta: {len(failed_pages)}/{total_pages} páginas falharam {failed_pages}")
+        logger.info(f"📄 Paginação completa: {total_pages} páginas, {len(all_responses)} items total")
 
         # Retorna no mesmo formato da API, mas com TODOS os items
         return {
             "response": all_responses,
-            "paging": {"current": current_page, "total": current_page},
+            "paging": {"current": total_pages, "total": total_pages},
             "results": len(all_responses),
+            "failed_pages": failed_pages,
         }
-
@@ -0,0 +1,423 @@
+"""
+Rate Limiter - Controle de quota das chamadas à API-Football.
+
+Token bucket assíncrono (requests por minuto) + orçamento diário,
+compartilhado por todo o processo (get_rate_limiter()).
+
+- Fila por prioridade: INTERACTIVE > LIVE > BACKGROUND
+- Auto-calibração pelos headers x-ratelimit-* das respostas
+- 429: pausa o bucket pelo Retry-After
+- Requests BACKGROUND não consomem a reserva diária (API_FOOTBALL_DAILY_RESERVE)
+
+A prioridade é definida pelo chamador com request_priority() e vale para
+todas as chamadas feitas dentro do bloco (inclusive tasks criadas nele).
+Chamadas compartilhadas por vários chamadores (single-flight) rodam com
+SharedPriority: a maior prioridade entre os que aguardam, promovida inclusive
+para requests já na fila.
+"""
+
+import asyncio
+import functools
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Prioridade de uma chamada à API-Football (menor = atendida antes)"""
+
+    INTERACTIVE = 0
+    """Ação do usuário aguardando resposta"""
+
+    LIVE = 1
+    """Atualizações ao vivo / resultados"""
+
+    BACKGROUND = 2
+    """Pré-carregamento em background"""
+
+
+class QuotaExceededError(Exception):
+    """Orçamento diário da API-Football esgotado"""
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "api_football_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+class SharedPriority:
+    """
+    Prioridade de uma chamada compartilhada por vários chamadores.
+
+    Começa com a prioridade de quem iniciou a chamada e só sobe (promote)
+    quando entra alguém mais prioritário. Compartilhada aninhada herda a
+    prioridade da externa.
+    """
+
+    def __init__(self, priority: RequestPriority, parent: Optional["SharedPriority"] = None):
+        self._priority = priority
+        self._parent = parent
+
+    @property
+    def priority(self) -> RequestPriority:
+        if self._parent is not None:
+            return min(self._priority, self._parent.priority)
+        return self._priority
+
+    def promote(self, priority: RequestPriority) -> None:
+        """Sobe a prioridade (menor valor) e reordena a fila do rate limiter."""
+        if priority < self._priority:
+            self._priority = priority
+            if _rate_limiter is not None:
+                _rate_limiter.reprioritize()
+
+
+_shared_priority: ContextVar[Optional[SharedPriority]] = ContextVar(
+    "api_football_shared_priority", default=None
+)
+
+
+def new_shared_priority() -> SharedPriority:
+    """Cria a SharedPriority de uma chamada compartilhada a partir do contexto atual."""
+    return SharedPriority(current_priority(), parent=_shared_priority.get())
+
+
+def use_shared_priority(shared: SharedPriority) -> None:
+    """Faz as chamadas do contexto atual (task compartilhada) usarem a SharedPriority."""
+    _shared_priority.set(shared)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Define a prioridade das chamadas à API-Football feitas dentro do bloco.
+
+    Example:
+        with request_priority(RequestPriority.BACKGROUND):
+            await api_service.get_all_fixtures_by_date(day)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def with_request_priority(priority: RequestPriority):
+    """
+    Decorator: executa a coroutine com a prioridade informada.
+
+    Example:
+        @with_request_priority(RequestPriority.BACKGROUND)
+        async def preload_fixtures(self, days: int = 7): ...
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with request_priority(priority):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_priority() -> RequestPriority:
+    """Retorna a prioridade do contexto atual."""
+    shared = _shared_priority.get()
+    if shared is not None:
+        return shared.priority
+    return _current_priority.get()
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _utc_day() -> str:
+    """A quota diária da API-Football zera à meia-noite UTC."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+class APIRateLimiter:
+    """
+    Token bucket com fila de prioridade e orçamento diário.
+
+    Responsável por:
+    - Liberar no máximo requests_per_minute chamadas por minuto (com burst)
+    - Atender a fila por prioridade (FIFO dentro da mesma prioridade)
+    - Contabilizar o uso diário e recusar chamadas sem orçamento
+    - Recalibrar limites a partir dos headers da API
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = None,
+        daily_budget: int = None,
+        burst: int = None,
+        daily_reserve: int = None,
+        enabled: bool = None
+    ):
+        self.requests_per_minute = requests_per_minute or settings.API_FOOTBALL_REQUESTS_PER_MINUTE
+        self.daily_budget = daily_budget or settings.API_FOOTBALL_DAILY_BUDGET
+        self.burst = max(burst or settings.API_FOOTBALL_RATE_BURST, 1)
+        self.daily_reserve = settings.API_FOOTBALL_DAILY_RESERVE if daily_reserve is None else daily_reserve
+        self.enabled = settings.API_FOOTBALL_RATE_LIMIT_ENABLED if enabled is None else enabled
+
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+
+        self._day = _utc_day()
+        self._daily_used = 0
+        self._daily_remaining_header: Optional[int] = None
+
+        self._waiters: List[Tuple[int, int, asyncio.Future, Optional[SharedPriority]]] = []
+        self._seq = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        # Estatísticas
+        self._granted: Dict[str, int] = {p.name.lower(): 0 for p in RequestPriority}
+        self._rejected = 0
+        self._throttled = 0
+        self._calibrated = False
+
+    # ========================================
+    # Aquisição
+    # ========================================
+
+    async def acquire(self, priority: RequestPriority = None) -> None:
+        """
+        Aguarda autorização para 1 chamada à API.
+
+        Args:
+            priority: Prioridade (padrão: a do contexto atual)
+
+        Raises:
+            QuotaExceededError: Se não houver orçamento diário para a prioridade
+        """
+        priority = current_priority() if priority is None else priority
+
+        self._check_daily_budget(priority)
+
+        if not self.enabled:
+            self._grant(priority)
+            return
+
+        self._refill()
+        if not self._waiters and self._tokens >= 1 and time.monotonic() >= self._paused_until:
+            self._tokens -= 1
+            self._grant(priority)
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future, _shared_priority.get()))
+        self._ensure_dispatcher(loop)
+
+        # O orçamento é conferido de novo e contabilizado pelo _dispatch, ao liberar o token
+        await future
+
+    def _check_daily_budget(self, priority: RequestPriority) -> None:
+        error = self._budget_error(priority)
+        if error is not None:
+            raise error
+
+    def _budget_error(self, priority: RequestPriority) -> Optional[QuotaExceededError]:
+        """Erro de quota se a prioridade não tiver orçamento diário (None se tiver)."""
+        remaining = self.daily_remaining
+        reserve = self.daily_reserve if priority == RequestPriority.BACKGROUND else 0
+
+        if remaining > reserve:
+            return None
+
+        self._rejected += 1
+        return QuotaExceededError(
+            f"Orçamento diário da API-Football esgotado "
+            f"(restante={remaining}, reserva={reserve}, prioridade={priority.name})"
+        )
+
+    def _grant(self, priority: RequestPriority) -> None:
+        self._roll_day()
+        self._daily_used += 1
+        if self._daily_remaining_header is not None:
+            self._daily_remaining_header -= 1
+        self._granted[priority.name.lower()] += 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        rate = self.requests_per_minute / 60.0
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def reprioritize(self) -> None:
+        """Reordena a fila após a promoção de uma SharedPriority."""
+        self._waiters = [
+            (int(shared.priority) if shared is not None else priority, seq, future, shared)
+            for priority, seq, future, shared in self._waiters
+        ]
+        heapq.heapify(self._waiters)
+
+    def _ensure_dispatcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """Libera a fila conforme os tokens são repostos (maior prioridade primeiro)."""
+        while self._waiters:
+            # Remove quem desistiu (cancelado/timeout)
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)
+            if not self._waiters:
+                break
+
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            self._refill()
+            if self._tokens >= 1:
+                priority, _, future, _ = heapq.heappop(self._waiters)
+                priority = RequestPriority(priority)
+
+                # A fila pode ter consumido o orçamento desde o enfileiramento
+                error = self._budget_error(priority)
+                if error is not None:
+                    future.set_exception(error)
+                    continue
+
+                self._tokens -= 1
+                self._grant(priority)
+                future.set_result(None)
+                continue
+
+            await asyncio.sleep((1 - self._tokens) * 60.0 / self.requests_per_minute)
+
+    # ========================================
+    # Calibração
+    # ========================================
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Recalibra os limites a partir dos headers da resposta.
+
+        - x-ratelimit-requests-limit / -remaining: quota diária
+        - X-RateLimit-Limit / -Remaining: quota por minuto
+        """
+        daily_limit = _header_int(headers, "x-ratelimit-requests-limit")
+        daily_remaining = _header_int(headers, "x-ratelimit-requests-remaining")
+        minute_limit = _header_int(headers, "x-ratelimit-limit")
+        minute_remaining = _header_int(headers, "x-ratelimit-remaining")
+
+        if daily_limit:
+            self.daily_budget = daily_limit
+        if daily_remaining is not None:
+            self._roll_day()
+            self._daily_remaining_header = daily_remaining
+        if minute_limit and minute_limit != self.requests_per_minute:
+            logger.info(f"⏱️ Rate limit recalibrado: {self.requests_per_minute} → {minute_limit} req/min")
+            self.requests_per_minute = minute_limit
+        if minute_remaining is not None:
+            self._refill()
+            self._tokens = min(self._tokens, float(minute_remaining))
+
+        if any(v is not None for v in (daily_limit, daily_remaining, minute_limit, minute_remaining)):
+            self._calibrated = True
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Registra um 429: zera o bucket e pausa a fila.
+
+        Args:
+            retry_after: Segundos até liberar (header Retry-After); padrão 60s
+        """
+        pause = retry_after if retry_after and retry_after > 0 else 60.0
+        self._throttled += 1
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, time.monotonic() + pause)
+        logger.warning(f"🚦 API-Football retornou 429 — pausando chamadas por {pause:.1f}s")
+
+    def _roll_day(self) -> None:
+        today = _utc_day()
+        if today != self._day:
+            self._day = today
+            self._daily_used = 0
+            self._daily_remaining_header = None
+
+    # ========================================
+    # Consulta
+    # ========================================
+
+    @property
+    def daily_remaining(self) -> int:
+        """Requests restantes hoje (header da API quando disponível)."""
+        self._roll_day()
+        if self._daily_remaining_header is not None:
+            return self._daily_remaining_header
+        return max(self.daily_budget - self._daily_used, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna o estado atual do limitador.
+
+        Returns:
+            Dicionário com limites, orçamento e fila
+        """
+        self._refill()
+        queued = {p.name.lower(): 0 for p in RequestPriority}
+        for priority, _, future, _ in self._waiters:
+            if not future.done():
+                queued[RequestPriority(priority).name.lower()] += 1
+
+        return {
+            "enabled": self.enabled,
+            "requests_per_minute": self.requests_per_minute,
+            "burst": self.burst,
+            "tokens_available": round(self._tokens, 2),
+            "paused_for_seconds": round(max(self._paused_until - time.monotonic(), 0), 1),
+            "daily_budget": self.daily_budget,
+            "daily_used": self._daily_used,
+            "daily_remaining": self.daily_remaining,
+            "daily_reserve": self.daily_reserve,
+            "calibrated_from_headers": self._calibrated,
+            "queued": queued,
+            "granted": dict(self._granted),
+            "rejected": self._rejected,
+            "throttled": self._throttled,
+        }
+
+
+# Instância global (singleton)
+_rate_limiter: Optional[APIRateLimiter] = None
+
+
+def get_rate_limiter() -> APIRateLimiter:
+    """
+    Retorna o rate limiter global da API-Football (singleton).
+
+    Returns:
+        APIRateLimiter instance
+    """
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        _rate_limiter = APIRateLimiter()
+        logger.info(
+            f"🚦 Rate limiter API-Football: {_rate_limiter.requests_per_minute} req/min, "
+            f"{_rate_limiter.daily_budget} req/dia"
+        )
+
+    return _rate_limiter
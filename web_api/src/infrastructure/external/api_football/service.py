@@ -8,14 +8,22 @@ Usa endpoints BULK por data:
 Endpoints individuais mantidos para refresh sob demanda:
 - GET /odds?fixture={id} → odds de um fixture específico
 - GET /fixtures?id={id} → resultado de um fixture específico
+- GET /fixtures?ids={a-b-c} → resultados em lote (até 20 por request)
+
+Chamadas concorrentes idênticas (endpoint+params) são coalescidas em 1 request (single-flight).
+Odds são gravadas em delta (OddsStore): só os fixtures cujas odds mudaram são regravados.
 """
 
 from datetime import date
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import asyncio
 import logging
 
-from infrastructure.cache.cache_manager import get_cache
+from infrastructure.cache.cache_manager import SQLiteCacheManager, get_cache
+from infrastructure.cache.fixture_store import FixtureStore
+from infrastructure.cache.odds_store import OddsStore
 from infrastructure.external.api_football.client import APIFootballClient
+from infrastructure.external.api_football.single_flight import get_single_flight, make_key
 from infrastructure.external.api_football.parsers.fixture_parser import FixtureParser
 from infrastructure.external.api_football.parsers.odds_parser import OddsParser
 from config.settings import settings
@@ -34,14 +42,38 @@ class APIFootballService:
     - Parsear responses
     """
 
-    def __init__(self):
-        self.client = APIFootballClient(
+    def __init__(self, client: APIFootballClient = None, cache: SQLiteCacheManager = None):
+        self.client = client or APIFootballClient(
             api_key=settings.API_FOOTBALL_KEY,
             base_url=settings.API_FOOTBALL_BASE_URL
         )
-        self.cache = get_cache()
+        self.cache = cache or get_cache()
+        self.fixture_store = FixtureStore(self.cache)
+        self.odds_store = OddsStore(self.cache)
+        self.single_flight = get_single_flight()
         logger.info("⚽ APIFootballService inicializado (modo BULK por data)")
 
+    async def _fetch(self, endpoint: str, params: dict, paginated: bool = False) -> Dict[str, Any]:
+        """
+        Chamada à API com coalescência (single-flight).
+
+        Chamadas concorrentes com o mesmo endpoint+params compartilham 1 request.
+
+        Args:
+            endpoint: Endpoint da API
+            params: Query parameters
+            paginated: True para buscar todas as páginas (get_all_pages)
+
+        Returns:
+            Response JSON da API (compartilhado — não alterar)
+        """
+        if paginated:
+            fn = lambda: self.client.get_all_pages(endpoint, params)
+        else:
+            fn = lambda: self.client.get(endpoint, params)
+
+        return await self.single_flight.do(make_key(endpoint, params, paginated), fn)
+
     # ========================================
     # BULK: Fixtures por data
     # ========================================
@@ -51,6 +83,7 @@ class APIFootballService:
         Busca TODOS os fixtures de uma data (qualquer liga) com cache (6h).
 
         Usa GET /fixtures?date={date} — 1 request por dia.
+        Ao gravar, mantém o índice fixture_id → (data, posição).
 
         Args:
             fixture_date: Data dos jogos
@@ -58,27 +91,27 @@ class APIFootballService:
         Returns:
             Lista de fixtures parseados (todas as ligas)
         """
-        cache_key = f"fixtures:{fixture_date.isoformat()}"
+        date_str = fixture_date.isoformat()
 
         # Cache HIT
-        cached = self.cache.get(cache_key)
+        cached = await self.fixture_store.aget_day(date_str)
         if cached:
-            logger.debug(f"✅ Cache HIT: {cache_key} ({len(cached)} fixtures)")
+            logger.debug(f"✅ Cache HIT: fixtures:{date_str} ({len(cached)} fixtures)")
             return cached
 
         # Cache MISS - busca da API
         logger.info(f"🌐 Buscando fixtures de {fixture_date.isoformat()} (BULK)...")
 
-        api_response = await self.client.get("/fixtures", {
+        api_response = await self._fetch("/fixtures", {
             "date": fixture_date.isoformat()
         })
 
         # Parse
         fixtures = FixtureParser.parse(api_response)
 
-        # Cache (6 horas)
+        # Cache (6 horas) + índice por ID
         if fixtures:
-            self.cache.set(cache_key, fixtures, ttl_seconds=settings.CACHE_TTL_FIXTURES)
+            await self.fixture_store.asave_day(date_str, fixtures, ttl_seconds=settings.CACHE_TTL_FIXTURES)
 
         logger.info(f"📥 {len(fixtures)} fixtures obtidos da API (data={fixture_date.isoformat()})")
         return fixtures
@@ -87,15 +120,16 @@ class APIFootballService:
     # BULK: Odds por data
     # ========================================
 
-    async def get_all_odds_by_date(self, odds_date: date) -> Dict[str, Dict[str, Any]]:
+    async def get_all_odds_by_date(self, odds_date: date, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """
         Busca TODAS as odds de uma data (qualquer fixture) com cache (30min).
 
         Usa GET /odds?date={date} — 1 request por dia.
-        Também popula cache individual odds:{fixture_id} para cada fixture.
+        Também popula cache individual odds:{fixture_id} — em delta, só os que mudaram.
 
         Args:
             odds_date: Data das odds
+            refresh: Ignora o cache e baixa de novo (regrava só as odds alteradas)
 
         Returns:
             Dict[fixture_id_str, Dict[bookmaker_name, bookmaker_odds]]
@@ -103,7 +137,7 @@ class APIFootballService:
         cache_key = f"odds_date:{odds_date.isoformat()}"
 
         # Cache HIT
-        cached = self.cache.get(cache_key)
+        cached = None if refresh else await self.cache.aget(cache_key)
         if cached:
             logger.debug(f"✅ Cache HIT: {cache_key} ({len(cached)} fixtures com odds)")
             return cached
@@ -111,41 +145,47 @@ class APIFootballService:
         # Cache MISS - busca da API (COM PAGINAÇÃO — /odds retorna max ~10 por página)
         logger.info(f"🌐 Buscando odds de {odds_date.isoformat()} (BULK com paginação)...")
 
-        api_response = await self.client.get_all_pages("/odds", {
+        api_response = await self._fetch("/odds", {
             "date": odds_date.isoformat()
-        })
+        }, paginated=True)
 
         # Parse bulk
         all_odds = OddsParser.parse_bulk(api_response)
+        partial = bool(api_response.get("failed_pages"))
 
-        # Cache bulk (30 min)
+        # Cache bulk (30 min) + individual — resultado parcial não é cacheado no bulk (próxima chamada refaz)
+        changed = 0
         if all_odds:
-            self.cache.set(cache_key, all_odds, ttl_seconds=settings.CACHE_TTL_ODDS)
-
-            # Popula cache individual para cada fixture (usado por refresh)
-            for fixture_id, odds in all_odds.items():
-                individual_key = f"odds:{fixture_id}"
-                self.cache.set(individual_key, odds, ttl_seconds=settings.CACHE_TTL_ODDS)
+            changed = await self.odds_store.asave_bulk(None if partial else cache_key, all_odds)
 
-        logger.info(f"📊 {len(all_odds)} fixtures com odds obtidos da API (data={odds_date.isoformat()})")
+        logger.info(
+            f"📊 {len(all_odds)} fixtures com odds obtidos da API (data={odds_date.isoformat()}, {changed} alterados)"
+        )
         return all_odds
 
     # ========================================
     # BULK: Odds por liga + data (equilibrado)
     # ========================================
 
-    async def get_odds_by_league_and_date(self, league_id: int, odds_date: date, season: int = None) -> Dict[str, Dict[str, Any]]:
+    async def get_odds_by_league_and_date(
+        self,
+        league_id: int,
+        odds_date: date,
+        season: int = None,
+        refresh: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Busca odds de uma LIGA específica em uma data com cache (30min).
 
         Usa GET /odds?league={id}&season={year}&date={date} — paginado, mas só fixtures da liga.
         Muito mais eficiente que buscar TODAS as odds do dia.
-        Também popula cache individual odds:{fixture_id} para cada fixture.
+        Também popula cache individual odds:{fixture_id} — em delta, só os que mudaram.
 
         Args:
             league_id: ID da liga na API-Football
             odds_date: Data das odds
             season: Ano da season (obrigatório para a API-Football retornar dados)
+            refresh: Ignora o cache e baixa de novo (regrava só as odds alteradas)
 
         Returns:
             Dict[fixture_id_str, Dict[bookmaker_name, bookmaker_odds]]
@@ -153,7 +193,7 @@ class APIFootballService:
         cache_key = f"odds_league:{league_id}:{odds_date.isoformat()}"
 
         # Cache HIT
-        cached = self.cache.get(cache_key)
+        cached = None if refresh else await self.cache.aget(cache_key)
         if cached:
             logger.debug(f"✅ Cache HIT: {cache_key} ({len(cached)} fixtures com odds)")
             return cached
@@ -168,36 +208,36 @@ class APIFootballService:
 
         logger.info(f"🌐 Buscando odds da liga {league_id} season={season} em {odds_date.isoformat()}...")
 
-        api_response = await self.client.get_all_pages("/odds", params)
+        api_response = await self._fetch("/odds", params, paginated=True)
 
         # Parse bulk
         league_odds = OddsParser.parse_bulk(api_response)
+        partial = bool(api_response.get("failed_pages"))
 
-        # Cache por liga+data (30 min)
+        # Cache por liga+data (30 min) + individual — resultado parcial não é cacheado no bulk
+        changed = 0
         if league_odds:
-            self.cache.set(cache_key, league_odds, ttl_seconds=settings.CACHE_TTL_ODDS)
-
-            # Popula cache individual para cada fixture
-            for fixture_id, odds in league_odds.items():
-                individual_key = f"odds:{fixture_id}"
-                self.cache.set(individual_key, odds, ttl_seconds=settings.CACHE_TTL_ODDS)
+            changed = await self.odds_store.asave_bulk(None if partial else cache_key, league_odds)
 
-        logger.info(f"📊 Liga {league_id}: {len(league_odds)} fixtures com odds em {odds_date.isoformat()}")
+        logger.info(
+            f"📊 Liga {league_id}: {len(league_odds)} fixtures com odds em {odds_date.isoformat()} ({changed} alterados)"
+        )
         return league_odds
 
     # ========================================
     # Individual: Odds por fixture (para refresh)
     # ========================================
 
-    async def get_odds(self, fixture_id: int) -> Dict[str, Any]:
+    async def get_odds(self, fixture_id: int, refresh: bool = False) -> Dict[str, Any]:
         """
         Busca odds de um fixture específico com cache (30min).
 
         Primeiro tenta cache individual (populado pelo bulk).
-        Se miss, busca via GET /odds?fixture={id}.
+        Se miss (ou refresh), busca via GET /odds?fixture={id}.
 
         Args:
             fixture_id: ID do fixture
+            refresh: Ignora o cache e baixa de novo
 
         Returns:
             Odds parseadas por bookmaker
@@ -205,7 +245,7 @@ class APIFootballService:
         cache_key = f"odds:{fixture_id}"
 
         # Cache HIT (pode ter sido populado pelo bulk ou por um refresh anterior)
-        cached = self.cache.get(cache_key)
+        cached = None if refresh else await self.cache.aget(cache_key)
         if cached:
             logger.debug(f"✅ Cache HIT: {cache_key}")
             return cached
@@ -213,15 +253,15 @@ class APIFootballService:
         # Cache MISS - busca da API
         logger.debug(f"❌ Cache MISS: {cache_key}")
 
-        api_response = await self.client.get("/odds", {
+        api_response = await self._fetch("/odds", {
             "fixture": fixture_id
         })
 
         # Parse single
         odds = OddsParser.parse(api_response)
 
-        # Cache (30 minutos)
-        self.cache.set(cache_key, odds, ttl_seconds=settings.CACHE_TTL_ODDS)
+        # Cache (30 minutos) — registra a mudança se as odds mudaram
+        await self.odds_store.asave_bulk(None, {str(fixture_id): odds})
 
         logger.info(f"📊 Odds obtidas da API para fixture {fixture_id}")
         return odds
@@ -244,7 +284,7 @@ class APIFootballService:
         """
         logger.info(f"🔍 Buscando resultado da partida {fixture_id}")
 
-        api_response = await self.client.get("/fixtures", {
+        api_response = await self._fetch("/fixtures", {
             "id": fixture_id
         })
 
@@ -260,6 +300,67 @@ class APIFootballService:
         logger.warning(f"⚠️ Partida {fixture_id} não encontrada")
         return None
 
+    async def get_fixture_results(self, fixture_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Busca resultados de várias partidas em lote (sem cache).
+
+        GET /fixtures?ids=a-b-c — até API_FOOTBALL_IDS_BATCH_SIZE IDs por request,
+        lotes buscados em paralelo. IDs repetidos são consultados uma única vez.
+
+        Args:
+            fixture_ids: IDs dos fixtures
+
+        Returns:
+            Dict[fixture_id_str, resultado] (IDs sem resultado ficam de fora)
+        """
+        results, _ = await self.get_fixture_results_with_failures(fixture_ids)
+        return results
+
+    async def get_fixture_results_with_failures(
+        self,
+        fixture_ids: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        get_fixture_results informando também os IDs dos lotes que falharam.
+
+        Permite ao chamador distinguir "partida sem resultado" (ID ausente em
+        results) de "falha na API" (ID em failed_ids).
+
+        Args:
+            fixture_ids: IDs dos fixtures
+
+        Returns:
+            Tupla (Dict[fixture_id_str, resultado], IDs dos lotes com erro)
+        """
+        ids = list(dict.fromkeys(str(fid) for fid in fixture_ids if fid))
+        if not ids:
+            return {}, []
+
+        batch_size = max(settings.API_FOOTBALL_IDS_BATCH_SIZE, 1)
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+
+        logger.info(f"🔍 Buscando resultados de {len(ids)} partidas em {len(batches)} lote(s)")
+
+        responses = await asyncio.gather(
+            *(self._fetch("/fixtures", {"ids": "-".join(batch)}) for batch in batches),
+            return_exceptions=True
+        )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        failed_ids: List[str] = []
+        for batch, api_response in zip(batches, responses):
+            if isinstance(api_response, Exception):
+                logger.error(f"❌ Erro ao buscar lote de resultados {batch[0]}..{batch[-1]}: {api_response}")
+                failed_ids.extend(batch)
+                continue
+            for result in api_response.get("response", []):
+                fixture_id = str(result.get("fixture", {}).get("id", ""))
+                if fixture_id:
+                    results[fixture_id] = result
+
+        logger.info(f"⚽ {len(results)}/{len(ids)} resultados obtidos")
+        return results, failed_ids
+
     # ========================================
     # Leagues coverage (statistics_fixtures)
     # ========================================
@@ -275,7 +376,8 @@ class APIFootballService:
             season: Ano da temporada (default: ano atual)
 
         Returns:
-            Dict[league_id_str, { statistics_fixtures: bool, events: bool, lineups: bool, ... }]
+            Dict[league_id_str, { statistics_fixtures: bool, events: bool, lineups: bool, current: bool, ... }]
+            (current = a season é a atual da liga)
         """
         if not season:
             season = settings.today().year
@@ -283,7 +385,7 @@ class APIFootballService:
         cache_key = f"leagues_coverage:{season}"
 
         # Cache HIT
-        cached = self.cache.get(cache_key)
+        cached = await self.cache.aget(cache_key)
         if cached:
             logger.debug(f"✅ Cache HIT: {cache_key} ({len(cached)} ligas)")
             return cached
@@ -291,7 +393,7 @@ class APIFootballService:
         # Cache MISS
         logger.info(f"🌐 Buscando coverage de ligas (season={season})...")
 
-        api_response = await self.client.get("/leagues", {
+        api_response = await self._fetch("/leagues", {
             "season": season
         })
 
@@ -313,12 +415,13 @@ class APIFootballService:
                         "events": fixtures_coverage.get("events", False),
                         "lineups": fixtures_coverage.get("lineups", False),
                         "type": league.get("type", "league"),
+                        "current": bool(s.get("current", False)),
                     }
                     break
 
         # Cache 7 dias
         if coverage_map:
-            self.cache.set(cache_key, coverage_map, ttl_seconds=604800)
+            await self.cache.aset(cache_key, coverage_map, ttl_seconds=604800)
 
         logger.info(f"📊 Coverage obtido: {len(coverage_map)} ligas (season={season})")
         return coverage_map
@@ -340,7 +443,7 @@ class APIFootballService:
         """
         logger.info("🔴 Buscando fixtures ao vivo...")
 
-        api_response = await self.client.get("/fixtures", {
+        api_response = await self._fetch("/fixtures", {
             "live": "all"
         })
 
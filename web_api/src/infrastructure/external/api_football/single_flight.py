@@ -0,0 +1,126 @@
+"""
+Single Flight - Coalescência de chamadas idênticas à API-Football.
+
+Quando várias coroutines pedem o mesmo endpoint+params ao mesmo tempo
+(ex.: cache miss simultâneo de odds:{fixture_id}), só a primeira chama a API;
+as demais aguardam o mesmo resultado.
+
+O resultado é compartilhado por referência entre os chamadores: não altere
+o response bruto, apenas leia/parseie.
+
+A chamada real roda com a maior prioridade entre os chamadores (SharedPriority):
+um preload BACKGROUND que chegou primeiro não atrasa quem entra depois com
+prioridade LIVE/INTERACTIVE.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from infrastructure.external.api_football.rate_limiter import (
+    SharedPriority,
+    current_priority,
+    new_shared_priority,
+    use_shared_priority,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def make_key(endpoint: str, params: dict = None, paginated: bool = False) -> str:
+    """Chave estável para endpoint + params (ordem dos params não importa)."""
+    encoded = json.dumps(params or {}, sort_keys=True, default=str)
+    return f"{'pages' if paginated else 'get'}:{endpoint}?{encoded}"
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave em 1 chamada real.
+
+    - A chamada real roda em uma task própria: se o primeiro chamador for
+      cancelado, os demais continuam aguardando o resultado
+    - Erros são propagados para todos os chamadores daquela rodada
+    - Prioridade da chamada real = maior prioridade entre os chamadores
+    - A chave é liberada assim que a chamada termina (sem cache de resultado)
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, Tuple[asyncio.Task, SharedPriority]] = {}
+        self._upstream_calls = 0
+        self._coalesced_calls = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa fn() ou aguarda a execução em andamento com a mesma chave.
+
+        Args:
+            key: Chave da chamada (ver make_key)
+            fn: Factory da coroutine que faz a chamada real
+
+        Returns:
+            Resultado de fn()
+        """
+        task, shared = self._in_flight.get(key, (None, None))
+
+        if task is not None and not task.done():
+            self._coalesced_calls += 1
+            shared.promote(current_priority())
+            logger.debug(f"🔗 Single-flight: aguardando chamada em andamento ({key})")
+        else:
+            self._upstream_calls += 1
+            shared = new_shared_priority()
+            task = asyncio.ensure_future(self._run(shared, fn))
+            self._in_flight[key] = (task, shared)
+            task.add_done_callback(lambda t, k=key: self._release(k, t))
+
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _run(shared: SharedPriority, fn: Callable[[], Awaitable[Any]]) -> Any:
+        # Roda no contexto próprio da task: só as chamadas compartilhadas usam a SharedPriority
+        use_shared_priority(shared)
+        return await fn()
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key, (None,))[0] is task:
+            del self._in_flight[key]
+        # Evita "exception was never retrieved" quando todos os chamadores desistiram
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna contadores de coalescência.
+
+        Returns:
+            upstream_calls: chamadas reais feitas
+            coalesced_calls: chamadas economizadas (aguardaram outra em andamento)
+            in_flight: chamadas em andamento agora
+        """
+        total = self._upstream_calls + self._coalesced_calls
+        return {
+            "upstream_calls": self._upstream_calls,
+            "coalesced_calls": self._coalesced_calls,
+            "in_flight": len(self._in_flight),
+            "saved_ratio": self._coalesced_calls / total if total else 0.0,
+        }
+
+
+# Instância global (singleton)
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Retorna o SingleFlight global (compartilhado por todas as instâncias do service).
+
+    Returns:
+        SingleFlight instance
+    """
+    global _single_flight
+
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+
+    return _single_flight
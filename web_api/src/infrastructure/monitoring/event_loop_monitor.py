@@ -0,0 +1,142 @@
+"""
+Event Loop Monitor - Mede o atraso (lag) do event loop do asyncio.
+
+Uma task dorme EVENT_LOOP_MONITOR_INTERVAL_SECONDS e mede quanto acordou
+atrasada: qualquer chamada bloqueante no loop (sqlite3, json grande, CPU)
+aparece como lag. Atrasos acima de EVENT_LOOP_STALL_THRESHOLD_MS são
+contados como travamentos e logados.
+
+Exposto em GET /metrics/event-loop.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Amostras mantidas para os percentis (janela deslizante)
+WINDOW_SIZE = 600
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class EventLoopMonitor:
+    """
+    Sonda de lag do event loop.
+
+    Responsável por:
+    - Amostrar o atraso do loop em intervalo fixo
+    - Calcular percentis na janela recente
+    - Contar travamentos acima do limite
+    """
+
+    def __init__(self, interval_seconds: float = None, stall_threshold_ms: float = None):
+        self.interval_seconds = interval_seconds or settings.EVENT_LOOP_MONITOR_INTERVAL_SECONDS
+        self.stall_threshold_ms = stall_threshold_ms or settings.EVENT_LOOP_STALL_THRESHOLD_MS
+
+        self._samples: Deque[float] = deque(maxlen=WINDOW_SIZE)
+        self._max_lag_ms = 0.0
+        self._stalls = 0
+        self._total_samples = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Inicia a sonda no loop atual (idempotente)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"⏱️ Monitor do event loop iniciado (intervalo {self.interval_seconds * 1000:.0f}ms)")
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.record(max(time.perf_counter() - expected, 0.0) * 1000)
+
+    def record(self, lag_ms: float) -> None:
+        """Registra uma amostra de lag (ms)."""
+        self._samples.append(lag_ms)
+        self._total_samples += 1
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+
+        if lag_ms >= self.stall_threshold_ms:
+            self._stalls += 1
+            logger.warning(f"🐢 Event loop travado por {lag_ms:.0f}ms")
+
+    def reset(self) -> None:
+        """Zera as amostras e contadores."""
+        self._samples.clear()
+        self._max_lag_ms = 0.0
+        self._stalls = 0
+        self._total_samples = 0
+
+    async def stop(self) -> None:
+        """Para a sonda (shutdown)."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna as métricas de lag.
+
+        Returns:
+            Percentis da janela recente (ms), máximo e travamentos desde o início
+        """
+        window = sorted(self._samples)
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "interval_ms": round(self.interval_seconds * 1000, 1),
+            "stall_threshold_ms": self.stall_threshold_ms,
+            "samples": self._total_samples,
+            "window_samples": len(window),
+            "avg_ms": round(sum(window) / len(window), 3) if window else 0.0,
+            "p50_ms": round(_percentile(window, 0.50), 3),
+            "p95_ms": round(_percentile(window, 0.95), 3),
+            "p99_ms": round(_percentile(window, 0.99), 3),
+            "window_max_ms": round(window[-1], 3) if window else 0.0,
+            "max_ms": round(self._max_lag_ms, 3),
+            "stalls": self._stalls,
+        }
+
+
+# Instância global (singleton)
+_event_loop_monitor: Optional[EventLoopMonitor] = None
+
+
+def get_event_loop_monitor() -> EventLoopMonitor:
+    """
+    Retorna o monitor global do event loop (singleton).
+
+    Returns:
+        EventLoopMonitor instance
+    """
+    global _event_loop_monitor
+
+    if _event_loop_monitor is None:
+        _event_loop_monitor = EventLoopMonitor()
+
+    return _event_loop_monitor
+
+
+async def stop_event_loop_monitor() -> None:
+    """
+    Para o monitor global, se existir.
+
+    Chamado no shutdown da API.
+    """
+    if _event_loop_monitor is not None:
+        await _event_loop_monitor.stop()
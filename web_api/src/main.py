@@ -12,6 +12,7 @@ from web.controllers.match_controller import router as match_router
 from web.controllers.prediction_controller import router as prediction_router
 from web.controllers.ticket_controller import router as ticket_router
 from web.controllers.preload_controller import router as preload_router
+from web.controllers.metrics_controller import router as metrics_router
 
 # Configurar logging
 logging.basicConfig(
@@ -47,6 +48,7 @@ app.include_router(match_router, prefix="/api/v1", tags=["Matches"])
 app.include_router(prediction_router, prefix="/api/v1", tags=["Predictions"])
 app.include_router(ticket_router, prefix="/api/v1", tags=["Tickets"])
 app.include_router(preload_router, prefix="/api/v1", tags=["Preload"])
+app.include_router(metrics_router, prefix="/api/v1", tags=["Metrics"])
 
 
 @app.on_event("startup")
@@ -56,7 +58,10 @@ async def startup_event():
 
     1. Cria pasta data/ se não existir
     2. Inicializa banco de dados (cria tabelas se não existirem)
-    3. Pré-carrega fixtures das ligas principais (1x por dia)
+    3. Abre o pool HTTP compartilhado da API-Football
+    4. Inicia o monitor de lag do event loop
+    5. Inicia a liquidação de bilhetes pendentes em background
+    6. Pré-carrega fixtures das ligas principais (1x por dia)
     """
     logger.info("🚀 Betting Advisor API iniciando...")
 
@@ -97,13 +102,105 @@ async def startup_event():
         import traceback
         logger.error(traceback.format_exc())
 
-    # 3. Pré-carregamento DESATIVADO no startup
+    # 3. Abre o pool HTTP compartilhado (API-Football)
+    try:
+        from infrastructure.external.api_football.client import open_http_client
+
+        await open_http_client()
+    except Exception as e:
+        logger.error(f"❌ Erro ao abrir pool HTTP: {e}")
+
+    # 4. Monitor de lag do event loop (GET /metrics/event-loop)
+    try:
+        from infrastructure.monitoring.event_loop_monitor import get_event_loop_monitor
+
+        get_event_loop_monitor().start()
+    except Exception as e:
+        logger.error(f"❌ Erro ao iniciar monitor do event loop: {e}")
+
+    # 5. Liquidação de bilhetes pendentes (intervalo adaptativo)
+    try:
+        from config.settings import settings
+        from application.services.ticket_settlement_scheduler import get_ticket_settlement_scheduler
+
+        if settings.TICKET_SETTLEMENT_ENABLED:
+            get_ticket_settlement_scheduler().start()
+    except Exception as e:
+        logger.error(f"❌ Erro ao iniciar liquidação de bilhetes: {e}")
+
+    # 6. Pré-carregamento DESATIVADO no startup
     # O usuário agora controla quando carregar dados via tela de filtro por período (3, 7 ou 14 dias)
     logger.info("ℹ️ Pré-carregamento automático desativado. Use POST /api/v1/preload/fetch para carregar dados.")
 
     logger.info("✅ Betting Advisor API pronta!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Evento executado ao encerrar o backend.
+
+    1. Para o poller de jogos ao vivo, a liquidação de bilhetes, o prefetch de odds e o monitor do event loop
+    2. Fecha o pool HTTP compartilhado
+    3. Encerra o executor do SQLite (aguarda chamadas em andamento)
+    4. Fecha as conexões persistentes do cache
+    """
+    logger.info("🛑 Betting Advisor API encerrando...")
+
+    # 1. Para poller ao vivo
+    try:
+        from application.services.live_score_poller import stop_live_score_poller
+
+        await stop_live_score_poller()
+    except Exception as e:
+        logger.error(f"❌ Erro ao parar poller ao vivo: {e}")
+
+    try:
+        from application.services.ticket_settlement_scheduler import stop_ticket_settlement_scheduler
+
+        await stop_ticket_settlement_scheduler()
+    except Exception as e:
+        logger.error(f"❌ Erro ao parar liquidação de bilhetes: {e}")
+
+    try:
+        from application.services.odds_prefetch_service import stop_odds_prefetch_service
+
+        await stop_odds_prefetch_service()
+    except Exception as e:
+        logger.error(f"❌ Erro ao parar prefetch de odds: {e}")
+
+    try:
+        from infrastructure.monitoring.event_loop_monitor import stop_event_loop_monitor
+
+        await stop_event_loop_monitor()
+    except Exception as e:
+        logger.error(f"❌ Erro ao parar monitor do event loop: {e}")
+
+    # 2. Fecha pool HTTP
+    try:
+        from infrastructure.external.api_football.client import close_http_client
+
+        await close_http_client()
+    except Exception as e:
+        logger.error(f"❌ Erro ao fechar pool HTTP: {e}")
+
+    # 3. Encerra executor do SQLite
+    try:
+        from infrastructure.database.executor import shutdown_db_executor
+
+        shutdown_db_executor()
+    except Exception as e:
+        logger.error(f"❌ Erro ao encerrar executor do SQLite: {e}")
+
+    # 4. Fecha conexões do cache
+    try:
+        from infrastructure.cache.sqlite_cache_manager import get_cache_manager
+
+        get_cache_manager().close()
+    except Exception as e:
+        logger.error(f"❌ Erro ao fechar cache: {e}")
+
+
 
 @app.get("/health")
 async def health():
@@ -3,15 +3,21 @@ Match Controller - Lista de jogos (lê do CACHE)
 
 Matches agora vêm com odds embutidas do cache bulk.
 Ligas são dinâmicas (extraídas dos fixtures carregados).
+Jogos ao vivo vêm do LiveScorePoller (snapshot em memória + stream SSE).
+Mudanças de odds desde um instante: GET /odds/changes?since=.
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime, timedelta
+import asyncio
+import json
 import logging
 
 from application.services.match_application_service import MatchService
+from application.services.live_score_poller import get_live_score_poller
 from web.dtos.responses.match_response import (
     MatchesListResponse,
     LeaguesListResponse,
@@ -21,6 +27,7 @@ from web.dtos.responses.match_response import (
 )
 from web.mappers.match_mapper import MatchMapper
 from config.settings import settings
+from infrastructure.database.executor import run_in_db_executor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -77,11 +84,13 @@ async def get_matches(
         if league_id:
             try:
                 league_id_int = int(league_id)
-                matches_data = match_service.get_matches_by_league_and_date(league_id_int, fetch_date)
+                matches_data = await run_in_db_executor(
+                    match_service.get_matches_by_league_and_date, league_id_int, fetch_date
+                )
             except ValueError:
-                matches_data = match_service.get_all_matches_by_date(fetch_date)
+                matches_data = await run_in_db_executor(match_service.get_all_matches_by_date, fetch_date)
         else:
-            matches_data = match_service.get_all_matches_by_date(fetch_date)
+            matches_data = await run_in_db_executor(match_service.get_all_matches_by_date, fetch_date)
 
         all_matches.extend(matches_data)
 
@@ -122,17 +131,18 @@ async def get_live_matches():
     """
     Retorna updates de jogos ao vivo (placar, status, minuto).
 
-    Busca GET /fixtures?live=all na API-Football e filtra apenas
-    fixtures que estão carregados no cache (período selecionado).
-
-    Usado pelo frontend para polling a cada 5 segundos.
+    Lê o snapshot em memória do LiveScorePoller (1 poll de
+    GET /fixtures?live=all por intervalo, compartilhado por todos os clientes).
+    Apenas fixtures carregados no cache (período selecionado).
     """
     try:
-        updates = await match_service.get_live_updates()
+        poller = get_live_score_poller()
+        updates = await poller.get_snapshot()
         return {
             "success": True,
             "count": len(updates),
             "updates": updates,
+            "polled_at": poller.polled_at.isoformat() if poller.polled_at else None,
         }
     except Exception as e:
         logger.error(f"❌ Erro ao buscar jogos ao vivo: {e}")
@@ -144,13 +154,56 @@ async def get_live_matches():
         }
 
 
+@router.get("/matches/live/stream")
+async def stream_live_matches(request: Request):
+    """
+    Stream (SSE) de jogos ao vivo.
+
+    Eventos:
+    - snapshot: lista completa ao conectar
+    - update: {"changed": [...], "removed": [ids]} a cada poll com mudanças
+
+    Comentários de keep-alive são enviados a cada LIVE_STREAM_KEEPALIVE_SECONDS.
+    """
+    poller = get_live_score_poller()
+    queue = poller.subscribe()
+
+    async def event_stream():
+        try:
+            snapshot = await poller.get_snapshot()
+            yield _sse_event("snapshot", {"updates": snapshot})
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.LIVE_STREAM_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse_event("update", event)
+        finally:
+            poller.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Formata um evento Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.get("/leagues", response_model=LeaguesListResponse)
 async def get_leagues():
     """
     Lista campeonatos disponíveis.
     Retorna ligas DINÂMICAS extraídas dos fixtures carregados.
     """
-    leagues_data = match_service.get_leagues()
+    leagues_data = await run_in_db_executor(match_service.get_leagues)
 
     leagues_response = [
         LeagueResponse(
@@ -215,6 +268,44 @@ async def get_match_odds(fixture_id: str):
         }
 
 
+@router.get("/odds/changes")
+async def get_odds_changes(
+    since: Optional[str] = Query(None, description="Instante ISO 8601 (ex: 2026-02-27T15:30:00-03:00); vazio = últimas 24h")
+):
+    """
+    Lista as odds que mudaram desde `since`.
+
+    Cada refresh de odds (bulk por data/liga ou individual) grava só os
+    fixtures cujas odds mudaram e registra o instante da mudança.
+    O frontend guarda server_time e usa como `since` na próxima chamada.
+
+    Returns:
+        - changes: [{fixture_id, changed_at, odds}] (apenas bookmakers suportadas)
+        - server_time: instante da consulta (próximo `since`)
+    """
+    server_time = settings.now()
+
+    try:
+        since_dt = datetime.fromisoformat(since) if since else datetime.fromtimestamp(0, tz=settings.tz)
+    except ValueError:
+        return {"success": False, "count": 0, "changes": [], "error": f"since inválido: {since}"}
+    if since_dt.tzinfo is None:
+        since_dt = since_dt.replace(tzinfo=settings.tz)
+
+    try:
+        changes = await match_service.get_odds_changes(since_dt)
+        return {
+            "success": True,
+            "since": since_dt.isoformat(),
+            "server_time": server_time.isoformat(),
+            "count": len(changes),
+            "changes": changes,
+        }
+    except Exception as e:
+        logger.error(f"❌ Erro ao listar mudanças de odds: {e}")
+        return {"success": False, "count": 0, "changes": [], "error": str(e)}
+
+
 @router.post("/matches/{fixture_id}/odds/refresh")
 async def refresh_match_odds(fixture_id: str):
     """
@@ -0,0 +1,86 @@
+"""
+Metrics Controller - Métricas operacionais do backend.
+
+- GET /metrics → visão geral (quota da API-Football + single-flight + poller ao vivo + liquidação de bilhetes + prefetch de odds + cache + event loop)
+- GET /metrics/api-football → orçamento e fila do rate limiter + single-flight
+- GET /metrics/cache → estatísticas do cache (L1/L2)
+- GET /metrics/event-loop → lag do event loop + executor do SQLite
+"""
+
+from fastapi import APIRouter
+import logging
+
+from application.services.live_score_poller import get_live_score_poller
+from application.services.odds_prefetch_service import get_odds_prefetch_service
+from application.services.ticket_settlement_scheduler import get_ticket_settlement_scheduler
+from infrastructure.cache.cache_manager import get_cache
+from infrastructure.database.executor import get_db_executor
+from infrastructure.monitoring.event_loop_monitor import get_event_loop_monitor
+from infrastructure.external.api_football.rate_limiter import get_rate_limiter
+from infrastructure.external.api_football.single_flight import get_single_flight
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    Retorna todas as métricas operacionais.
+    """
+    return {
+        "api_football": get_rate_limiter().get_stats(),
+        "single_flight": get_single_flight().get_stats(),
+        "live_poller": get_live_score_poller().get_stats(),
+        "ticket_settlement": get_ticket_settlement_scheduler().get_stats(),
+        "odds_prefetch": get_odds_prefetch_service().get_stats(),
+        "cache": await get_cache().aget_stats(),
+        "event_loop": get_event_loop_monitor().get_stats(),
+        "db_executor": get_db_executor().get_stats(),
+    }
+
+
+@router.get("/metrics/api-football")
+async def get_api_football_metrics():
+    """
+    Retorna o orçamento atual da API-Football.
+
+    - requests_per_minute / tokens_available: token bucket
+    - daily_budget / daily_used / daily_remaining: quota diária
+    - queued: chamadas aguardando, por prioridade
+    - single_flight: chamadas idênticas coalescidas (upstream economizado)
+    """
+    return {
+        **get_rate_limiter().get_stats(),
+        "single_flight": get_single_flight().get_stats(),
+    }
+
+
+@router.get("/metrics/cache")
+async def get_cache_metrics():
+    """
+    Retorna estatísticas do cache (chaves, hit ratio L1/L2).
+    """
+    return await get_cache().aget_stats()
+
+
+@router.get("/metrics/event-loop")
+async def get_event_loop_metrics(reset: bool = False):
+    """
+    Retorna o lag do event loop e o estado do executor do SQLite.
+
+    - p50/p95/p99_ms: atraso da sonda na janela recente
+    - stalls: amostras acima de EVENT_LOOP_STALL_THRESHOLD_MS
+    - db_executor: fila e tempos das chamadas SQLite fora do loop
+
+    Args:
+        reset: Zera as amostras após a leitura (útil entre rodadas de teste de carga)
+    """
+    monitor = get_event_loop_monitor()
+    stats = {
+        **monitor.get_stats(),
+        "db_executor": get_db_executor().get_stats(),
+    }
+    if reset:
+        monitor.reset()
+    return stats
@@ -15,6 +15,7 @@ from web.dtos.responses.prediction_response import (
     RecommendationEnum,
 )
 from web.mappers.prediction_mapper import create_pre_ticket
+from infrastructure.database.executor import run_in_db_executor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -98,7 +99,7 @@ async def analyze_matches(request: AnalyzeMatchesRequest):
         for p in domain_predictions:
             try:
                 # Primeiro tenta odds do match_data (cache, sem request extra)
-                match_data = prediction_service.match_service.get_match_by_id(p.match_id)
+                match_data = await run_in_db_executor(prediction_service.match_service.get_match_by_id, p.match_id)
                 if match_data and match_data.get("odds"):
                     odds_by_match[p.match_id] = match_data["odds"]
                 else:
@@ -1,18 +1,26 @@
 """
 Preload Controller - Endpoints de pré-carregamento sob demanda.
 
-Três endpoints:
+Endpoints:
 - POST /preload/fetch?days=N → carrega fixtures (rápido, mostra jogos)
+- GET /preload/fetch/stream?days=N → mesmo carregamento, com progresso por dia (SSE)
 - POST /preload/odds?date=YYYY-MM-DD → carrega odds de 1 data (LEGACY)
 - POST /preload/odds/league → carrega odds de uma liga sob demanda (equilibrado)
+
+Ao fim de cada carregamento de fixtures, o OddsPrefetchService aquece em
+background as odds das ligas mais relevantes.
 """
 
 from datetime import timedelta
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List
+from typing import Any, Dict, List, Set, Tuple
+import asyncio
+import json
 import logging
 
+from application.services.odds_prefetch_service import get_odds_prefetch_service
 from application.services.preload_service import PreloadService
 from web.mappers.preload_mapper import map_preload_status
 from config.settings import settings
@@ -23,6 +31,12 @@ logger = logging.getLogger(__name__)
 # Instância do serviço
 preload_service = PreloadService()
 
+# Dias permitidos em /preload/fetch
+ALLOWED_DAYS = [1, 3, 7]
+
+# Carregamentos iniciados pelo stream (continuam se o cliente desconectar)
+_stream_tasks: Set[asyncio.Task] = set()
+
 
 @router.get("/preload/status")
 async def get_preload_status():
@@ -47,38 +61,115 @@ async def fetch_preload(
         - leagues: ligas dinâmicas
         - dates: lista de datas carregadas (para o frontend usar no /preload/odds)
     """
-    allowed_days = [1, 3, 7]
-    if days not in allowed_days:
-        return {"success": False, "message": f"Valor inválido. Use: {allowed_days}"}
+    if days not in ALLOWED_DAYS:
+        return {"success": False, "message": f"Valor inválido. Use: {ALLOWED_DAYS}"}
 
     logger.info(f"📥 FASE 1 — Carregando fixtures: {days} dias")
 
     try:
         result = await preload_service.preload_fixtures(days=days)
-
-        today = settings.today()
-        date_from = today.isoformat()
-        date_to = (today + timedelta(days=days - 1)).isoformat()
-
-        logger.info(f"✅ Fixtures concluído: {date_from} até {date_to}")
-
-        return {
-            "success": True,
-            "message": f"Fixtures carregados para {days} dias",
-            "days": days,
-            "date_from": date_from,
-            "date_to": date_to,
-            "total_fixtures": result["total_fixtures"],
-            "leagues": result["leagues"],
-            "dates": result["dates"],
-            "from_cache": result.get("from_cache", False),
-        }
+        get_odds_prefetch_service().schedule(result["leagues"], result["dates"])
+        return _fetch_response(days, result)
 
     except Exception as e:
         logger.error(f"❌ Erro no carregamento de fixtures: {e}")
         return {"success": False, "message": f"Erro: {str(e)}"}
 
 
+@router.get("/preload/fetch/stream")
+async def stream_preload(
+    request: Request,
+    days: int = Query(7, description="Número de dias a carregar (1, 3 ou 7)")
+):
+    """
+    FASE 1 com progresso (SSE): carrega os fixtures e avisa a cada dia que chega.
+
+    Eventos:
+    - day: {date, count, loaded_days, total_days, total_fixtures, date_from, date_to, leagues?}
+      (o dia já está no cache: GET /matches pode ser chamado imediatamente;
+      leagues vem assim que o coverage chega)
+    - done: mesmo corpo de POST /preload/fetch
+    - error: {success: false, message}
+
+    O carregamento continua em background se o cliente desconectar.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run_preload():
+        if days not in ALLOWED_DAYS:
+            queue.put_nowait(("error", {"success": False, "message": f"Valor inválido. Use: {ALLOWED_DAYS}"}))
+            return
+
+        logger.info(f"📥 FASE 1 (stream) — Carregando fixtures: {days} dias")
+        date_from, date_to = _date_range(days)
+        try:
+            result = await preload_service.preload_fixtures(
+                days=days,
+                on_progress=lambda event: queue.put_nowait(
+                    ("day", {**event, "date_from": date_from, "date_to": date_to})
+                )
+            )
+            get_odds_prefetch_service().schedule(result["leagues"], result["dates"])
+            queue.put_nowait(("done", _fetch_response(days, result)))
+        except Exception as e:
+            logger.error(f"❌ Erro no carregamento de fixtures: {e}")
+            queue.put_nowait(("error", {"success": False, "message": f"Erro: {str(e)}"}))
+
+    task = asyncio.create_task(run_preload())
+    _stream_tasks.add(task)
+    task.add_done_callback(_stream_tasks.discard)
+
+    async def event_stream():
+        while not await request.is_disconnected():
+            try:
+                event, data = await asyncio.wait_for(
+                    queue.get(), timeout=settings.LIVE_STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield _sse_event(event, data)
+            if event != "day":
+                break
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _fetch_response(days: int, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Monta a resposta de /preload/fetch a partir do resultado do PreloadService."""
+    date_from, date_to = _date_range(days)
+
+    logger.info(f"✅ Fixtures concluído: {date_from} até {date_to}")
+
+    return {
+        "success": True,
+        "message": f"Fixtures carregados para {days} dias",
+        "days": days,
+        "date_from": date_from,
+        "date_to": date_to,
+        "total_fixtures": result["total_fixtures"],
+        "leagues": result["leagues"],
+        "dates": result["dates"],
+        "from_cache": result.get("from_cache", False),
+    }
+
+
+def _date_range(days: int) -> Tuple[str, str]:
+    """Retorna (date_from, date_to) do período de 'days' dias a partir de hoje."""
+    today = settings.today()
+    return today.isoformat(), (today + timedelta(days=days - 1)).isoformat()
+
+
+def _sse_event(event: str, data: dict) -> str:
+    """Formata um evento Server-Sent Events."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.post("/preload/odds")
 async def fetch_odds_for_date(
     date: str = Query(..., description="Data no formato YYYY-MM-DD")
@@ -114,6 +205,7 @@ class LeagueOddsRequest(BaseModel):
     """Request body para buscar odds de uma liga"""
     league_id: str
     dates: List[str]  # Lista de datas YYYY-MM-DD
+    refresh: bool = False  # Baixa de novo mesmo com cache (grava só as odds alteradas)
 
 
 @router.post("/preload/odds/league")
@@ -129,6 +221,7 @@ async def fetch_odds_for_league(request: LeagueOddsRequest):
     Body:
         - league_id: ID da liga
         - dates: Lista de datas YYYY-MM-DD que têm jogos dessa liga
+        - refresh: opcional, ignora o cache (GET /odds/changes lista o que mudou)
 
     Returns:
         - total_odds: total de fixtures com odds carregadas
@@ -136,10 +229,13 @@ async def fetch_odds_for_league(request: LeagueOddsRequest):
     """
     logger.info(f"📊 Carregando odds da liga {request.league_id} para {len(request.dates)} datas")
 
+    await get_odds_prefetch_service().record_league_request(request.league_id)
+
     try:
         result = await preload_service.preload_odds_for_league(
             league_id=request.league_id,
-            dates=request.dates
+            dates=request.dates,
+            refresh=request.refresh
         )
 
         return {
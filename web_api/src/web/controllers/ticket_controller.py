@@ -2,12 +2,14 @@
 Ticket Controller - Gerenciamento de bilhetes
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 import logging
 
-from web.dtos.requests.ticket_request import CreateTicketRequest, SimulateTicketRequest
+from web.dtos.requests.ticket_request import CreateTicketRequest, BulkCreateTicketsRequest, SimulateTicketRequest
 from web.dtos.responses.ticket_response import (
     CreateTicketResponse,
+    BulkCreateTicketsResponse,
     TicketsListResponse,
     TicketDetailResponse,
     SimulateTicketResponse,
@@ -18,8 +20,11 @@ from web.dtos.responses.ticket_response import (
 )
 from application.services.ticket_application_service import TicketApplicationService
 from application.services.ticket_updater_service import TicketUpdaterService
+from application.services.ticket_settlement_scheduler import get_ticket_settlement_scheduler
 from domain.enums.ticket_status_enum import TicketStatus
 from web.mappers.ticket_mapper import map_ticket_domain_to_response
+from config.settings import settings
+from infrastructure.database.executor import run_in_db_executor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -59,7 +64,8 @@ async def create_ticket(request: CreateTicketRequest) -> CreateTicketResponse:
         ]
 
         # Cria ticket usando service
-        ticket = ticket_service.create_ticket(
+        ticket = await run_in_db_executor(
+            ticket_service.create_ticket,
             name=request.name,
             bets_data=bets_data,
             stake=request.stake,
@@ -71,6 +77,9 @@ async def create_ticket(request: CreateTicketRequest) -> CreateTicketResponse:
 
         logger.info(f"✅ Ticket criado: {ticket.id}")
 
+        # Agenda a liquidação considerando o novo bilhete
+        get_ticket_settlement_scheduler().wake()
+
         return {
             "success": True,
             "message": "Bilhete criado com sucesso!",
@@ -84,11 +93,66 @@ async def create_ticket(request: CreateTicketRequest) -> CreateTicketResponse:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/tickets/bulk")
+async def create_tickets_bulk(request: BulkCreateTicketsRequest) -> BulkCreateTicketsResponse:
+    """
+    Cria vários bilhetes de uma vez (ex.: pré-bilhetes gerados em lote).
+
+    Valida todos antes de gravar e salva tickets + bets em uma única
+    transação: se algum for inválido, nenhum é criado.
+    """
+    try:
+        if len(request.tickets) > settings.TICKETS_BULK_MAX:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Máximo de {settings.TICKETS_BULK_MAX} bilhetes por chamada"
+            )
+
+        tickets = await run_in_db_executor(ticket_service.create_tickets, [
+            {
+                'name': ticket.name,
+                'bets': [bet.model_dump() for bet in ticket.bets],
+                'stake': ticket.stake,
+                'bookmaker_id': ticket.bookmaker_id
+            }
+            for ticket in request.tickets
+        ])
+
+        logger.info(f"✅ {len(tickets)} tickets criados em lote")
+        get_ticket_settlement_scheduler().wake()
+
+        return {
+            "success": True,
+            "message": f"{len(tickets)} bilhetes criados com sucesso!",
+            "count": len(tickets),
+            "ticket_ids": [ticket.id for ticket in tickets]
+        }
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"❌ Erro ao criar tickets em lote: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/tickets")
-async def list_tickets(limit: int = 10, offset: int = 0) -> TicketsListResponse:
-    """Lista bilhetes (paginado)"""
+async def list_tickets(
+    limit: int = Query(10, ge=1, le=100, description="Bilhetes por página"),
+    offset: int = Query(0, ge=0, description="Offset (apenas sem cursor)"),
+    cursor: Optional[str] = Query(None, description="next_cursor da página anterior")
+) -> TicketsListResponse:
+    """
+    Lista bilhetes (paginado).
+
+    - Por cursor (recomendado): passe o next_cursor da resposta anterior em ?cursor=
+    - Por offset (compatibilidade): ?limit=&offset=
+    """
     try:
-        tickets = ticket_service.list_tickets(limit=limit, offset=offset)
+        tickets, next_cursor = await run_in_db_executor(
+            ticket_service.list_tickets_page, limit=limit, cursor=cursor, offset=offset
+        )
 
         # Converte para response usando mapper
         tickets_response = [map_ticket_domain_to_response(ticket) for ticket in tickets]
@@ -96,9 +160,12 @@ async def list_tickets(limit: int = 10, offset: int = 0) -> TicketsListResponse:
         return {
             "success": True,
             "count": len(tickets_response),
-            "tickets": tickets_response
+            "tickets": tickets_response,
+            "next_cursor": next_cursor
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Erro ao listar tickets: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -108,7 +175,7 @@ async def list_tickets(limit: int = 10, offset: int = 0) -> TicketsListResponse:
 async def get_ticket(ticket_id: str) -> TicketDetailResponse:
     """Busca detalhes de um bilhete"""
     try:
-        ticket = ticket_service.get_ticket(ticket_id)
+        ticket = await run_in_db_executor(ticket_service.get_ticket, ticket_id)
 
         if not ticket:
             raise HTTPException(status_code=404, detail="Bilhete não encontrado")
@@ -132,7 +199,7 @@ async def get_ticket(ticket_id: str) -> TicketDetailResponse:
 async def simulate_ticket(ticket_id: str, request: SimulateTicketRequest) -> SimulateTicketResponse:
     """Simula resultado de um bilhete manualmente (para testes)"""
     try:
-        ticket = ticket_service.simulate_ticket_result(ticket_id, request.results)
+        ticket = await run_in_db_executor(ticket_service.simulate_ticket_result, ticket_id, request.results)
 
         # Mapeia o status para mensagem amigável
         status_messages = {
@@ -167,7 +234,7 @@ async def simulate_ticket_auto(ticket_id: str) -> SimulateTicketResponse:
     se cada aposta ganhou ou perdeu.
     """
     try:
-        ticket = ticket_service.simulate_ticket_with_api(ticket_id)
+        ticket, unavailable_matches = await ticket_service.simulate_ticket_with_api(ticket_id)
 
         # Mapeia o status para mensagem amigável
         status_messages = {
@@ -176,6 +243,8 @@ async def simulate_ticket_auto(ticket_id: str) -> SimulateTicketResponse:
             TicketStatus.PENDING: "PENDENTE ⏳"
         }
         message = f"Resultado simulado via API: {status_messages.get(ticket.status, ticket.status.value)}"
+        if unavailable_matches:
+            message += f" — {len(unavailable_matches)} partida(s) sem resposta da API, resultado anterior mantido"
 
         # Converte para response usando mapper
         ticket_response = map_ticket_domain_to_response(ticket)
@@ -183,7 +252,8 @@ async def simulate_ticket_auto(ticket_id: str) -> SimulateTicketResponse:
         return {
             "success": True,
             "message": message,
-            "ticket": ticket_response
+            "ticket": ticket_response,
+            "unavailable_matches": unavailable_matches
         }
 
     except ValueError as e:
@@ -197,7 +267,7 @@ async def simulate_ticket_auto(ticket_id: str) -> SimulateTicketResponse:
 async def delete_ticket(ticket_id: str) -> DeleteTicketResponse:
     """Deleta um bilhete"""
     try:
-        deleted = ticket_service.delete_ticket(ticket_id)
+        deleted = await run_in_db_executor(ticket_service.delete_ticket, ticket_id)
 
         if not deleted:
             raise HTTPException(status_code=404, detail="Bilhete não encontrado")
@@ -218,7 +288,7 @@ async def delete_ticket(ticket_id: str) -> DeleteTicketResponse:
 async def get_dashboard_stats():
     """Retorna estatísticas do dashboard"""
     try:
-        stats = ticket_service.get_stats()
+        stats = await run_in_db_executor(ticket_service.get_stats)
 
         total_tickets = stats.get("total_tickets", 0)
         won_tickets = stats.get("by_status", {}).get("WON", 0)
@@ -229,9 +299,8 @@ async def get_dashboard_stats():
         # Calcula success_rate (taxa de sucesso)
         success_rate = (won_tickets / total_tickets * 100) if total_tickets > 0 else 0.0
 
-        # Calcula total_profit (lucro total)
-        # TODO: Implementar cálculo real quando tivermos os valores de retorno
-        total_profit = 0.0
+        # Lucro realizado dos tickets encerrados (mantido em ticket_stats)
+        total_profit = stats.get("total_profit", 0.0)
 
         return {
             "success": True,
@@ -258,11 +327,14 @@ async def update_tickets_results():
 
     Consulta a API de futebol para obter resultados das partidas
     e atualiza status dos bilhetes automaticamente.
+
+    A liquidação já roda em background (TicketSettlementScheduler); este
+    endpoint força uma execução imediata e reagenda a próxima.
     """
     try:
         logger.info("🔄 Iniciando atualização de bilhetes pendentes...")
 
-        stats = await updater_service.update_pending_tickets()
+        stats = await get_ticket_settlement_scheduler().run_now()
 
         return {
             "success": True,
@@ -292,7 +364,7 @@ async def update_ticket_result(ticket_id: str):
             raise HTTPException(status_code=404, detail="Bilhete não encontrado ou não está pendente")
 
         # Busca o bilhete atualizado
-        ticket = ticket_service.get_ticket(ticket_id)
+        ticket = await run_in_db_executor(ticket_service.get_ticket, ticket_id)
         ticket_response = map_ticket_domain_to_response(ticket)
 
         return {
@@ -70,6 +70,36 @@ class CreateTicketRequest(BaseModel):
         }
 
 
+class BulkCreateTicketsRequest(BaseModel):
+    """Request para criar vários bilhetes de uma vez (1 transação)"""
+    tickets: List[CreateTicketRequest] = Field(..., min_items=1, description="Bilhetes a criar")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "tickets": [
+                    {
+                        "name": "Pré-bilhete - Segura",
+                        "bets": [
+                            {
+                                "match_id": "match-uuid-1",
+                                "home_team": "Flamengo",
+                                "away_team": "Palmeiras",
+                                "league": "Brasileirão Série A",
+                                "market": "MATCH_WINNER",
+                                "predicted_outcome": "HOME",
+                                "odds": 2.10,
+                                "confidence": 0.72
+                            }
+                        ],
+                        "stake": 10.00,
+                        "bookmaker_id": "bet365"
+                    }
+                ]
+            }
+        }
+
+
 class SimulateTicketRequest(BaseModel):
     """Request para simular resultado de um bilhete"""
     results: List[str] = Field(..., description="Lista de resultados para cada aposta ('WON', 'LOST')")
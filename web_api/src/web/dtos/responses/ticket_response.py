@@ -81,11 +81,21 @@ class CreateTicketResponse(BaseModel):
     ticket: TicketResponse
 
 
+class BulkCreateTicketsResponse(BaseModel):
+    """Response da criação de bilhetes em lote"""
+    success: bool = True
+    message: str = "Bilhetes criados com sucesso"
+    count: int
+    ticket_ids: List[str]
+
+
 class TicketsListResponse(BaseModel):
     """Lista de bilhetes"""
     success: bool = True
     count: int
     tickets: List[TicketResponse]
+    next_cursor: Optional[str] = None
+    """Cursor da próxima página (None = última página)"""
 
 
 class TicketDetailResponse(BaseModel):
@@ -99,6 +109,7 @@ class SimulateTicketResponse(BaseModel):
     success: bool = True
     message: str
     ticket: TicketResponse
+    unavailable_matches: List[str] = []  # simulate-auto: partidas cuja consulta à API falhou
 
     class Config:
         json_schema_extra = {
@@ -422,7 +422,7 @@ export const MatchList: React.FC<MatchListProps> = ({
           <div className="period-info">
             ✅ Dados carregados para <strong>{selectedPeriod === 1 ? 'Hoje' : `${selectedPeriod} dias`}</strong> — {matches.length} jogos em {leagues.length} ligas
             {livePolling && !loadingOdds && (
-              <span className="live-polling-indicator">🔴 Ao vivo — atualizando a cada 5s</span>
+              <span className="live-polling-indicator">🔴 Ao vivo — atualizando em tempo real</span>
             )}
             {loadingOdds && oddsProgress && (
               <div className="odds-loading-bar">
@@ -160,21 +160,7 @@ export const TicketProvider: React.FC<{ children: ReactNode }> = ({ children })
   const loadTickets = useCallback(async () => {
     setLoading(true);
     try {
-      // Mantido para compatibilidade inicial - atualiza E busca
-      console.log('🔄 Atualizando resultados dos bilhetes pendentes...');
-      try {
-        const updateResponse = await ticketsApi.updateResults();
-        if (updateResponse.success && updateResponse.stats.updated > 0) {
-          showNotification(
-            `✅ ${updateResponse.stats.updated} bilhetes atualizados (${updateResponse.stats.won} ganhos, ${updateResponse.stats.lost} perdidos)`,
-            'success'
-          );
-        }
-      } catch (error) {
-        console.warn('⚠️ Erro ao atualizar resultados, continuando...', error);
-      }
-
-      // 2. Busca lista atualizada de tickets
+      // Resultados são liquidados em background pelo backend
       const response = await ticketsApi.getTickets();
       setTickets(response.tickets || []);
     } catch (error) {
@@ -2,7 +2,8 @@
  * useMatches Hook
  *
  * Fluxo:
- * 1. FASE 1 (rápida): POST /preload/fetch → fixtures only → mostra jogos na tela
+ * 1. FASE 1 (rápida): GET /preload/fetch/stream → fixtures only → mostra jogos na tela
+ *    assim que o primeiro dia chega (fallback: POST /preload/fetch)
  * 2. FASE 2 (sob demanda): POST /preload/odds/league → odds por liga, quando selecionada no carrossel
  *    Após concluir, re-busca GET /matches para atualizar odds na UI
  *
@@ -11,10 +12,11 @@
 import { useState, useCallback, useRef, useEffect } from 'react';
 import { matchesApi, preloadApi } from '../services/api';
 import type { Match, League, Bookmaker, Odds } from '../types';
+import type { LiveMatchUpdate, PreloadDayEvent, PreloadFetchResponse } from '../services/api/apiEndpoints';
 
 export type PeriodDays = 1 | 3 | 7;
 
-const LIVE_POLL_INTERVAL = 5000; // 5 segundos
+const LIVE_POLL_INTERVAL = 5000; // 5 segundos (fallback sem SSE)
 
 export function useMatches() {
   const [matches, setMatches] = useState<Match[]>([]);
@@ -35,8 +37,11 @@ export function useMatches() {
   const currentDatesRef = useRef<string[]>([]);
   // Ligas cujas odds já foram carregadas (evita re-buscar)
   const oddsLoadedLeaguesRef = useRef<Set<string>>(new Set());
-  // Live polling interval
+  // Live polling interval (fallback) e stream SSE
   const liveIntervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const liveSourceRef = useRef<EventSource | null>(null);
+  // Stream SSE do carregamento de fixtures em andamento
+  const preloadSourceRef = useRef<EventSource | null>(null);
   const [livePolling, setLivePolling] = useState(false);
 
   const loadMatches = useCallback(async (dateFrom?: string, dateTo?: string): Promise<Match[]> => {
@@ -160,65 +165,98 @@ export function useMatches() {
   }, [loadMatches]);
 
   /**
-   * Busca updates de jogos ao vivo e atualiza o state.
+   * Aplica updates de jogos ao vivo (placar, status, minuto) no state.
+   */
+  const applyLiveUpdates = useCallback((updates: LiveMatchUpdate[]) => {
+    if (!updates || updates.length === 0) return;
+    setMatches(prev => {
+      let changed = false;
+      const updated = prev.map(m => {
+        const update = updates.find(u => u.id === m.id);
+        if (update) {
+          changed = true;
+          return {
+            ...m,
+            status: update.status,
+            status_short: update.status_short,
+            elapsed: update.elapsed,
+            goals: update.goals,
+          };
+        }
+        return m;
+      });
+      return changed ? updated : prev;
+    });
+  }, []);
+
+  /**
+   * Busca updates de jogos ao vivo (fallback quando não há suporte a SSE).
    */
   const pollLiveUpdates = useCallback(async () => {
     try {
       const response = await matchesApi.getLiveUpdates();
-      if (response.success && response.updates.length > 0) {
-        setMatches(prev => {
-          let changed = false;
-          const updated = prev.map(m => {
-            const update = response.updates.find(u => u.id === m.id);
-            if (update) {
-              changed = true;
-              return {
-                ...m,
-                status: update.status,
-                status_short: update.status_short,
-                elapsed: update.elapsed,
-                goals: update.goals,
-              };
-            }
-            return m;
-          });
-          return changed ? updated : prev;
-        });
+      if (response.success) {
+        applyLiveUpdates(response.updates);
       }
     } catch (error) {
       // Silencioso — polling não deve interromper a UX
       console.debug('Live poll error:', error);
     }
-  }, []);
+  }, [applyLiveUpdates]);
 
   /**
-   * Inicia polling de jogos ao vivo a cada 5 segundos.
+   * Inicia o acompanhamento de jogos ao vivo.
+   *
+   * Usa o stream SSE (GET /matches/live/stream): o backend faz 1 poll
+   * compartilhado e envia só os jogos alterados. Sem EventSource, volta
+   * ao polling a cada 5 segundos.
    */
   const startLivePolling = useCallback(() => {
     if (liveIntervalRef.current) {
       clearInterval(liveIntervalRef.current);
+      liveIntervalRef.current = null;
+    }
+    if (liveSourceRef.current) {
+      liveSourceRef.current.close();
+      liveSourceRef.current = null;
     }
 
-    const hasLiveMatches = true; // Sempre inicia, o backend filtra
-
-    if (hasLiveMatches) {
-      console.log('🔴 Iniciando polling de jogos ao vivo (5s)...');
-      setLivePolling(true);
-      pollLiveUpdates();
-      liveIntervalRef.current = setInterval(pollLiveUpdates, LIVE_POLL_INTERVAL);
+    setLivePolling(true);
+
+    if (typeof EventSource !== 'undefined') {
+      console.log('🔴 Conectando ao stream de jogos ao vivo...');
+      const source = new EventSource(matchesApi.liveStreamUrl);
+      source.addEventListener('snapshot', (event) => {
+        applyLiveUpdates(JSON.parse((event as MessageEvent).data).updates);
+      });
+      source.addEventListener('update', (event) => {
+        applyLiveUpdates(JSON.parse((event as MessageEvent).data).changed);
+      });
+      // EventSource reconecta sozinho em caso de erro
+      source.onerror = () => console.debug('Live stream: reconectando...');
+      liveSourceRef.current = source;
+      return;
     }
-  }, [pollLiveUpdates]);
+
+    console.log('🔴 Iniciando polling de jogos ao vivo (5s)...');
+    pollLiveUpdates();
+    liveIntervalRef.current = setInterval(pollLiveUpdates, LIVE_POLL_INTERVAL);
+  }, [applyLiveUpdates, pollLiveUpdates]);
 
   /**
-   * Para o polling de jogos ao vivo.
+   * Para o acompanhamento de jogos ao vivo.
    */
   const stopLivePolling = useCallback(() => {
     if (liveIntervalRef.current) {
       clearInterval(liveIntervalRef.current);
       liveIntervalRef.current = null;
     }
+    if (liveSourceRef.current) {
+      liveSourceRef.current.close();
+      liveSourceRef.current = null;
+    }
     setLivePolling(false);
-    console.log('⏹️ Polling de jogos ao vivo parado');
+    console.log('⏹️ Acompanhamento de jogos ao vivo parado');
   }, []);
 
   // Cleanup ao desmontar o componente
@@ -227,9 +265,62 @@ export function useMatches() {
       if (liveIntervalRef.current) {
         clearInterval(liveIntervalRef.current);
       }
+      if (liveSourceRef.current) {
+        liveSourceRef.current.close();
+      }
+      if (preloadSourceRef.current) {
+        preloadSourceRef.current.close();
+      }
     };
   }, []);
 
+  /**
+   * FASE 1 via stream SSE (GET /preload/fetch/stream).
+   *
+   * O backend busca todos os dias em paralelo e envia um evento `day` a cada
+   * dia gravado no cache: no primeiro dia com jogos (e ligas), a tela já é
+   * renderizada. Resolve com o corpo do evento `done` (igual ao POST
+   * /preload/fetch); rejeita em `error` ou falha de conexão.
+   */
+  const streamPreload = useCallback((days: PeriodDays) => new Promise<PreloadFetchResponse>((resolve, reject) => {
+    const source = new EventSource(preloadApi.fetchStreamUrl(days));
+    preloadSourceRef.current = source;
+    let firstRender: Promise<unknown> | null = null;
+
+    const close = () => {
+      source.close();
+      if (preloadSourceRef.current === source) preloadSourceRef.current = null;
+    };
+
+    source.addEventListener('day', (event) => {
+      const progress: PreloadDayEvent = JSON.parse((event as MessageEvent).data);
+      console.log(`  📅 ${progress.date}: ${progress.count} fixtures (${progress.loaded_days}/${progress.total_days})`);
+
+      if (!firstRender && progress.count > 0 && progress.leagues && progress.leagues.length > 0) {
+        setLeagues(progress.leagues);
+        currentRangeRef.current = { from: progress.date_from, to: progress.date_to };
+        firstRender = loadMatches(progress.date_from, progress.date_to).then(() => {
+          setDataLoaded(true);
+          setPreloading(false);
+        });
+      }
+    });
+
+    source.addEventListener('done', (event) => {
+      close();
+      const result: PreloadFetchResponse = JSON.parse((event as MessageEvent).data);
+      // Aguarda a renderização parcial para ela não sobrescrever a final
+      (firstRender || Promise.resolve()).then(() => resolve(result));
+    });
+
+    // Dispara tanto para o evento `error` do servidor quanto para falha de conexão
+    source.addEventListener('error', (event) => {
+      close();
+      const data = (event as MessageEvent).data;
+      reject(new Error(data ? JSON.parse(data).message : 'Stream de carregamento indisponível'));
+    });
+  }), [loadMatches]);
+
   /**
    * Carrega dados para um período (1, 3 ou 7 dias).
    *
@@ -240,6 +331,10 @@ export function useMatches() {
     // Cancela odds background anterior e live polling
     oddsAbortRef.current = true;
     stopLivePolling();
+    if (preloadSourceRef.current) {
+      preloadSourceRef.current.close();
+      preloadSourceRef.current = null;
+    }
 
     setPreloading(true);
     setSelectedPeriod(days);
@@ -252,7 +347,17 @@ export function useMatches() {
     try {
       // === FASE 1: Fixtures (rápido) ===
       console.log(`📥 FASE 1 — Carregando fixtures de ${days} dias...`);
-      const preloadResult = await preloadApi.fetch(days);
+      let preloadResult: PreloadFetchResponse;
+      if (typeof EventSource !== 'undefined') {
+        try {
+          preloadResult = await streamPreload(days);
+        } catch (error) {
+          console.warn('⚠️ Stream de fixtures falhou, usando POST /preload/fetch:', error);
+          preloadResult = await preloadApi.fetch(days);
+        }
+      } else {
+        preloadResult = await preloadApi.fetch(days);
+      }
 
       if (!preloadResult.success) {
         console.error('❌ Erro no preload:', preloadResult.message);
@@ -291,7 +396,7 @@ export function useMatches() {
       setMatches([]);
       setPreloading(false);
     }
-  }, [loadMatches, loadBookmakers, stopLivePolling]);
+  }, [loadMatches, loadBookmakers, stopLivePolling, streamPreload]);
 
   return {
     matches,
@@ -21,12 +21,10 @@ export const TicketsPage: React.FC = () => {
     clearTicketBets,
     createTicket,
     refreshTickets,
-    updateTicketsResults,
     deleteTicket,
   } = useTicket();
 
   const pollingIntervalRef = useRef<number | null>(null);
-  const updateTicketsResultsRef = useRef(updateTicketsResults);
   const refreshTicketsRef = useRef(refreshTickets);
   const isPollingActiveRef = useRef(false);
   const [nextUpdate, setNextUpdate] = useState<number>(0);
@@ -34,9 +32,8 @@ export const TicketsPage: React.FC = () => {
 
   // Atualiza a ref sempre que a função mudar
   useEffect(() => {
-    updateTicketsResultsRef.current = updateTicketsResults;
     refreshTicketsRef.current = refreshTickets;
-  }, [updateTicketsResults, refreshTickets]);
+  }, [refreshTickets]);
 
   // Carrega bilhetes inicialmente
   useEffect(() => {
@@ -67,9 +64,7 @@ export const TicketsPage: React.FC = () => {
     setTimeout(async () => {
       try {
         console.log('⏰ Primeira verificação após 5s...');
-        await updateTicketsResultsRef.current();
-
-        // Verifica se ainda há pendentes
+        // Resultados são liquidados pelo backend; aqui apenas lê a lista
         await refreshTicketsRef.current();
 
         console.log('✅ Primeira verificação concluída!');
@@ -79,7 +74,6 @@ export const TicketsPage: React.FC = () => {
         pollingIntervalRef.current = setInterval(async () => {
           try {
             console.log('⏰ Polling: verificando resultados...');
-            await updateTicketsResultsRef.current();
             await refreshTicketsRef.current();
 
             console.log('✅ Polling verificação concluída!');
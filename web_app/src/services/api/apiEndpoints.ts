@@ -1,8 +1,8 @@
 /**
  * API Endpoints
  */
-import { apiGet, apiPost, apiDelete } from './apiClient';
-import type { Match, League, Bookmaker, Prediction, Ticket, TicketBet, Strategy } from '../../types';
+import { API_BASE, apiGet, apiPost, apiDelete } from './apiClient';
+import type { Match, League, Bookmaker, Odds, Prediction, Ticket, TicketBet, Strategy } from '../../types';
 
 // ============================================
 // MATCHES
@@ -38,7 +38,7 @@ interface OddsResponse {
   error?: string;
 }
 
-interface LiveMatchUpdate {
+export interface LiveMatchUpdate {
   id: string;
   status: string;
   status_short: string;
@@ -49,6 +49,21 @@ interface LiveMatchUpdate {
   };
 }
 
+export interface OddsChange {
+  fixture_id: string;
+  changed_at: string;     // ISO 8601
+  odds: Odds;
+}
+
+interface OddsChangesResponse {
+  success: boolean;
+  since?: string;
+  server_time?: string;   // Usar como `since` na próxima chamada
+  count: number;
+  changes: OddsChange[];
+  error?: string;
+}
+
 interface LiveUpdatesResponse {
   success: boolean;
   count: number;
@@ -80,9 +95,16 @@ export const matchesApi = {
   refreshMatchOdds: (fixtureId: string) =>
     apiPost<OddsResponse>(`/matches/${fixtureId}/odds/refresh`, {}),
 
+  /** Odds que mudaram desde `since` (ISO 8601); sem `since`, as últimas 24h */
+  getOddsChanges: (since?: string) =>
+    apiGet<OddsChangesResponse>('/odds/changes', since ? { since } : undefined),
+
   /** Busca updates de jogos ao vivo (placar, status, minuto) */
   getLiveUpdates: () =>
     apiGet<LiveUpdatesResponse>('/matches/live'),
+
+  /** URL do stream SSE de jogos ao vivo (eventos snapshot/update) */
+  liveStreamUrl: `${API_BASE}/matches/live/stream`,
 };
 
 // ============================================
@@ -111,7 +133,7 @@ export const predictionsApi = {
 // ============================================
 // PRELOAD
 // ============================================
-interface PreloadFetchResponse {
+export interface PreloadFetchResponse {
   success: boolean;
   message: string;
   days?: number;
@@ -123,6 +145,18 @@ interface PreloadFetchResponse {
   from_cache?: boolean;
 }
 
+/** Evento `day` de GET /preload/fetch/stream (1 dia carregado no cache) */
+export interface PreloadDayEvent {
+  date: string;
+  count: number;
+  loaded_days: number;
+  total_days: number;
+  total_fixtures: number;
+  date_from: string;
+  date_to: string;
+  leagues?: League[];     // Presente assim que o coverage das ligas chega
+}
+
 interface PreloadOddsResponse {
   success: boolean;
   date: string;
@@ -152,6 +186,9 @@ export const preloadApi = {
   fetch: (days: number) =>
     apiPost<PreloadFetchResponse>(`/preload/fetch?days=${days}`, {}),
 
+  /** FASE 1 com progresso (SSE): eventos day (a cada dia carregado), done (= fetch) e error */
+  fetchStreamUrl: (days: number) => `${API_BASE}/preload/fetch/stream?days=${days}`,
+
   /** FASE 2 (LEGACY): Carrega odds de UMA data (lento, paginado) */
   fetchOdds: (date: string) =>
     apiPost<PreloadOddsResponse>(`/preload/odds?date=${date}`, {}),
@@ -171,6 +208,8 @@ interface TicketsResponse {
   success: boolean;
   count: number;
   tickets: Ticket[];
+  /** Cursor da próxima página (null = última página) */
+  next_cursor?: string | null;
 }
 
 interface CreateTicketResponse {
@@ -211,7 +250,9 @@ interface UpdateResultsResponse {
 }
 
 export const ticketsApi = {
-  getTickets: () => apiGet<TicketsResponse>('/tickets'),
+  /** Lista bilhetes; passe o next_cursor da resposta anterior para a próxima página */
+  getTickets: (cursor?: string) =>
+    apiGet<TicketsResponse>('/tickets', cursor ? { cursor } : undefined),
 
   getDashboardStats: () => apiGet<DashboardStatsResponse>('/tickets/stats/dashboard'),
 
@@ -30,6 +30,8 @@ export interface League {
   type: 'league' | 'cup';
   /** Liga possui estatísticas de fixtures ao vivo (coverage da API-Football) */
   has_statistics_fixtures?: boolean;
+  /** Fixtures da liga no período carregado */
+  fixture_count?: number;
 }
 
 export interface Bookmaker {